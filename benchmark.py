@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+Offline benchmarks for crawler components
+Usage: python benchmark.py [name ...]   (runs every benchmark when no name is given)
+"""
+
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from fixtures import RECORDED_IDS, make_google_feed, make_naver_page
+
+BENCHMARKS = {}
+
+def benchmark(name):
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+def measure(func, repeat: int = 1) -> float:
+    """Return the best wall time of ``repeat`` runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def load_feeds():
+    """Load recorded feeds from BENCH_FEEDS_DIR (*.xml), or build stand-ins"""
+    import os
+    feeds_dir = os.getenv('BENCH_FEEDS_DIR')
+    if feeds_dir:
+        return [path.read_bytes() for path in sorted(Path(feeds_dir).glob('*.xml'))]
+    return [make_google_feed(100) for _ in range(20)]
+
+def load_naver_pages():
+    """Load saved SERPs from BENCH_NAVER_DIR (*.html), or build stand-ins"""
+    import os
+    pages_dir = os.getenv('BENCH_NAVER_DIR')
+    if pages_dir:
+        return [path.read_text(encoding='utf-8') for path in sorted(Path(pages_dir).glob('*.html'))]
+    return [make_naver_page(page) for page in range(1, 21)]
+
+@benchmark('decoder')
+def bench_decoder():
+    from src.utils import GoogleNewsDecoder
+    
+    urls = [f"https://news.google.com/rss/articles/{article_id}?oc=5" for article_id in RECORDED_IDS]
+    urls = urls * 25000
+    
+    elapsed = measure(lambda: [GoogleNewsDecoder.decode(url) for url in urls], repeat=3)
+    print(f"Offline decode: {len(urls) / elapsed:,.0f} resolutions/sec ({len(urls)} links)")
+
+@benchmark('rss')
+def bench_rss():
+    from src.crawlers import GoogleNewsCrawler
+    
+    crawler = GoogleNewsCrawler()
+    feeds = load_feeds()
+    items = sum(feed.count(b'<item>') for feed in feeds)
+    
+    soup_time = measure(lambda: [crawler.parse_rss_feed_soup(feed) for feed in feeds], repeat=3)
+    stream_time = measure(lambda: [crawler.parse_rss_feed(feed) for feed in feeds], repeat=3)
+    early_time = measure(lambda: [crawler.parse_rss_feed(feed, max_results=10) for feed in feeds], repeat=3)
+    
+    print(f"{len(feeds)} feeds, {items} items")
+    print(f"BeautifulSoup:           {soup_time * 1000:8.1f} ms ({len(feeds) / soup_time:,.0f} feeds/sec)")
+    print(f"Streaming iterparse:     {stream_time * 1000:8.1f} ms ({len(feeds) / stream_time:,.0f} feeds/sec, "
+          f"{soup_time / stream_time:.1f}x)")
+    print(f"Streaming, max_results=10: {early_time * 1000:6.1f} ms ({soup_time / early_time:.1f}x)")
+
+@benchmark('naver')
+def bench_naver():
+    from src.crawlers import NaverNewsCrawler
+    
+    pages = load_naver_pages()
+    default = NaverNewsCrawler(fast_parse=False)
+    fast = NaverNewsCrawler(fast_parse=True)
+    
+    default_time = measure(lambda: [default.parse_search_results(page) for page in pages], repeat=3)
+    fast_time = measure(lambda: [fast.parse_search_results(page) for page in pages], repeat=3)
+    
+    print(f"{len(pages)} pages")
+    print(f"html.parser, full page: {len(pages) / default_time:8.1f} pages/sec")
+    print(f"Fast (scoped lxml):     {len(pages) / fast_time:8.1f} pages/sec ({default_time / fast_time:.1f}x)")
+
+@benchmark('pipeline')
+def bench_pipeline():
+    """Parse throughput inline vs. in the worker process pool"""
+    import os
+    from src.parsers import NaverSerpParser, ParsePipeline
+    
+    pages = load_naver_pages() * 5
+    parser = NaverSerpParser()
+    inline_time = measure(lambda: [parser.parse(page) for page in pages], repeat=3)
+    
+    workers = int(os.getenv('PARSE_WORKERS', str(os.cpu_count() or 1)))
+    with ParsePipeline(workers=workers) as pipeline:
+        pipeline.map('naver_serp', pages[:workers])  # start the workers
+        pool_time = measure(lambda: pipeline.map('naver_serp', pages), repeat=3)
+    
+    print(f"{len(pages)} pages, {workers} workers")
+    print(f"Inline:        {len(pages) / inline_time:8.1f} pages/sec")
+    print(f"Process pool:  {len(pages) / pool_time:8.1f} pages/sec ({inline_time / pool_time:.1f}x)")
+
+@benchmark('memory')
+def bench_memory():
+    """Memory and build time of 100k records as dicts, Articles and an ArticleBatch"""
+    import gc
+    import tracemalloc
+    from datetime import datetime, timedelta
+    from src.models import Article, ArticleBatch
+    
+    count = 100_000
+    publishers = ['연합뉴스', '조선일보', '한겨레', 'KBS', 'MBC', '전자신문', 'ZDNet Korea', '매일경제']
+    start_date = datetime(2025, 5, 30)
+    
+    def fields(i):
+        # Parsed strings are distinct objects even when their text repeats
+        return (
+            f"양자컴퓨터 상용화 경쟁 본격화 {i}",
+            f"https://www.yna.co.kr/view/AKR2025053000{i:06d}",
+            ''.join(publishers[i % len(publishers)]),
+            start_date - timedelta(hours=i % 720),
+            f"국내 연구진이 양자컴퓨터 핵심 부품 국산화에 성공했다고 밝혔다 {i}",
+        )
+    
+    def as_dicts():
+        return [
+            {'title': title, 'link': link, 'source': source,
+             'date': published.strftime('%Y.%m.%d.'), 'content': content}
+            for title, link, source, published, content in map(fields, range(count))
+        ]
+    
+    def as_articles():
+        return [Article(*fields(i), query=''.join('양자컴퓨터')) for i in range(count)]
+    
+    def as_batch():
+        return ArticleBatch(Article(*fields(i), query=''.join('양자컴퓨터')) for i in range(count))
+    
+    print(f"{count} records")
+    for name, build in (('dict', as_dicts), ('Article', as_articles), ('ArticleBatch', as_batch)):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        records = build()
+        elapsed = time.perf_counter() - start
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del records
+        print(f"{name:13s} {size / 1024 / 1024:7.1f} MiB  {elapsed * 1000:7.1f} ms")
+
+class LegacyDateUtils:
+    """DateUtils before precompiled matching, kept as the benchmark baseline"""
+    
+    @staticmethod
+    def parse_relative_date(date_str: str) -> str:
+        """Parse relative date strings and convert to standard format"""
+        if not date_str:
+            return datetime.now().strftime('%Y.%m.%d.')
+            
+        now = datetime.now()
+        date_str = date_str.strip()
+        
+        try:
+            # Absolute date patterns
+            if match := re.search(r'\d{4}\.\d{1,2}\.\d{1,2}\.?', date_str):
+                return match.group(0).rstrip('.') + '.'
+            if match := re.search(r'\d{1,2}\.\d{1,2}\.\d{1,2}\.?', date_str):
+                return match.group(0).rstrip('.') + '.'
+            
+            # Korean relative dates
+            if '일 전' in date_str or '일전' in date_str:
+                days = int(re.search(r'(\d+)일\s*전', date_str).group(1))
+                return (now - timedelta(days=days)).strftime('%Y.%m.%d.')
+            
+            if '시간 전' in date_str or '시간전' in date_str:
+                hours = int(re.search(r'(\d+)시간\s*전', date_str).group(1))
+                return (now - timedelta(hours=hours)).strftime('%Y.%m.%d.')
+            
+            if '분 전' in date_str or '분전' in date_str:
+                minutes = int(re.search(r'(\d+)분\s*전', date_str).group(1))
+                return (now - timedelta(minutes=minutes)).strftime('%Y.%m.%d.')
+            
+            # English relative dates
+            if match := re.search(r'(\d+)\s*hours?\s*ago', date_str, re.IGNORECASE):
+                hours = int(match.group(1))
+                return (now - timedelta(hours=hours)).strftime('%Y.%m.%d.')
+            
+            if match := re.search(r'(\d+)\s*days?\s*ago', date_str, re.IGNORECASE):
+                days = int(match.group(1))
+                return (now - timedelta(days=days)).strftime('%Y.%m.%d.')
+            
+            if match := re.search(r'(\d+)\s*minutes?\s*ago', date_str, re.IGNORECASE):
+                minutes = int(match.group(1))
+                return (now - timedelta(minutes=minutes)).strftime('%Y.%m.%d.')
+                
+        except (ValueError, AttributeError):
+            pass
+        
+        return now.strftime('%Y.%m.%d.')
+    
+    @staticmethod
+    def parse_rss_date(date_str: str) -> str:
+        """Parse RSS date formats to standard format"""
+        if not date_str:
+            return datetime.now().strftime('%Y.%m.%d.')
+        
+        formats = [
+            '%a, %d %b %Y %H:%M:%S %Z',
+            '%a, %d %b %Y %H:%M:%S',
+            '%d %b %Y %H:%M:%S',
+            '%Y-%m-%dT%H:%M:%SZ',
+            '%Y-%m-%d %H:%M:%S',
+            '%Y-%m-%dT%H:%M:%S.%fZ'
+        ]
+        
+        for fmt in formats:
+            try:
+                dt = datetime.strptime(date_str.strip(), fmt)
+                return dt.strftime('%Y.%m.%d.')
+            except ValueError:
+                continue
+        
+        return LegacyDateUtils.parse_relative_date(date_str)
+
+@benchmark('dates')
+def bench_dates():
+    """Date parsing per item (previous DateUtils) vs. batch parse_many"""
+    from src.utils import DateUtils
+    
+    naver_dates = [f"{i % 23 + 1}시간 전" for i in range(15)] + ['3일 전', '2025.05.30.', '5분 전']
+    naver_dates = naver_dates * 500
+    rss_dates = [  # feed timestamps are mostly unique
+        f"Fri, {i % 28 + 1:02d} May 2025 {i // 28 % 24:02d}:{i % 60:02d}:{i // 60 % 60:02d} GMT"
+        for i in range(9000)
+    ]
+    
+    for name, dates, legacy, rss in (
+            ('Naver relative', naver_dates, LegacyDateUtils.parse_relative_date, False),
+            ('RSS RFC 822', rss_dates, LegacyDateUtils.parse_rss_date, True)):
+        legacy_time = measure(lambda: [legacy(d) for d in dates], repeat=3)
+        single_time = measure(
+            lambda: [(DateUtils.parse_rss_date if rss else DateUtils.parse_relative_date)(d) for d in dates],
+            repeat=3
+        )
+        batch_time = measure(lambda: DateUtils.parse_many(dates, rss=rss), repeat=3)
+        print(f"{name}: {len(dates)} strings")
+        print(f"  previous, per item: {len(dates) / legacy_time:10.0f} /sec")
+        print(f"  per item:           {len(dates) / single_time:10.0f} /sec ({legacy_time / single_time:.1f}x)")
+        print(f"  parse_many:         {len(dates) / batch_time:10.0f} /sec ({legacy_time / batch_time:.1f}x)")
+
+@benchmark('text')
+def bench_text():
+    """Per-item TextUtils cleaning vs. the batch column API on Naver result fields"""
+    from bs4 import BeautifulSoup
+    from src.utils import TextUtils
+    
+    columns = {'title': [], 'source': [], 'date': [], 'content': []}
+    for page in load_naver_pages():
+        soup = BeautifulSoup(page, 'lxml')
+        for item in soup.select('div.news_area'):
+            columns['title'].append(item.select_one('a.news_tit').get_text())
+            columns['source'].append(item.select_one('.press').get_text())
+            columns['date'].append(item.select_one('.info_group .info').get_text())
+            columns['content'].append(item.select_one('.news_dsc').get_text())
+    columns = {field: texts * 25 for field, texts in columns.items()}
+    count = sum(len(texts) for texts in columns.values())
+    
+    def per_item():
+        return {
+            'title': [TextUtils.clean_html(text) for text in columns['title']],
+            'source': [TextUtils.normalize_source_name(TextUtils.clean_html(text)) for text in columns['source']],
+            'date': [TextUtils.clean_html(text) for text in columns['date']],
+            'content': [TextUtils.truncate_text(TextUtils.clean_html(text), 200) for text in columns['content']],
+        }
+    
+    def batch():
+        return {
+            'title': TextUtils.clean_many(columns['title']),
+            'source': TextUtils.normalize_sources(TextUtils.clean_many(columns['source'])),
+            'date': TextUtils.clean_many(columns['date']),
+            'content': TextUtils.truncate_many(TextUtils.clean_many(columns['content']), 200),
+        }
+    
+    assert batch() == per_item(), "batch cleaning output differs"
+    
+    item_time = measure(per_item, repeat=3)
+    batch_time = measure(batch, repeat=3)
+    print(f"{count} fields")
+    print(f"Per item: {count / item_time:10.0f} fields/sec")
+    print(f"Batch:    {count / batch_time:10.0f} fields/sec ({item_time / batch_time:.1f}x)")
+
+@benchmark('publishers')
+def bench_publishers():
+    """Map article links to publishers: per-link regex parsing vs the cached registry"""
+    from src.utils import PublisherRegistry
+    
+    hosts = ['www.yna.co.kr', 'biz.chosun.com', 'news.kbs.co.kr', 'www.hankyung.com', 'n.news.naver.com',
+             'www.reuters.com', 'www.bbc.co.uk', 'edition.cnn.com', 'www.mk.co.kr', 'zdnet.co.kr']
+    hosts += [f'news{i}.example{i % 50}.co.kr' for i in range(190)]
+    links = [f'https://{hosts[i % len(hosts)]}/article/{i}' for i in range(1000000)]
+    
+    def legacy_source(url):
+        domain = re.match(r'^([^/]+)', re.sub(r'^https?://', '', url)).group(1)
+        parts = re.sub(r'^www\.', '', domain).split('.')
+        return parts[-2] if len(parts) >= 2 else ""
+    
+    registry = PublisherRegistry()
+    legacy_time = measure(lambda: [legacy_source(link) for link in links])
+    registry_time = measure(lambda: registry.publishers_for_urls(links), repeat=3)
+    print(f"{len(links)} links, {len(hosts)} hosts")
+    print(f"Legacy:   {len(links) / legacy_time:10.0f} links/sec")
+    print(f"Registry: {len(links) / registry_time:10.0f} links/sec ({legacy_time / registry_time:.1f}x)")
+
+@benchmark('seen')
+def bench_seen():
+    """Memory per million seen URLs and lookup throughput: set of URLs vs Bloom filter vs SQLite index"""
+    import tempfile
+    import tracemalloc
+    from src.network import SeenFilter, SeenIndex
+    from src.utils import UrlUtils
+    
+    count = 1000000
+    urls = [f'https://www.yna.co.kr/view/AKR2025{i:08d}' for i in range(count)]
+    keys = UrlUtils.url_keys(urls)
+    probes = UrlUtils.url_keys(f'https://www.yna.co.kr/view/AKR2024{i:08d}' for i in range(100000))
+    
+    tracemalloc.start()
+    url_set = set(UrlUtils.canonicalize(url) for url in urls)
+    set_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    seen_filter = SeenFilter(capacity=count, error_rate=0.001)
+    seen_filter.add_many(keys)
+    filter_bytes = seen_filter.stats()['bytes']
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        index = SeenIndex(Path(cache_dir) / 'seen.sqlite3')
+        index.add_keys(keys)
+        index_bytes = sum(f.stat().st_size for f in Path(cache_dir).iterdir())
+        
+        index_time = measure(lambda: index.contains_keys(probes))
+        filter_time = measure(lambda: seen_filter.might_contain_many(probes))
+        false_positives = sum(seen_filter.might_contain_many(probes))
+        index.close()
+    
+    set_time = measure(lambda: [url in url_set for url in urls[:len(probes)]])
+    
+    print(f"Memory per million URLs: set {set_bytes / count:.0f} MB, "
+          f"filter {filter_bytes / count:.2f} MB, index on disk {index_bytes / count:.0f} MB")
+    print(f"Lookups (misses): filter {len(probes) / filter_time:10.0f}/sec, "
+          f"index {len(probes) / index_time:10.0f}/sec, set {len(probes) / set_time:10.0f}/sec")
+    print(f"False positives: {false_positives}/{len(probes)} ({false_positives / len(probes):.3%})")
+
+@benchmark('stories')
+def bench_stories():
+    """Cluster near-duplicate stories incrementally: comparisons and time per article"""
+    import random
+    from src.utils import NearDuplicateIndex
+    
+    rng = random.Random(7)
+    words = ['양자컴퓨터', '삼성전자', '정부', '연구', '상용화', '발표', '투자', '반도체', '기술', '시장',
+             '글로벌', '경쟁', '개발', '협력', '전망', '확대', '지원', '인공지능', '기업', '국내']
+    stories = [[rng.choice(words) + str(rng.randrange(1000)) for _ in range(18)] for _ in range(5000)]
+    articles = []
+    for story in stories:
+        for _ in range(2):
+            copy = list(story)
+            copy[rng.randrange(6)] = rng.choice(words)  # publishers retouch the title
+            articles.append((' '.join(copy[:6]), ' '.join(copy[6:])))
+    rng.shuffle(articles)
+    
+    index = NearDuplicateIndex()
+    elapsed = measure(lambda: [index.add(title, content) for title, content in articles])
+    brute_force = len(articles) * (len(articles) - 1) // 2
+    print(f"{len(articles)} articles, {len(stories)} stories -> {index.cluster_count} clusters")
+    print(f"Comparisons: {index.comparisons} (all pairs: {brute_force})")
+    print(f"Time: {elapsed / len(articles) * 1e6:.0f} µs/article")
+
+@benchmark('export')
+def bench_export():
+    """Write/read time and file size of Excel vs Parquet exports for 10k and 100k rows"""
+    import random
+    import tempfile
+    from src.models import Article, ArticleBatch
+    from src.utils import FileUtils
+    
+    rng = random.Random(3)
+    sources = ['연합뉴스', '조선일보', 'KBS', '매일경제', '한국경제', 'Reuters', 'Bloomberg', 'BBC']
+    words = ['양자컴퓨터', '상용화', '반도체', '정부', '투자', '연구', 'quantum', 'chip', '발표', '시장']
+    
+    for rows in (10000, 100000):
+        batch = ArticleBatch(
+            Article(' '.join(rng.choices(words, k=8)), f'https://www.yna.co.kr/view/AKR{i:010d}',
+                    rng.choice(sources), 1748601000.0 - i * 60, ' '.join(rng.choices(words, k=30)), '양자컴퓨터')
+            for i in range(rows)
+        )
+        print(f"{rows} rows")
+        with tempfile.TemporaryDirectory() as result_dir:
+            for name, save, load in (('xlsx', FileUtils.save_to_excel, FileUtils.load_from_excel),
+                                     ('parquet', FileUtils.save_to_parquet, FileUtils.load_from_parquet)):
+                paths = []
+                write_time = measure(lambda: paths.append(save(batch, name, Path(result_dir))))
+                read_time = measure(lambda: load(paths[-1]))
+                size = Path(paths[-1]).stat().st_size
+                print(f"  {name:8s} write {write_time:7.2f}s  read {read_time:7.2f}s  size {size / 1e6:7.2f} MB")
+
+@benchmark('excel_stream')
+def bench_excel_stream():
+    """Peak Python memory of save_to_excel vs the streaming writer for 20k and 50k rows"""
+    import random
+    import tempfile
+    import time
+    import tracemalloc
+    from src.models import Article, ArticleBatch
+    from src.utils import FileUtils
+    
+    words = ['양자컴퓨터', '상용화', '반도체', '정부', '투자', '연구', 'quantum', 'chip', '발표', '시장']
+    
+    def articles(rows):
+        rng = random.Random(3)
+        for i in range(rows):
+            yield Article(' '.join(rng.choices(words, k=8)), f'https://www.yna.co.kr/view/AKR{i:010d}',
+                          '연합뉴스', 1748601000.0 - i * 60, ' '.join(rng.choices(words, k=30)), '양자컴퓨터')
+    
+    for rows in (20000, 50000):
+        print(f"{rows} rows")
+        with tempfile.TemporaryDirectory() as result_dir:
+            # The batch is built inside the traced region: save_to_excel needs every row in memory
+            for name, save in (('xlsx', lambda: FileUtils.save_to_excel(ArticleBatch(articles(rows)), 'xlsx', Path(result_dir))),
+                               ('stream', lambda: FileUtils.save_to_excel_stream(articles(rows), 'stream', Path(result_dir)))):
+                tracemalloc.start()
+                start = time.perf_counter()
+                save()
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f"  {name:8s} write {elapsed:7.2f}s  peak {peak / 1e6:8.1f} MB")
+
+@benchmark('replay')
+def bench_replay():
+    """Time full crawl() runs replayed from a cassette recorded with CASSETTE_MODE=record"""
+    import os
+    from src.config import Config
+    from src.crawlers import GoogleNewsCrawler, NaverNewsCrawler
+    
+    if not (Config.CASSETTE_DIR / 'index').exists():
+        print(f"No cassette at {Config.CASSETTE_DIR}; record one with CASSETTE_MODE=record python main.py")
+        return
+    
+    queries = os.getenv('BENCH_QUERIES', '양자컴퓨터').split(',')
+    for crawler_class in (GoogleNewsCrawler, NaverNewsCrawler):
+        crawler = crawler_class()
+        crawler.use_cassette(Config.CASSETTE_DIR, 'replay', Config.CASSETTE_LATENCY)
+        
+        total = 0
+        start = time.perf_counter()
+        for query in queries:
+            total += len(crawler.crawl(query))
+        elapsed = time.perf_counter() - start
+        print(f"{crawler.get_source_name()}: {total} articles in {elapsed:.2f}s")
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark: {name} (available: {', '.join(BENCHMARKS)})")
+            return 1
+        print(f"== {name} ==")
+        BENCHMARKS[name]()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+Fixture data shared by the tests and benchmark.py
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+from src.crawlers import GoogleNewsCrawler
+from src.network import FeedCache
+
+# Synthetic Google News article ids in the format RSS feeds use (a protobuf
+# wrapping the publisher URL), with the URL each one embeds. The repeated
+# hankyung URL makes an id long enough for a two-byte length prefix.
+RECORDED_IDS = {
+    'CBMiL2h0dHBzOi8vd3d3LnluYS5jby5rci92aWV3L0FLUjIwMjUwNTMwMDEyMzAwMDE30gEA':
+        'https://www.yna.co.kr/view/AKR20250530012300017',
+    'CBMiLmh0dHBzOi8vd3d3LmJiYy5jb20vbmV3cy9hcnRpY2xlcy9jNGcwcDl4MXkyem_SATJodHRwczovL3d3dy5iYmMuY29tL25ld3MvYXJ0aWNsZXMvYzRnMHA5eDF5MnpvLmFtcA':
+        'https://www.bbc.com/news/articles/c4g0p9x1y2zo',
+    'CAIiPWh0dHBzOi8vbi5uZXdzLm5hdmVyLmNvbS9tbmV3cy9hcnRpY2xlLzAwMS8wMDE1NDEyMzQ1P3NpZD0xMDU':
+        'https://n.news.naver.com/mnews/article/001/0015412345?sid=105',
+    'CBMiigFodHRwczovL3d3dy5oYW5reXVuZy5jb20vYXJ0aWNsZS8yMDI1MDUzMDEyMzRpaHR0cHM6Ly93d3cuaGFua3l1bmcuY29tL2FydGljbGUvMjAyNTA1MzAxMjM0aWh0dHBzOi8vd3d3Lmhhbmt5dW5nLmNvbS9hcnRpY2xlLzIwMjUwNTMwMTIzNGk':
+        'https://www.hankyung.com/article/202505301234i' * 3,
+}
+
+def make_google_feed(items: int = 100) -> bytes:
+    """Build a feed in the layout of a recorded Google News RSS search response"""
+    article_ids = list(RECORDED_IDS)
+    entries = []
+    for i in range(items):
+        article_id = article_ids[i % len(article_ids)]
+        link = f"https://news.google.com/rss/articles/{article_id}?oc=5"
+        entries.append(
+            f'<item><title>양자컴퓨터 상용화 경쟁 본격화 {i} - 연합뉴스</title>'
+            f'<link>{link}</link><guid isPermaLink="false">{article_id}</guid>'
+            f'<pubDate>Fri, 30 May 2025 {i % 24:02d}:30:00 GMT</pubDate>'
+            f'<description>&lt;a href="{link}" target="_blank"&gt;양자컴퓨터 상용화 경쟁 본격화 {i}&lt;/a&gt;'
+            f'&amp;nbsp;&amp;nbsp;&lt;font color="#6f6f6f"&gt;연합뉴스&lt;/font&gt;</description>'
+            f'<source url="https://www.yna.co.kr">연합뉴스</source></item>'
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel>'
+        '<generator>NFE/5.0</generator><title>"양자컴퓨터" - Google 뉴스</title>'
+        + ''.join(entries) + '</channel></rss>'
+    ).encode('utf-8')
+
+def make_naver_page(page: int = 1) -> str:
+    """Build a search page in the layout of a saved Naver news SERP"""
+    chrome = ''.join(
+        f'<div class="api_subject_bx"><a href="https://search.naver.com/related/{i}">연관 검색어 {i}</a>'
+        f'<script>window.__data_{i} = {{"q": "양자컴퓨터", "n": {i}}};</script></div>'
+        for i in range(150)
+    )
+    items = []
+    for i in range(10):
+        n = (page - 1) * 10 + i
+        items.append(
+            f'<li class="bx" id="sp_nws{n}"><div class="news_wrap api_ani_send"><div class="news_area">'
+            f'<div class="news_info"><div class="info_group">'
+            f'<a href="https://www.yna.co.kr" class="info press">연합뉴스</a>'
+            f'<span class="info">{i + 1}시간 전</span>'
+            f'<a href="https://n.news.naver.com/mnews/article/001/00154{n:05d}" class="info">네이버뉴스</a>'
+            f'</div></div>'
+            f'<a href="https://www.yna.co.kr/view/AKR2025053000{n:05d}" class="news_tit" title="양자컴퓨터 {n}">'
+            f'<mark>양자컴퓨터</mark> 상용화 경쟁 본격화 {n}</a>'
+            f'<div class="news_dsc"><div class="api_txt_lines dsc_txt_wrap">'
+            f'국내 연구진이 <mark>양자컴퓨터</mark> 핵심 부품 국산화에 성공했다고 밝혔다. {n} ' + '관련 설명 ' * 20 +
+            f'</div></div></div></div></li>'
+        )
+    return (
+        '<!doctype html><html lang="ko"><head><title>양자컴퓨터 : 네이버 뉴스검색</title></head><body>'
+        f'<div id="header">{chrome}</div><div id="main_pack"><section class="sc_new sp_nnews">'
+        f'<div class="group_news"><ul class="list_news">{"".join(items)}</ul></div>'
+        f'</section></div><div id="footer">{chrome}</div></body></html>'
+    )
+
+# A two-item Google News RSS feed served by FeedHandler
+FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+<item><title>First story - 연합뉴스</title><link>https://www.yna.co.kr/view/AKR1</link>
+<pubDate>Fri, 30 May 2025 10:30:00 GMT</pubDate><description>one</description></item>
+<item><title>Second story - KBS</title><link>https://news.kbs.co.kr/news/view.do?ncd=2</link>
+<pubDate>Fri, 30 May 2025 11:00:00 GMT</pubDate><description>two</description></item>
+</channel></rss>""".encode('utf-8')
+
+ETAG = '"feed-v1"'
+LAST_MODIFIED = 'Fri, 30 May 2025 11:00:00 GMT'
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """Stand-in for the Google News RSS endpoint that honours validators"""
+    requests_seen = []
+    
+    def do_GET(self):
+        self.requests_seen.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.end_headers()
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml; charset=utf-8')
+        self.send_header('ETag', ETAG)
+        self.send_header('Last-Modified', LAST_MODIFIED)
+        self.send_header('Content-Length', str(len(FEED)))
+        self.end_headers()
+        self.wfile.write(FEED)
+    
+    def log_message(self, format, *args):
+        pass
+
+def start_server():
+    """Serve FeedHandler on a free local port in a background thread"""
+    FeedHandler.requests_seen = []
+    server = HTTPServer(('127.0.0.1', 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def make_crawler(server, cache_dir):
+    """Google crawler fetching its feed from ``server`` with a feed cache in ``cache_dir``"""
+    crawler = GoogleNewsCrawler()
+    crawler.base_rss_url = f"http://127.0.0.1:{server.server_port}/rss"
+    crawler.feed_cache = FeedCache(Path(cache_dir) / 'feeds.sqlite3')
+    return crawler
\ No newline at end of file
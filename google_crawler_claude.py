@@ -3,12 +3,15 @@ from datetime import datetime, timedelta
 import requests
 import pandas as pd
 import re
-from urllib.parse import quote, urlparse, unquote
+from urllib.parse import quote, unquote
 import urllib3
 import os
 import time
 import random
 
+from src.network import get_redirect_cache
+from src.utils import DateUtils, get_publisher_registry
+
 # SSL 경고 무시
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -35,28 +38,8 @@ class GoogleNewsRSSCrawler:
         }
 
     def parse_rss_date(self, date_str):
-        """RSS 날짜를 한국 형식으로 변환"""
-        try:
-            # RSS 표준 날짜 형식: 'Mon, 30 May 2025 10:30:00 GMT'
-            formats = [
-                '%a, %d %b %Y %H:%M:%S %Z',
-                '%a, %d %b %Y %H:%M:%S',
-                '%d %b %Y %H:%M:%S',
-                '%Y-%m-%dT%H:%M:%SZ',
-                '%Y-%m-%d %H:%M:%S'
-            ]
-            
-            for fmt in formats:
-                try:
-                    date_obj = datetime.strptime(date_str.strip(), fmt)
-                    return date_obj.strftime('%Y.%m.%d.')
-                except ValueError:
-                    continue
-                    
-        except Exception as e:
-            print(f"날짜 파싱 오류: {e} - 입력: {date_str}")
-        
-        return datetime.now().strftime('%Y.%m.%d.')
+        """RSS 날짜를 UTC 시각(aware datetime)으로 변환 - 한국 날짜 형식은 저장 시에만 적용"""
+        return DateUtils.parse_rss_datetime(date_str)
 
     def extract_source_from_title(self, title):
         """제목에서 출처 추출"""
@@ -80,28 +63,8 @@ class GoogleNewsRSSCrawler:
                 if match:
                     url = unquote(match.group(1))
             
-            domain = urlparse(url).netloc
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            
-            # 도메인을 출처명으로 변환
-            source_mapping = {
-                'chosun.com': 'CHOSUN',
-                'donga.com': '동아일보',
-                'joongang.co.kr': '중앙일보',
-                'hankyung.com': '한국경제',
-                'mt.co.kr': '머니투데이',
-                'ytn.co.kr': 'YTN',
-                'sbs.co.kr': 'SBS',
-                'mbc.co.kr': 'MBC',
-                'kbs.co.kr': 'KBS',
-                'reuters.com': 'Reuters',
-                'bloomberg.com': 'Bloomberg',
-                'cnn.com': 'CNN',
-                'bbc.com': 'BBC'
-            }
-            
-            return source_mapping.get(domain, domain.split('.')[0].upper())
+            # 공용 출판사 레지스트리로 도메인을 출처명으로 변환
+            return get_publisher_registry().publisher_for_url(url) or "Unknown"
             
         except Exception:
             return "Unknown"
@@ -110,6 +73,12 @@ class GoogleNewsRSSCrawler:
         """Google 리다이렉트 URL에서 실제 URL 추출"""
         try:
             if 'google.com' in google_url:
+                # 캐시된 리다이렉트 결과 우선 사용
+                cache = get_redirect_cache()
+                cached_url = cache.get(google_url)
+                if cached_url:
+                    return cached_url
+                
                 # HEAD 요청으로 리다이렉트 따라가기
                 response = requests.head(
                     google_url, 
@@ -118,6 +87,8 @@ class GoogleNewsRSSCrawler:
                     verify=False,
                     headers=self.headers
                 )
+                if response.url != google_url:
+                    cache.set(google_url, response.url)
                 return response.url
             return google_url
         except Exception:
@@ -169,7 +140,7 @@ class GoogleNewsRSSCrawler:
         }
         
         filter_days = time_filter_days.get(time_range)
-        cutoff_date = datetime.now() - timedelta(days=filter_days) if filter_days else None
+        cutoff_date = DateUtils.now() - timedelta(days=filter_days) if filter_days else None
         
         encoded_query = quote(query)
         
@@ -245,15 +216,10 @@ class GoogleNewsRSSCrawler:
                         date_parsed = self.parse_rss_date(pub_date_tag.text)
                         
                         # 시간 범위 필터링
-                        if cutoff_date:
-                            try:
-                                item_date = datetime.strptime(date_parsed, '%Y.%m.%d.')
-                                if item_date < cutoff_date:
-                                    continue
-                            except:
-                                pass
+                        if cutoff_date and date_parsed < cutoff_date:
+                            continue
                     else:
-                        date_parsed = datetime.now().strftime('%Y.%m.%d.')
+                        date_parsed = DateUtils.now()
                     
                     # 출처 추출
                     source_name = None
@@ -308,8 +274,9 @@ class GoogleNewsRSSCrawler:
             print("저장할 데이터가 없습니다.")
             return None
         
-        # DataFrame 생성
+        # DataFrame 생성 (날짜는 여기서 한국 시간 기준으로 변환)
         df = pd.DataFrame(self.results)
+        df['날짜'] = df['날짜'].map(DateUtils.format_date)
         
         # 중복 제거
         df = df.drop_duplicates(subset=['제목'], keep='first')
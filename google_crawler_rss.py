@@ -3,10 +3,13 @@ from datetime import datetime, timedelta
 import requests
 import pandas as pd
 import re
-from urllib.parse import quote, urlparse
+from urllib.parse import quote
 import urllib3
 import os
 
+from src.network import get_redirect_cache
+from src.utils import DateUtils, get_publisher_registry
+
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -29,18 +32,8 @@ RESULT_PATH = 'C:/Users/kibae/Desktop/google_news_crawling/result'
 now = datetime.now()
 
 def parse_rss_date(date_str):
-    """Convert RSS date format to Korean format"""
-    try:
-        # RSS date format: 'Mon, 30 May 2025 10:30:00 GMT'
-        date_obj = datetime.strptime(date_str, '%a, %d %b %Y %H:%M:%S %Z')
-        return date_obj.strftime('%Y.%m.%d.')
-    except:
-        try:
-            # Try alternative format
-            date_obj = datetime.strptime(date_str[:16], '%a, %d %b %Y')
-            return date_obj.strftime('%Y.%m.%d.')
-        except:
-            return datetime.now().strftime('%Y.%m.%d.')
+    """Convert RSS date to an aware UTC datetime (shown in KST only when saved)"""
+    return DateUtils.parse_rss_datetime(date_str)
 
 def extract_source_from_title(title):
     """Extract source from title if available"""
@@ -53,24 +46,22 @@ def extract_source_from_title(title):
 
 def extract_source_from_url(url):
     """Extract source from URL"""
-    try:
-        domain = urlparse(url).netloc
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        # Remove common TLDs
-        source = domain.split('.')[0]
-        # Capitalize first letter
-        return source.capitalize()
-    except:
-        return "Unknown"
+    return get_publisher_registry().publisher_for_url(url) or "Unknown"
 
 def get_real_url(google_url):
     """Extract real URL from Google's redirect URL"""
     try:
         # Google News RSS often uses redirect URLs
         if 'google.com/rss/articles' in google_url:
+            cache = get_redirect_cache()
+            cached_url = cache.get(google_url)
+            if cached_url:
+                return cached_url
+            
             # Try to get the real URL by following redirect
             response = requests.head(google_url, allow_redirects=True, timeout=5, verify=False)
+            if response.url != google_url:
+                cache.set(google_url, response.url)
             return response.url
         return google_url
     except:
@@ -115,7 +106,7 @@ def crawler(maxitems, query, time_range=None, language='en'):
     }
     
     filter_days = time_filter_days.get(time_range, None)
-    cutoff_date = datetime.now() - timedelta(days=filter_days) if filter_days else None
+    cutoff_date = DateUtils.now() - timedelta(days=filter_days) if filter_days else None
     
     # RSS feed URLs to try
     rss_urls = [
@@ -183,15 +174,10 @@ def crawler(maxitems, query, time_range=None, language='en'):
                     date_parsed = parse_rss_date(pub_date.text)
                     
                     # Filter by date if time_range is specified
-                    if cutoff_date:
-                        try:
-                            item_date = datetime.strptime(date_parsed, '%Y.%m.%d.')
-                            if item_date < cutoff_date:
-                                continue  # Skip items older than cutoff
-                        except:
-                            pass
+                    if cutoff_date and date_parsed < cutoff_date:
+                        continue  # Skip items older than cutoff
                 else:
-                    date_parsed = datetime.now().strftime('%Y.%m.%d.')
+                    date_parsed = DateUtils.now()
                 
                 # Extract source
                 source_name = None
@@ -239,7 +225,7 @@ def crawler(maxitems, query, time_range=None, language='en'):
         "검색 키워드": query_text,
         "제목": title_text,
         "URL": link_text,
-        "날짜": date_text,
+        "날짜": [DateUtils.format_date(date) for date in date_text],
         "출처": source_text,
     }
     
@@ -303,7 +289,7 @@ def crawler_fallback(maxitems, query, time_range, language):
                         url = 'https://' + link_elem.get_text(strip=True)
                     link_text.append(url)
                     
-                    date_text.append(datetime.now().strftime('%Y.%m.%d.'))
+                    date_text.append(DateUtils.now())
                     source_text.append(extract_source_from_url(url))
     except Exception as e:
         print(f"Fallback method error: {e}")
@@ -314,7 +300,7 @@ def crawler_fallback(maxitems, query, time_range, language):
             "검색 키워드": query_text,
             "제목": title_text,
             "URL": link_text,
-            "날짜": date_text,
+            "날짜": [DateUtils.format_date(date) for date in date_text],
             "출처": source_text,
         }
         
@@ -1,11 +1,14 @@
 from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+from datetime import datetime
 import requests
 import pandas as pd
-import re
 from urllib.parse import quote
+import time
 import urllib3
 
+from src.network import get_rate_controller
+from src.parsers import get_parse_pipeline, parse_google_search_html
+
 # Disable SSL warnings - only use this if you understand the security implications
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -28,72 +31,6 @@ result = {}
 RESULT_PATH = '/mnt/c/Users/kibae/Desktop/google_news_crawling/result'  # Change to your desired path
 now = datetime.now()
 
-# Date cleaning function
-def date_cleansing(date_str):
-    now = datetime.now()
-    
-    try:
-        # Handle relative time formats from Google News
-        if 'hour' in date_str or 'hr' in date_str:
-            hours_ago = int(re.search(r'(\d+)', date_str).group(1))
-            target_date = now - timedelta(hours=hours_ago)
-            return target_date.strftime('%Y.%m.%d.')
-            
-        elif 'day' in date_str:
-            days_ago = int(re.search(r'(\d+)', date_str).group(1))
-            target_date = now - timedelta(days=days_ago)
-            return target_date.strftime('%Y.%m.%d.')
-            
-        elif 'min' in date_str:
-            minutes_ago = int(re.search(r'(\d+)', date_str).group(1))
-            target_date = now - timedelta(minutes=minutes_ago)
-            return target_date.strftime('%Y.%m.%d.')
-            
-        elif 'week' in date_str:
-            weeks_ago = int(re.search(r'(\d+)', date_str).group(1))
-            target_date = now - timedelta(weeks=weeks_ago)
-            return target_date.strftime('%Y.%m.%d.')
-            
-        elif 'month' in date_str:
-            # Approximate month as 30 days
-            months_ago = int(re.search(r'(\d+)', date_str).group(1))
-            target_date = now - timedelta(days=30*months_ago)
-            return target_date.strftime('%Y.%m.%d.')
-            
-        # Try to handle specific date formats (Google often shows date as "Jan 5, 2023")
-        else:
-            # This regex tries to match formats like "Jan 5, 2023" or "January 5, 2023"
-            pattern = r'([A-Za-z]{3,9})\s+(\d{1,2}),\s+(\d{4})'
-            match = re.search(pattern, date_str)
-            if match:
-                month_dict = {
-                    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-                }
-                month_str = match.group(1).lower()[:3]  # Take first 3 chars of month name
-                month = month_dict.get(month_str, 1)  # Default to 1 if not found
-                day = int(match.group(2))
-                year = int(match.group(3))
-                
-                return f"{year}.{month:02d}.{day:02d}."
-    
-    except Exception as e:
-        print(f"Date conversion error: {e} - Input: {date_str}")
-    
-    # Default to current date if parsing fails
-    return now.strftime('%Y.%m.%d.')
-
-# Content cleaning function 
-def contents_cleansing(contents):
-    if contents:
-        # Remove HTML tags
-        cleaned_content = re.sub('<.+?>', '', str(contents)).strip()
-        # Remove extra whitespace
-        cleaned_content = re.sub(r'\s+', ' ', cleaned_content)
-        contents_text.append(cleaned_content)
-    else:
-        contents_text.append("")
-
 def crawler(maxpage, query, time_range=None, language='en'):
     # Clear previous results
     title_text.clear()
@@ -127,138 +64,48 @@ def crawler(maxpage, query, time_range=None, language='en'):
     items_per_page = 10
     max_items = int(maxpage) * items_per_page
     
+    # Shared adaptive pacing for www.google.com instead of a fixed delay
+    rate_controller = get_rate_controller('www.google.com')
+    parse_pipeline = get_parse_pipeline()
+    
     while page * items_per_page < max_items:
         # Google News search URL
         url = f"https://www.google.com/search?q={encoded_query}&tbm=nws&hl={language}{time_param}&start={page * items_per_page}"
         
         try:
             # Set verify=False to bypass SSL certificate verification
-            response = requests.get(url, headers=headers, timeout=30, verify=False)
+            rate_controller.acquire()
+            started = time.monotonic()
+            try:
+                response = requests.get(url, headers=headers, timeout=30, verify=False)
+            except requests.exceptions.RequestException:
+                rate_controller.observe(None, time.monotonic() - started)
+                raise
+            rate_controller.observe(response.status_code, time.monotonic() - started)
             if response.status_code != 200:
                 print(f"Failed to fetch page {page+1}. Status code: {response.status_code}")
                 break
                 
-            html = response.text
-            soup = BeautifulSoup(html, 'html.parser')
+            # Parse in a worker process when PARSE_WORKERS is set, inline otherwise
+            if parse_pipeline:
+                records = parse_pipeline.submit('google_html', response.text).result()
+            else:
+                records = parse_google_search_html(response.text)
             
-            # Find news articles (Google's structure may change over time)
-            # Try multiple possible selectors for articles
-            articles = soup.select('div.SoaBEf') or soup.select('div.xuvV6b') or soup.select('div.v7W49e')
-            
-            if not articles:
+            if not records:
+                print(f"No articles found on page {page+1}")
                 break
-                print(f"No articles found on page {page+1}. Trying alternative selectors...")
-                # Try an even broader approach if common selectors fail
-                articles = soup.select('a[href^="https://"]')
-                if not articles:
-                    print("Still no articles found. Google may have changed their HTML structure.")
-                    # Debug info
-                    print("Page HTML structure (first 500 chars):")
-                    print(html[:500])
-                    break
             
-            for article in articles:
-                # Extract title and link - try multiple possible selectors
-                title_element = (article.select_one('div.MBeuO') or 
-                                article.select_one('h3') or 
-                                article.select_one('.DY5T1d') or
-                                article)
-                
-                # For the link, check if the article itself is an <a> tag, otherwise find one
-                if article.name == 'a' and 'href' in article.attrs:
-                    link_element = article
-                else:
-                    link_element = article.select_one('a')
-                
-                # Process title element
-                if title_element:
-                    # If we're using the article itself as title element (fallback)
-                    if title_element == article:
-                        # Try to extract the text content or use a default
-                        title = title_element.get_text(strip=True)
-                        # If title is too long, it's probably not just a title
-                        if len(title) > 200:
-                            # Try to find the first meaningful text
-                            for tag in title_element.find_all(['h3', 'h2', 'b', 'strong']):
-                                if tag.get_text(strip=True):
-                                    title = tag.get_text(strip=True)
-                                    break
-                    else:
-                        title = title_element.get_text(strip=True)
-                    
-                    # Clean up title if needed
-                    title = title.replace('\n', ' ').strip()
-                    title_text.append(title)
-                else:
-                    # If we can't find a title, create a placeholder
-                    title_text.append(f"[Article #{len(title_text) + 1}]")
-                
-                # Process link element
-                if link_element and 'href' in link_element.attrs:
-                    link = link_element['href']
-                    # Google sometimes includes redirect URLs
-                    if link.startswith('/url?'):
-                        # Extract the actual URL from Google's redirect
-                        import re
-                        match = re.search(r'url=([^&]+)', link)
-                        if match:
-                            from urllib.parse import unquote
-                            link = unquote(match.group(1))
-                    
-                    link_text.append(link)
-                else:
-                    # Skip this article if we don't have a link
-                    continue
-                
-                # Extract source - try multiple possible selectors
-                source_element = article.select_one('div.CEMjEf span') or article.select_one('.vN4Yjc') or article.select_one('.BNeawe.UPmit.AP7Wnd')
-                
-                # If we found a source element, clean it up
-                if source_element:
-                    source_name = source_element.text.strip()
-                    # Sometimes the source includes time, like "CHOSUNBIZ · 2 hours ago"
-                    # So we split on common separators
-                    for separator in [' · ', ' - ', ' | ']:
-                        if separator in source_name:
-                            source_name = source_name.split(separator)[0].strip()
-                            break
-                    source_text.append(source_name)
-                else:
-                    # Try to extract from URL if source element not found
-                    if link_element and link_element['href']:
-                        try:
-                            from urllib.parse import urlparse
-                            domain = urlparse(link_element['href']).netloc
-                            # Remove www. if present
-                            if domain.startswith('www.'):
-                                domain = domain[4:]
-                            source_text.append(domain)
-                        except:
-                            source_text.append("Unknown")
-                    else:
-                        source_text.append("Unknown")
-                
-                # Extract date
-                date_element = article.select_one('div.OSrXXb span')
-                if date_element:
-                    date_text.append(date_cleansing(date_element.text.strip()))
-                else:
-                    date_text.append(datetime.now().strftime('%Y.%m.%d.'))
-                
-                # Extract content snippet
-                content_element = article.select_one('div.GI74Re')
-                if content_element:
-                    contents_cleansing(content_element.text)
-                else:
-                    contents_text.append("")
+            for record in records:
+                title_text.append(record.title)
+                link_text.append(record.link)
+                source_text.append(record.source)
+                date_text.append(record.date or datetime.now().strftime('%Y.%m.%d.'))
+                contents_text.append(record.content)
             
             print(f"Processed page {page+1}")
             page += 1
             
-            # Add a delay to avoid being blocked
-            import time
-            time.sleep(2)
-            
         except Exception as e:
             print(f"Error crawling page {page+1}: {e}")
             break
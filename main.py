@@ -15,6 +15,8 @@ sys.path.append(str(Path(__file__).parent / 'src'))
 
 from src.crawlers import GoogleNewsCrawler, NaverNewsCrawler
 from src.config import Config
+from src.network import CircuitOpenError
+from src.utils import NearDuplicateIndex
 
 def get_user_input():
     """사용자 입력을 받아 크롤링 설정을 반환"""
@@ -85,21 +87,39 @@ def get_user_input():
         'time_range': time_range
     }
 
-def run_crawler(crawler, query, **kwargs):
-    """크롤러 실행"""
+def run_crawler(crawler, query, stories=None, **kwargs):
+    """크롤러 실행 (소스가 차단 상태이면 None을 반환하여 연기)
+    
+    stories가 주어지면 이미 수집된 기사와 같은 내용의 기사는 대표 기사 하나만 남깁니다.
+    """
     try:
+        if not crawler.is_available():
+            breaker = crawler.get_circuit_breaker()
+            print(f"\n⏸️  {crawler.get_source_name()} 요청 차단 상태 "
+                  f"({breaker.retry_in():.0f}초 후 재시도 가능) - 연기합니다.")
+            return None
+        
         print(f"\n{crawler.get_source_name()} 크롤링 시작...")
         results = crawler.crawl(query, **kwargs)
         
+        if results and stories is not None:
+            representatives = stories.representatives(results)
+            if len(representatives) < len(results):
+                print(f"🔁 중복 기사 {len(results) - len(representatives)}개 제외")
+            results = crawler.results = representatives
+        
         if results:
-            filename = crawler.save_results(query)
+            paths = crawler.save_results(query)
             print(f"✅ {len(results)}개 기사 수집 완료")
-            print(f"📁 저장 위치: {filename}")
+            print(f"📁 저장 위치: {', '.join(paths)}")
             return True
         else:
             print("❌ 수집된 기사가 없습니다.")
             return False
-            
+    
+    except CircuitOpenError as e:
+        print(f"⏸️  {crawler.get_source_name()} 요청 실패가 반복되어 중단합니다: {e}")
+        return None
     except Exception as e:
         print(f"❌ 크롤링 중 오류 발생: {e}")
         return False
@@ -120,28 +140,43 @@ def main():
         Config.ensure_result_dir()
         
         success_count = 0
+        deferred = []
         
-        # Google News 크롤링
+        jobs = []
         if 'google' in config['sources']:
-            google_crawler = GoogleNewsCrawler()
-            if run_crawler(
-                google_crawler, 
-                config['query'],
-                max_pages=config['max_pages'],
-                time_range=config['time_range']
-            ):
-                success_count += 1
-        
-        # Naver News 크롤링
+            jobs.append((GoogleNewsCrawler(), {
+                'max_pages': config['max_pages'],
+                'time_range': config['time_range']
+            }))
         if 'naver' in config['sources']:
-            naver_crawler = NaverNewsCrawler()
-            if run_crawler(
-                naver_crawler,
-                config['query'],
-                max_pages=config['max_pages'],
-                sort=config['sort']
-            ):
-                success_count += 1
+            jobs.append((NaverNewsCrawler(), {
+                'max_pages': config['max_pages'],
+                'sort': config['sort']
+            }))
+        
+        # 두 소스를 모두 수집하면 같은 기사(통신사 기사 재배포 등)는 한 번만 저장
+        stories = NearDuplicateIndex() if len(jobs) > 1 else None
+        
+        try:
+            # Google News / Naver News 크롤링
+            for crawler, options in jobs:
+                outcome = run_crawler(crawler, config['query'], stories, **options)
+                if outcome:
+                    success_count += 1
+                elif outcome is None:
+                    deferred.append((crawler, options))
+            
+            # 차단되었던 소스는 나머지 작업 후 한 번 더 시도
+            for crawler, options in deferred:
+                if not crawler.is_available():
+                    print(f"⏭️  {crawler.get_source_name()}: 여전히 차단 상태이므로 이번 실행에서 건너뜁니다.")
+                    continue
+                if run_crawler(crawler, config['query'], stories, **options):
+                    success_count += 1
+        finally:
+            # 중간에 오류가 나도 크롤러가 쓰던 요청 스레드를 정리
+            for crawler, _ in jobs:
+                crawler.close()
         
         # 결과 요약
         print("\n" + "=" * 50)
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-import requests, time, random
+import requests, time
 import pandas as pd
 import re
 
+from src.network import get_rate_controller
+
 '''
 < Naver 뉴스 검색 크롤러 >
  - 수집 대상 : 제목, 링크, 신문사, 날짜, 요약
@@ -66,6 +68,9 @@ def crawler(maxpage: int, query: str, sort: str, s_date: str, e_date: str):
         'Accept-Language': 'ko-KR,ko;q=0.9',
     }
 
+    # search.naver.com 공용 적응형 요청 속도 제어 (고정 대기 대신)
+    rate_controller = get_rate_controller('search.naver.com')
+
     while page <= maxpage_t:
         url = (
             f'https://search.naver.com/search.naver?where=news'
@@ -74,7 +79,14 @@ def crawler(maxpage: int, query: str, sort: str, s_date: str, e_date: str):
             f'&nso=so%3Ar%2Cp%3Afrom{s_from}to{e_to}%2Ca%3A'
             f'&start={page}'
         )
-        resp = requests.get(url, headers=headers, timeout=5, verify=False)
+        rate_controller.acquire()
+        started = time.monotonic()
+        try:
+            resp = requests.get(url, headers=headers, timeout=5, verify=False)
+        except requests.exceptions.RequestException:
+            rate_controller.observe(None, time.monotonic() - started)
+            raise
+        rate_controller.observe(resp.status_code, time.monotonic() - started)
         # print(resp.status_code)  # → 200이어야 정상
         soup = BeautifulSoup(resp.text, 'html.parser')
 
@@ -97,7 +109,6 @@ def crawler(maxpage: int, query: str, sort: str, s_date: str, e_date: str):
 
         print(f'▶ 페이지 {page} 완료, 수집된 제목 수: {len(title_text)}')
         page += 10
-        time.sleep(random.uniform(1.5, 3.0))
 
     # DataFrame 생성 및 저장
     df = pd.DataFrame({
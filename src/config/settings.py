@@ -1,9 +1,11 @@
 import os
+from datetime import timedelta, timezone
 from pathlib import Path
 
 class Config:
     BASE_DIR = Path(__file__).parent.parent.parent
     RESULT_DIR = BASE_DIR / 'result'
+    CACHE_DIR = BASE_DIR / 'cache'
     
     # Request configuration
     DEFAULT_HEADERS = {
@@ -25,8 +27,46 @@ class Config:
     
     # Crawler settings
     REQUEST_TIMEOUT = 30
-    MAX_RETRIES = 5
-    RETRY_DELAY = 2
+    MAX_RETRIES = 5          # attempts per request, including the first
+    RETRY_DELAY = 2          # base of the exponential backoff in seconds
+    RETRY_MAX_DELAY = 30
+    RETRY_JITTER = 0.5       # backoff is scaled by a random factor in [1 - j, 1 + j]
+    RETRY_AFTER_MAX = 60     # longest Retry-After wait that is honoured
+    RETRY_BUDGET = 20        # retries allowed across one crawl
+    
+    # Circuit breaker: consecutive failures before a host is opened, seconds until a trial request
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_RECOVERY_TIMEOUT = 120
+    
+    # Async fetch settings
+    ASYNC_MAX_CONCURRENCY = 16
+    ASYNC_PER_HOST_LIMIT = 4
+    
+    # Connection pools shared by all crawlers in the process
+    POOL_CONNECTIONS = 20    # host pools kept by the default adapter
+    POOL_MAXSIZE = 16        # keep-alive connections per host
+    HOST_POOL_SETTINGS = {   # host: (pool_connections, pool_maxsize)
+        'news.google.com': (1, 32),
+        'search.naver.com': (1, 8),
+    }
+    
+    # Rate limiting per host: (requests per second, burst size, highest rate AIMD may raise it to);
+    # other hosts start at and are capped by the default rate
+    DEFAULT_REQUESTS_PER_SECOND = 2.0
+    DEFAULT_RATE_BURST = 2
+    NAVER_REQUESTS_PER_SECOND = float(os.getenv('NAVER_REQUESTS_PER_SECOND', '1.0'))
+    NAVER_RATE_BURST = int(os.getenv('NAVER_RATE_BURST', '2'))
+    HOST_RATE_LIMITS = {
+        'search.naver.com': (NAVER_REQUESTS_PER_SECOND, NAVER_RATE_BURST, NAVER_REQUESTS_PER_SECOND),
+        'news.google.com': (5.0, 5, 10.0),
+    }
+    
+    # Adaptive (AIMD) rate control: the rates above are starting rates
+    AIMD_MIN_RATE = 0.2
+    AIMD_INCREASE = 0.1          # requests/sec added per healthy response
+    AIMD_DECREASE_FACTOR = 0.5   # rate multiplier on 429/5xx, failures or slow responses
+    AIMD_LATENCY_FACTOR = 2.0    # slow = latency above this multiple of the moving average
+    AIMD_LATENCY_FLOOR = 2.0     # ...and above this many seconds
     
     # Google News settings
     GOOGLE_RSS_BASE_URL = 'https://news.google.com/rss'
@@ -35,6 +75,41 @@ class Config:
         'gl': 'KR',
         'ceid': 'KR:ko'
     }
+    GOOGLE_RESOLVE_WORKERS = 16
+    GOOGLE_RESOLVE_TIMEOUT = 5
+    
+    # Redirect cache (Google News article URL -> publisher URL)
+    REDIRECT_CACHE_PATH = CACHE_DIR / 'redirects.sqlite3'
+    REDIRECT_CACHE_TTL = 7 * 24 * 3600
+    REDIRECT_CACHE_MAX_ENTRIES = 200000
+    
+    # RSS feed cache (conditional GET validators and last parsed items)
+    FEED_CACHE_PATH = CACHE_DIR / 'feeds.sqlite3'
+    
+    # Seen-article index (canonical URL hashes from earlier runs; SKIP_SEEN=1 skips those articles)
+    SEEN_INDEX_PATH = CACHE_DIR / 'seen.sqlite3'
+    SEEN_INDEX_TTL = 180 * 24 * 3600
+    SKIP_SEEN = os.getenv('SKIP_SEEN', '0') == '1'
+    
+    # Bloom filter in front of the seen index: generations of SEEN_FILTER_CAPACITY keys,
+    # replaced monthly; each is kept SEEN_FILTER_GENERATIONS + 1 months after it starts, so
+    # its newest keys outlive SEEN_INDEX_TTL (about 1.8 MB per million keys)
+    SEEN_FILTER_PATH = CACHE_DIR / 'seen.bloom'
+    SEEN_FILTER_CAPACITY = 1000000
+    SEEN_FILTER_ERROR_RATE = 0.001
+    SEEN_FILTER_GENERATION_SECONDS = 30 * 24 * 3600
+    SEEN_FILTER_GENERATIONS = 6
+    
+    # HTTP cassette (record/replay) settings
+    CASSETTE_MODE = os.getenv('CASSETTE_MODE')  # 'record', 'replay' or unset
+    CASSETTE_DIR = Path(os.getenv('CASSETTE_DIR', str(CACHE_DIR / 'cassettes')))
+    CASSETTE_LATENCY = float(os.getenv('CASSETTE_LATENCY', '0'))
+    
+    # Publisher registry (a publicsuffix.org list file replaces the built-in suffixes)
+    PUBLIC_SUFFIX_FILE = os.getenv('PUBLIC_SUFFIX_FILE')
+    
+    # Result pages show Korean time; timestamps are kept in UTC and rendered in this zone on export
+    TIMEZONE = timezone(timedelta(hours=9), 'KST')
     
     # Naver News settings
     NAVER_BASE_URL = 'https://search.naver.com/search.naver'
@@ -43,6 +118,18 @@ class Config:
         'sm': 'tab_jum',
         'sort': '0'
     }
+    NAVER_FAST_PARSE = True  # scoped lxml parsing with precompiled selectors
+    
+    # Parse pipeline (worker processes that parse fetched pages); off by default since
+    # spawning workers only pays off for large crawls. 0 parses inline
+    PARSE_WORKERS = int(os.getenv('PARSE_WORKERS', '0'))
+    PARSE_MAX_PENDING = 32  # bodies queued or being parsed before fetchers block
+    
+    # Near-duplicate story detection (MinHash LSH over title and snippet shingles);
+    # BANDS x ROWS hashes put stories above roughly (1/BANDS) ** (1/ROWS) similarity in candidate buckets
+    NEAR_DUPLICATE_THRESHOLD = 0.5
+    NEAR_DUPLICATE_BANDS = 16
+    NEAR_DUPLICATE_ROWS = 4
     
     # Time range mappings
     TIME_RANGE_MAP = {
@@ -55,6 +142,10 @@ class Config:
     
     # Export settings
     EXCEL_COLUMNS = ['title', 'link', 'source', 'date', 'content']
+    EXPORT_FORMATS = os.getenv('EXPORT_FORMATS', 'xlsx')  # comma separated: 'parquet', 'xlsx', 'xlsx-stream'
+    EXCEL_MAX_ROWS = 1048576  # per sheet, header included (Excel's limit)
+    EXCEL_SHEETS_PER_FILE = 4  # streaming writer starts a new file after this many full sheets
+    PARQUET_COMPRESSION = 'zstd'
     
     # Environment variables
     NEWS_API_KEY = os.getenv('NEWS_API_KEY')
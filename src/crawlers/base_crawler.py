@@ -1,91 +1,405 @@
+import asyncio
 import requests
 import time
 import random
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Iterable, Iterator, Optional, Union
+from urllib.parse import urlparse
 from urllib3.exceptions import InsecureRequestWarning
 import urllib3
 
 from ..config import Config
-from ..utils import DateUtils, TextUtils, FileUtils
+from ..models import Article, ArticleBatch
+from ..network import (
+    CassetteAdapter, CassetteMiss, RetryPolicy, RetryBudget, CircuitBreaker, CircuitOpenError,
+    SeenFilter, SeenIndex, get_circuit_breaker, get_rate_controller, get_seen_filter, get_seen_index,
+    get_session_registry
+)
+from ..parsers import ParsePipeline, get_parse_pipeline
+from ..utils import DateUtils, TextUtils, FileUtils, UrlUtils
 
 # Disable SSL warnings
 urllib3.disable_warnings(InsecureRequestWarning)
 
+class FetchLimits:
+    """Global and per-host concurrency semaphores shared by the requests they bound"""
+    
+    def __init__(self, max_concurrency: Optional[int] = None, per_host_limit: Optional[int] = None):
+        self.max_concurrency = max_concurrency or Config.ASYNC_MAX_CONCURRENCY
+        self.per_host_limit = per_host_limit or Config.ASYNC_PER_HOST_LIMIT
+        self.global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.host_semaphores: Dict[str, asyncio.Semaphore] = {}
+    
+    def for_host(self, host: str):
+        if host not in self.host_semaphores:
+            self.host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self.global_semaphore, self.host_semaphores[host]
+
 class BaseCrawler(ABC):
     def __init__(self):
         self.results = []
+        
+        # Keep-alive connections are shared with every other crawler in the process
+        self.session_registry = get_session_registry()
+        self.session = self.session_registry.get_session()
+        
+        self.retry_policy = RetryPolicy()
+        self.retry_budget = RetryBudget()
+        
+        if Config.CASSETTE_MODE:
+            self.use_cassette(Config.CASSETTE_DIR, Config.CASSETTE_MODE, Config.CASSETTE_LATENCY)
+        
+        # Worker processes that parse fetched pages (None parses inline)
+        self.parse_pipeline = get_parse_pipeline()
+        
+        # Articles seen in earlier runs are skipped when enabled (None keeps everything)
+        self.seen_index = get_seen_index() if Config.SKIP_SEEN else None
+        self.seen_filter = get_seen_filter() if Config.SKIP_SEEN else None
+        # Keys of records handed out but not saved yet (recorded by commit_seen)
+        self._pending_seen = set()
+        
+        # Async fetch state (bound lazily to the running event loop)
+        self._executor = None
+        self._executor_workers = 0
+        self._async_loop = None
+        self._async_limits: Optional[FetchLimits] = None
+        
+    @staticmethod
+    def _build_adapter_retry() -> urllib3.util.retry.Retry:
+        # Retries are handled once, by RetryPolicy in make_request
+        return urllib3.util.retry.Retry(total=0, read=False)
+    
+    def use_cassette(self, directory, mode: str = 'replay', latency: float = 0.0) -> CassetteAdapter:
+        """Route this crawler's session through a record/replay cassette
+        
+        In 'record' mode real responses are written to ``directory``; in
+        'replay' mode they are served from it without touching the network,
+        optionally delayed by ``latency`` seconds to mimic real round trips.
+        """
+        adapter = CassetteAdapter(directory, mode, latency, max_retries=self._build_adapter_retry())
+        
+        # Give this crawler its own session so other crawlers keep the live transport
         self.session = requests.Session()
         self.session.headers.update(Config.DEFAULT_HEADERS)
-        
-        # Configure session with better network handling
-        adapter = requests.adapters.HTTPAdapter(
-            max_retries=urllib3.util.retry.Retry(
-                total=Config.MAX_RETRIES,
-                backoff_factor=0.3,
-                status_forcelist=[500, 502, 503, 504, 429]
-            )
-        )
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
+        return adapter
+    
+    def use_parse_pipeline(self, pipeline: Optional[ParsePipeline]):
+        """Parse fetched pages with the given pipeline, or inline when None"""
+        self.parse_pipeline = pipeline
+    
+    def use_seen_index(self, index: Optional[SeenIndex], seen_filter: Optional[SeenFilter] = None):
+        """Skip articles recorded in the given seen index, or keep everything when None
         
+        ``seen_filter`` answers most lookups of new articles without
+        querying the index; it must hold every key the index does.
+        """
+        self.seen_index = index
+        self.seen_filter = seen_filter
+    
+    def _seen_keys(self, keys: List[int]) -> set:
+        """Get the keys already in the seen index, asking the filter first"""
+        if self.seen_filter is not None:
+            keys = [key for key in keys if self.seen_filter.might_contain(key)]
+            if not keys:
+                return set()
+        return self.seen_index.contains_keys(keys)
+    
+    def _record_seen(self, keys: List[int]):
+        self.seen_index.add_keys(keys)
+        if self.seen_filter is not None:
+            self.seen_filter.add_many(keys)
+    
+    def drop_seen(self, records: List[Article], links: Optional[List[str]] = None) -> List[Article]:
+        """Drop records already in the seen index without recording the rest
+        
+        ``links`` optionally gives the URL to check per record, e.g. one
+        decoded before the record's own link is resolved.
+        """
+        if self.seen_index is None or not records:
+            return records
+        
+        keys = UrlUtils.url_keys(links if links is not None else [record.link for record in records])
+        seen = self._seen_keys(keys)
+        fresh = [record for record, key in zip(records, keys) if key not in seen]
+        if len(fresh) < len(records):
+            print(f"Skipping {len(records) - len(fresh)} already seen articles")
+        return fresh
+    
+    def skip_seen(self, records: List[Article]) -> Iterator[Article]:
+        """Yield records not in the seen index (nor already yielded since the last commit)
+        
+        Yielded records are only held as pending; they are recorded as seen
+        by ``commit_seen`` once they have been saved, so a failed save does
+        not hide them from the next run.
+        """
+        if self.seen_index is None:
+            yield from records
+            return
+        
+        keys = UrlUtils.url_keys(record.link for record in records)
+        seen = self._seen_keys(keys)
+        for record, key in zip(records, keys):
+            if key in seen or key in self._pending_seen:
+                continue
+            self._pending_seen.add(key)
+            yield record
+    
+    def commit_seen(self):
+        """Record the articles handed out by skip_seen as seen (call after saving them)"""
+        if self.seen_index is None or not self._pending_seen:
+            return
+        self._record_seen(list(self._pending_seen))
+        self._pending_seen.clear()
+    
     def make_request(self, url: str, params: Optional[Dict] = None, 
-                    headers: Optional[Dict] = None, use_rss_headers: bool = False) -> Optional[requests.Response]:
-        """Make HTTP request with retry logic"""
+                    headers: Optional[Dict] = None, use_rss_headers: bool = False,
+                    timeout: Optional[float] = None,
+                    max_retries: Optional[int] = None,
+                    paced: bool = False,
+                    circuit: Optional[str] = None) -> Optional[requests.Response]:
+        """Make HTTP request with retry logic
+        
+        Every attempt waits for the host's adaptive rate controller, except a
+        first attempt that the caller already ``paced``. Failures count
+        against the circuit breaker named ``circuit``, by default the host's.
+        """
         if use_rss_headers:
             request_headers = {**Config.RSS_HEADERS, **(headers or {})}
         else:
             request_headers = {**Config.DEFAULT_HEADERS, **(headers or {})}
         
-        for attempt in range(Config.MAX_RETRIES):
+        timeout = timeout or Config.REQUEST_TIMEOUT
+        max_retries = max_retries or self.retry_policy.max_attempts
+        host = urlparse(url).netloc
+        breaker = get_circuit_breaker(circuit or host)
+        rate_controller = get_rate_controller(host)
+        
+        for attempt in range(max_retries):
+            # Fails fast with CircuitOpenError while the host is open
+            trial = breaker.before_request()
             try:
-                response = self.session.get(
-                    url, 
-                    params=params,
-                    headers=request_headers,
-                    timeout=Config.REQUEST_TIMEOUT,
-                    verify=False
-                )
-                response.raise_for_status()
-                return response
+                if attempt > 0 or not paced:
+                    rate_controller.acquire()
                 
-            except requests.exceptions.ConnectionError as e:
-                print(f"Network connection failed (attempt {attempt + 1}/{Config.MAX_RETRIES}): {e}")
-                print("Tip: Check your internet connection or try using a VPN")
-                if attempt < Config.MAX_RETRIES - 1:
-                    time.sleep(Config.RETRY_DELAY * (2 ** attempt))
-                else:
-                    print(f"Connection failed after {Config.MAX_RETRIES} attempts for URL: {url}")
-                    return None
-            except requests.exceptions.Timeout as e:
-                print(f"Request timeout (attempt {attempt + 1}/{Config.MAX_RETRIES}): {e}")
-                print("Tip: The server is taking too long to respond, retrying...")
-                if attempt < Config.MAX_RETRIES - 1:
-                    time.sleep(Config.RETRY_DELAY * (2 ** attempt))
-                else:
-                    print(f"Timeout after {Config.MAX_RETRIES} attempts for URL: {url}")
+                response = None
+                started = time.monotonic()
+                try:
+                    response = self.session.get(
+                        url, 
+                        params=params,
+                        headers=request_headers,
+                        timeout=timeout,
+                        verify=False
+                    )
+                    rate_controller.observe(response.status_code, time.monotonic() - started)
+                    if not self.retry_policy.is_retryable_status(response.status_code):
+                        breaker.record_success()
+                        response.raise_for_status()
+                        return response
+                    print(f"HTTP {response.status_code} (attempt {attempt + 1}/{max_retries}) for URL: {url}")
+                    
+                except CassetteMiss as e:
+                    # Replaying offline: retrying cannot produce a response
+                    breaker.record_success()
+                    print(f"Cassette miss: {e}")
                     return None
-            except requests.exceptions.RequestException as e:
-                print(f"Request failed (attempt {attempt + 1}/{Config.MAX_RETRIES}): {e}")
-                if attempt < Config.MAX_RETRIES - 1:
-                    time.sleep(Config.RETRY_DELAY * (2 ** attempt))
-                else:
-                    print(f"Max retries exceeded for URL: {url}")
+                except requests.exceptions.HTTPError as e:
+                    # Client errors other than 429 will not succeed on retry
+                    print(f"Request failed: {e}")
                     return None
+                except requests.exceptions.ConnectionError as e:
+                    print(f"Network connection failed (attempt {attempt + 1}/{max_retries}): {e}")
+                    print("Tip: Check your internet connection or try using a VPN")
+                except requests.exceptions.Timeout as e:
+                    print(f"Request timeout (attempt {attempt + 1}/{max_retries}): {e}")
+                except requests.exceptions.RequestException as e:
+                    print(f"Request failed (attempt {attempt + 1}/{max_retries}): {e}")
+                
+                if response is None:
+                    rate_controller.observe(None, time.monotonic() - started)
+                breaker.record_failure()
+                self.retry_budget.record_failure(time.monotonic() - started)
+            finally:
+                # An unexpected error must not leave the half-open trial taken forever
+                if trial:
+                    breaker.release_trial()
+            
+            if attempt >= max_retries - 1:
+                print(f"Max retries exceeded for URL: {url}")
+                return None
+            if not self.retry_budget.try_spend():
+                print(f"Retry budget exhausted, giving up on URL: {url}")
+                return None
+            
+            delay = self.retry_policy.get_delay(attempt, response)
+            print(f"Retrying in {delay:.1f}s...")
+            self.retry_budget.record_backoff(delay)
+            time.sleep(delay)
         
         return None
     
+    def get_base_url(self) -> str:
+        """Get the main endpoint of this crawler, used for availability checks"""
+        return ""
+    
+    def get_circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Get the circuit breaker guarding this crawler's main endpoint"""
+        host = urlparse(self.get_base_url()).netloc
+        return get_circuit_breaker(host) if host else None
+    
+    def is_available(self) -> bool:
+        """Check whether the main endpoint currently accepts requests"""
+        breaker = self.get_circuit_breaker()
+        return breaker is None or breaker.allows_requests()
+    
+    def get_retry_stats(self) -> Dict[str, float]:
+        """Get retry counts and time spent retrying in the current crawl"""
+        return self.retry_budget.stats()
+    
+    def get_connection_stats(self) -> Dict[str, int]:
+        """Get connections opened versus reused across the shared pools"""
+        return self.session_registry.stats()
+    
+    def get_request_rate(self) -> float:
+        """Get the current adaptive request rate (req/s) for the main endpoint"""
+        host = urlparse(self.get_base_url()).netloc
+        return get_rate_controller(host).rate if host else 0.0
+    
+    def report_crawl_stats(self):
+        """Print how much of the crawl was spent retrying and the current request rate"""
+        stats = self.get_retry_stats()
+        print(f"Retries: {stats['retries']}/{stats['budget']}, "
+              f"time spent retrying: {stats['time_spent']:.1f}s, "
+              f"request rate: {self.get_request_rate():.2f} req/s")
+        
+        connections = self.get_connection_stats()
+        print(f"Connections: {connections['connections_opened']} opened, "
+              f"{connections['connections_reused']} reused")
+    
+    def _get_executor(self, min_workers: int = 0) -> ThreadPoolExecutor:
+        """Get worker pool used to run blocking requests for the async path
+        
+        The pool is replaced by a larger one when a call allows more
+        concurrent requests than it has threads; requests already running
+        on the old pool finish there.
+        """
+        workers = max(Config.ASYNC_MAX_CONCURRENCY, min_workers)
+        if self._executor is None or workers > self._executor_workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix=self.__class__.__name__
+            )
+            self._executor_workers = workers
+        return self._executor
+    
+    def _get_limits(self) -> FetchLimits:
+        """Get the Config limits shared by every request on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            # asyncio primitives cannot be shared across event loops
+            self._async_loop = loop
+            self._async_limits = FetchLimits()
+        return self._async_limits
+    
+    async def make_request_async(self, url: str, params: Optional[Dict] = None,
+                                 headers: Optional[Dict] = None,
+                                 use_rss_headers: bool = False,
+                                 limits: Optional[FetchLimits] = None) -> Optional[requests.Response]:
+        """Async variant of make_request bounded by global and per-host concurrency
+        
+        ``limits`` defaults to the Config limits shared on the running loop.
+        """
+        host = urlparse(url).netloc
+        limits = limits or self._get_limits()
+        global_semaphore, host_semaphore = limits.for_host(host)
+        
+        async with global_semaphore:
+            async with host_semaphore:
+                # Wait for pacing here so cancelled tasks never reach the network
+                await get_rate_controller(host).acquire_async()
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._get_executor(limits.max_concurrency),
+                    partial(self.make_request, url, params, headers, use_rss_headers, paced=True)
+                )
+    
+    async def fetch_many_async(self, urls: List[str], headers: Optional[Dict] = None,
+                               use_rss_headers: bool = False,
+                               max_concurrency: Optional[int] = None,
+                               per_host_limit: Optional[int] = None,
+                               url_headers: Optional[List[Optional[Dict]]] = None) -> List[Optional[requests.Response]]:
+        """Fetch URLs concurrently, returning responses in input order
+        
+        ``max_concurrency`` and ``per_host_limit`` bound this call's requests
+        only; without them the call shares the Config limits with every other
+        request on the loop. ``url_headers`` optionally gives extra headers
+        per URL, merged over ``headers``. A URL whose host circuit is open
+        gets None, like any other failed fetch, without failing the rest.
+        """
+        limits = None
+        if max_concurrency or per_host_limit:
+            limits = FetchLimits(max_concurrency, per_host_limit)
+        
+        async def fetch(url, extra_headers):
+            try:
+                return await self.make_request_async(
+                    url,
+                    headers={**(headers or {}), **(extra_headers or {})},
+                    use_rss_headers=use_rss_headers,
+                    limits=limits
+                )
+            except CircuitOpenError as e:
+                print(f"Skipping {url}: {e}")
+                return None
+        
+        url_headers = url_headers or [None] * len(urls)
+        tasks = [fetch(url, extra_headers) for url, extra_headers in zip(urls, url_headers)]
+        return await asyncio.gather(*tasks)
+    
+    def fetch_many(self, urls: List[str], headers: Optional[Dict] = None,
+                   use_rss_headers: bool = False,
+                   max_concurrency: Optional[int] = None,
+                   per_host_limit: Optional[int] = None,
+                   url_headers: Optional[List[Optional[Dict]]] = None) -> List[Optional[requests.Response]]:
+        """Fetch URLs concurrently from synchronous code (not usable inside a running loop)"""
+        return asyncio.run(self.fetch_many_async(
+            urls, headers, use_rss_headers, max_concurrency, per_host_limit, url_headers
+        ))
+    
+    def close(self):
+        """Shut down the threads of the async fetch path; the crawler stays usable"""
+        executor, self._executor = self._executor, None
+        self._executor_workers = 0
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
     def add_random_delay(self, min_delay: float = 0.5, max_delay: float = 2.0):
         """Add random delay to avoid being blocked"""
         delay = random.uniform(min_delay, max_delay)
         time.sleep(delay)
     
-    def clean_and_validate_results(self) -> List[Dict[str, Any]]:
+    def clean_and_validate_results(self) -> List[Article]:
         """Clean and validate collected results"""
         return FileUtils.validate_data(self.results)
     
-    def save_results(self, query: str) -> str:
-        """Save results to Excel file"""
+    def save_results(self, query: str, formats: Union[str, Iterable[str], None] = None) -> List[str]:
+        """Save results in each export format ('parquet', 'xlsx', 'xlsx-stream'; default Config.EXPORT_FORMATS)
+        
+        Returns the saved file paths. The saved articles are recorded as seen
+        only once every format has been written.
+        """
         if not self.results:
             raise ValueError("No results to save")
         
@@ -94,19 +408,49 @@ class BaseCrawler(ABC):
             raise ValueError("No valid results after cleaning")
         
         result_dir = Config.ensure_result_dir()
-        return FileUtils.save_to_excel(clean_results, query, result_dir)
+        paths = FileUtils.save(ArticleBatch(clean_results), query, result_dir, formats or Config.EXPORT_FORMATS)
+        self.commit_seen()
+        return paths
+    
+    def crawl_to_excel(self, query: str, max_pages: int = 5, **kwargs) -> List[str]:
+        """Stream crawl_iter records straight into Excel files without collecting them
+        
+        Suited to backfills too large for ``crawl`` plus ``save_results``;
+        returns the written file paths. Articles are recorded as seen once
+        the files are written.
+        """
+        self._pending_seen.clear()
+        result_dir = Config.ensure_result_dir()
+        paths = FileUtils.save_to_excel_stream(self.crawl_iter(query, max_pages, **kwargs), query, result_dir)
+        self.commit_seen()
+        return paths
     
     def get_results_count(self) -> int:
         """Get number of collected results"""
         return len(self.results)
     
     def clear_results(self):
-        """Clear collected results"""
+        """Clear collected results (and forget the unsaved ones pending as seen)"""
         self.results.clear()
+        self._pending_seen.clear()
+    
+    @staticmethod
+    def is_before(record: Article, since: Optional[float]) -> bool:
+        """Whether a record was published before the ``since`` cutoff (UTC epoch seconds)"""
+        return since is not None and record.timestamp is not None and record.timestamp < since
+    
+    def crawl(self, query: str, max_pages: int = 5, **kwargs) -> List[Article]:
+        """Main crawling method: collect every record of crawl_iter into self.results"""
+        self.clear_results()
+        self.results.extend(self.crawl_iter(query, max_pages, **kwargs))
+        return self.results
     
     @abstractmethod
-    def crawl(self, query: str, max_pages: int = 5, **kwargs) -> List[Dict[str, Any]]:
-        """Main crawling method - must be implemented by subclasses"""
+    def crawl_iter(self, query: str, max_pages: int = 5, **kwargs) -> Iterator[Article]:
+        """Yield validated article records as each page or feed is parsed - must be implemented by subclasses
+        
+        ``since`` (a datetime or UTC epoch seconds) skips older articles.
+        """
         pass
     
     @abstractmethod
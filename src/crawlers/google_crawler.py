@@ -1,20 +1,32 @@
-import re
+import math
+import sys
+from concurrent.futures import ThreadPoolExecutor, wait
 from urllib.parse import quote, unquote, urlparse
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
 from .base_crawler import BaseCrawler
 from ..config import Config
-from ..utils import DateUtils, TextUtils
+from ..models import Article, to_timestamp
+from ..network import FeedCache, get_feed_cache, get_redirect_cache
+from ..parsers.google_rss import (
+    build_rss_record, extract_source_from_title, iter_rss_records, parse_rss_feed, parse_rss_feed_soup
+)
+from ..utils import FileUtils, GoogleNewsDecoder, get_publisher_registry
 
 class GoogleNewsCrawler(BaseCrawler):
     def __init__(self):
         super().__init__()
         self.base_rss_url = Config.GOOGLE_RSS_BASE_URL
+        self.redirect_cache = get_redirect_cache()
+        self.feed_cache = get_feed_cache()
+        self.publishers = get_publisher_registry()
         
     def get_source_name(self) -> str:
         return "Google News"
     
+    def get_base_url(self) -> str:
+        return self.base_rss_url
+    
     def build_rss_url(self, query: str, language: str = 'ko', region: str = 'KR') -> str:
         """Build Google News RSS URL"""
         encoded_query = quote(query)
@@ -27,7 +39,18 @@ class GoogleNewsCrawler(BaseCrawler):
             
         return url
     
-    def extract_real_url(self, google_url: str) -> str:
+    def needs_resolution(self, url: str) -> bool:
+        """Check whether a link is a Google redirect that must be resolved"""
+        if not url:
+            return False
+        return 'google.com/url?q=' in url or ('news.google.com' in url and '/articles/' in url)
+    
+    @staticmethod
+    def redirect_circuit(url: str) -> str:
+        """Circuit breaker name for redirect lookups on a host, apart from its feed requests"""
+        return f"{urlparse(url).netloc} (redirects)"
+    
+    def extract_real_url(self, google_url: str, timeout: Optional[float] = None) -> str:
         """Extract real URL from Google redirect URL"""
         if not google_url:
             return ""
@@ -41,128 +64,232 @@ class GoogleNewsCrawler(BaseCrawler):
                 pass
         
         if 'news.google.com' in google_url and '/articles/' in google_url:
-            # For Google News article URLs, try to extract the original URL
+            # Most article ids embed the publisher URL and decode without a request
+            decoded_url = GoogleNewsDecoder.decode(google_url)
+            if decoded_url:
+                return decoded_url
+            
+            cached_url = self.redirect_cache.get(google_url)
+            if cached_url:
+                return cached_url
+            
+            # For Google News article URLs, try to extract the original URL. Slow
+            # lookups have their own breaker so they cannot open the feed host's
             try:
-                response = self.make_request(google_url, use_rss_headers=True)
+                response = self.make_request(google_url, use_rss_headers=True,
+                                             timeout=timeout, max_retries=1 if timeout else None,
+                                             circuit=self.redirect_circuit(google_url))
                 if response and response.url != google_url:
+                    self.redirect_cache.set(google_url, response.url)
                     return response.url
             except:
                 pass
         
         return google_url
     
-    def extract_source_from_title(self, title: str) -> tuple:
-        """Extract source and clean title from title string"""
-        if not title:
-            return "", ""
+    def known_link(self, google_url: str) -> str:
+        """Publisher URL of a Google link if known without a request, else the link itself"""
+        return GoogleNewsDecoder.decode(google_url) or self.redirect_cache.get(google_url) or google_url
+    
+    def resolve_links(self, links: List[str], timeout: Optional[float] = None,
+                      max_workers: Optional[int] = None) -> List[str]:
+        """Resolve a batch of redirect links concurrently, keeping originals on failure"""
+        timeout = timeout or Config.GOOGLE_RESOLVE_TIMEOUT
+        max_workers = max_workers or Config.GOOGLE_RESOLVE_WORKERS
         
-        # Pattern: "Title - Source"
-        if ' - ' in title:
-            parts = title.rsplit(' - ', 1)
-            if len(parts) == 2:
-                return parts[0].strip(), parts[1].strip()
+        resolved = list(links)
+        pending = []
+        for i, link in enumerate(links):
+            if not self.needs_resolution(link):
+                continue
+            
+            # Decode offline where possible so only opaque ids reach the pool
+            decoded_url = GoogleNewsDecoder.decode(link)
+            if decoded_url:
+                resolved[i] = decoded_url
+            else:
+                pending.append(i)
         
-        # Pattern: "Title | Source"
-        if ' | ' in title:
-            parts = title.rsplit(' | ', 1)
-            if len(parts) == 2:
-                return parts[0].strip(), parts[1].strip()
+        if not pending:
+            return resolved
         
-        return title.strip(), ""
-    
-    def parse_rss_feed(self, rss_content: str) -> List[Dict[str, Any]]:
-        """Parse RSS feed content"""
+        # Every link gets its own timeout; the batch waits at most one timeout per wave
+        deadline = timeout * (math.ceil(len(pending) / max_workers) + 1)
+        
+        pool = ThreadPoolExecutor(max_workers=min(max_workers, len(pending)))
         try:
-            soup = BeautifulSoup(rss_content, 'xml')
-            items = soup.find_all('item')
+            futures = {
+                pool.submit(self.extract_real_url, links[i], timeout): i
+                for i in pending
+            }
+            done, not_done = wait(futures, timeout=deadline)
             
-            results = []
-            for item in items:
+            for future in done:
                 try:
-                    title_elem = item.find('title')
-                    link_elem = item.find('link')
-                    pub_date_elem = item.find('pubDate')
-                    description_elem = item.find('description')
-                    
-                    if not title_elem or not link_elem:
-                        continue
-                    
-                    raw_title = TextUtils.extract_text_from_element(title_elem)
-                    clean_title, source = self.extract_source_from_title(raw_title)
-                    
-                    raw_link = TextUtils.extract_text_from_element(link_elem)
-                    real_link = self.extract_real_url(raw_link)
-                    
-                    # Extract source from URL if not found in title
-                    if not source:
-                        source = TextUtils.extract_domain_from_url(real_link)
-                        source = TextUtils.normalize_source_name(source)
-                    
-                    pub_date = DateUtils.parse_rss_date(
-                        TextUtils.extract_text_from_element(pub_date_elem)
-                    )
-                    
-                    content = TextUtils.extract_text_from_element(description_elem)
-                    content = TextUtils.truncate_text(content, 300)
-                    
-                    result = {
-                        'title': clean_title,
-                        'link': real_link,
-                        'source': source,
-                        'date': pub_date,
-                        'content': content
-                    }
-                    
-                    results.append(result)
-                    
+                    resolved[futures[future]] = future.result()
                 except Exception as e:
-                    print(f"Error parsing RSS item: {e}")
-                    continue
+                    print(f"Error resolving link: {e}")
             
-            return results
+            if not_done:
+                print(f"Link resolution timed out for {len(not_done)} links")
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        return resolved
+    
+    def resolve_results(self, results: List[Article]) -> List[Article]:
+        """Resolve the links of parsed feed items and fill in missing sources"""
+        links = self.resolve_links([result.link for result in results])
+        
+        stats = self.redirect_cache.stats()
+        print(f"Redirect cache: {stats['hits']} hits, {stats['misses']} misses")
+        
+        for result, real_link in zip(results, links):
+            result.link = real_link
             
-        except Exception as e:
-            print(f"Error parsing RSS feed: {e}")
-            return []
+            # Canonicalise the source from the title, or take it from the URL
+            if result.source:
+                result.source = sys.intern(self.publishers.canonical_name(result.source))
+            else:
+                result.source = sys.intern(self.publishers.publisher_for_url(real_link))
+        
+        return results
+    
+    def extract_source_from_title(self, title: str) -> tuple:
+        """Extract source and clean title from title string"""
+        return extract_source_from_title(title)
+    
+    def build_rss_record(self, fields: Dict[str, str]) -> Optional[Article]:
+        """Build an article record from the raw fields of one feed item"""
+        return build_rss_record(fields)
+    
+    def iter_rss_items(self, rss_content, max_results: Optional[int] = None) -> Iterator[Article]:
+        """Stream article records from a feed, stopping after ``max_results`` are accepted"""
+        return iter_rss_records(rss_content, max_results)
+    
+    def parse_rss_feed(self, rss_content, max_results: Optional[int] = None) -> List[Article]:
+        """Parse RSS feed content"""
+        return parse_rss_feed(rss_content, max_results)
+    
+    def parse_rss_feed_soup(self, rss_content: str) -> List[Article]:
+        """Parse RSS feed content with BeautifulSoup (lenient, builds the whole tree)"""
+        return parse_rss_feed_soup(rss_content)
     
-    def crawl_rss(self, query: str, language: str = 'ko', max_results: int = 100) -> List[Dict[str, Any]]:
+    def crawl_rss(self, query: str, language: str = 'ko', max_results: int = 100) -> List[Article]:
         """Crawl Google News via RSS"""
         rss_url = self.build_rss_url(query, language)
         print(f"Fetching RSS from: {rss_url}")
         
-        response = self.make_request(rss_url, use_rss_headers=True)
+        cached = self.feed_cache.get(self.feed_cache_key(rss_url, max_results))
+        response = self.make_request(
+            rss_url, headers=FeedCache.conditional_headers(cached), use_rss_headers=True
+        )
+        return self.process_rss_response(response, max_results, rss_url, cached)
+    
+    @staticmethod
+    def feed_cache_key(rss_url: str, max_results: Optional[int]) -> str:
+        """Feed cache key; parsing stops at max_results, so the limit is part of the key"""
+        return f"{rss_url}#max_results={max_results or 0}"
+    
+    def process_rss_response(self, response, max_results: int = 100,
+                             rss_url: Optional[str] = None,
+                             cached: Optional[Dict[str, Any]] = None,
+                             parsed: Optional[List[Article]] = None) -> List[Article]:
+        """Parse a fetched RSS response and apply the result limit
+        
+        A 304 answer to a conditional request reuses the cached item list
+        without parsing; ``parsed`` carries items a parse pipeline produced.
+        """
         if not response:
             print("Failed to fetch RSS feed")
             return []
         
-        results = self.parse_rss_feed(response.text)
+        not_modified = response.status_code == 304 and cached is not None
+        if rss_url:
+            self.feed_cache.record(not_modified)
+        
+        if not_modified:
+            print("RSS feed not modified, reusing cached items")
+            results = [Article.from_dict(item) for item in cached['items']]
+        else:
+            # Parsing stops at max_results so no work is spent on dropped items
+            if parsed is None:
+                parsed = self.parse_rss_feed(response.content, max_results)
+            results = parsed
+            if rss_url:
+                self.feed_cache.store(
+                    self.feed_cache_key(rss_url, max_results), response,
+                    [dict(result.to_dict(), timestamp=result.timestamp) for result in results]
+                )
         
-        # Limit results
-        if max_results and len(results) > max_results:
-            results = results[:max_results]
+        # Known articles are dropped before their redirects are resolved
+        if self.seen_index is not None:
+            results = self.drop_seen(results, [self.known_link(result.link) for result in results])
+        results = self.resolve_results(results)
         
         print(f"Found {len(results)} articles")
         return results
     
+    def crawl_rss_many(self, queries: List[str], language: str = 'ko',
+                       max_results: int = 100) -> Dict[str, List[Article]]:
+        """Crawl several queries, fetching their RSS feeds concurrently"""
+        self.retry_budget.reset()
+        
+        rss_urls = [self.build_rss_url(query, language) for query in queries]
+        print(f"Fetching {len(rss_urls)} RSS feeds concurrently")
+        
+        cached_entries = [
+            self.feed_cache.get(self.feed_cache_key(rss_url, max_results)) for rss_url in rss_urls
+        ]
+        responses = self.fetch_many(
+            rss_urls,
+            use_rss_headers=True,
+            url_headers=[FeedCache.conditional_headers(cached) for cached in cached_entries]
+        )
+        
+        # Hand the feed bodies to the parse workers before resolving links in this process
+        parse_futures = [
+            self.parse_pipeline.submit('google_rss', response.content, max_results=max_results)
+            if self.parse_pipeline and response and response.status_code != 304 else None
+            for response in responses
+        ]
+        
+        results = {}
+        for query, rss_url, response, cached, future in zip(
+                queries, rss_urls, responses, cached_entries, parse_futures):
+            parsed = future.result() if future else None
+            results[query] = self.process_rss_response(response, max_results, rss_url, cached, parsed)
+        return results
+    
     def crawl_with_time_range(self, query: str, time_range: str = '1d', 
-                             language: str = 'ko', max_results: int = 100) -> List[Dict[str, Any]]:
+                             language: str = 'ko', max_results: int = 100) -> List[Article]:
         """Crawl with specific time range"""
         # Add time range to query
         time_query = f"{query} when:{time_range}"
         return self.crawl_rss(time_query, language, max_results)
     
-    def crawl(self, query: str, max_pages: int = 1, **kwargs) -> List[Dict[str, Any]]:
-        """Main crawling method"""
+    def crawl_iter(self, query: str, max_pages: int = 1, **kwargs) -> Iterator[Article]:
+        """Yield validated records of the query's feed once it is parsed and resolved"""
         language = kwargs.get('language', 'ko')
         time_range = kwargs.get('time_range', '1d')
         max_results = kwargs.get('max_results', 100)
+        since = to_timestamp(kwargs.get('since'))
         
-        self.clear_results()
+        self.retry_budget.reset()
         
         if time_range:
             results = self.crawl_with_time_range(query, time_range, language, max_results)
         else:
             results = self.crawl_rss(query, language, max_results)
         
-        self.results.extend(results)
-        return self.results
\ No newline at end of file
+        records = [
+            record for record in (FileUtils.validate_item(item, query) for item in results)
+            if record and not self.is_before(record, since)
+        ]
+        yield from self.skip_seen(records)
+        
+        self.report_crawl_stats()
+    
+    def crawl(self, query: str, max_pages: int = 1, **kwargs) -> List[Article]:
+        """Main crawling method"""
+        return super().crawl(query, max_pages, **kwargs)
\ No newline at end of file
@@ -1,19 +1,28 @@
+import asyncio
 from urllib.parse import quote
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any
+from typing import List, Iterator, Optional
 
 from .base_crawler import BaseCrawler
 from ..config import Config
-from ..utils import DateUtils, TextUtils
+from ..models import Article, to_timestamp
+from ..network import CircuitOpenError
+from ..parsers import NaverSerpParser, build_naver_record, build_naver_records
+from ..utils import FileUtils
 
 class NaverNewsCrawler(BaseCrawler):
-    def __init__(self):
+    def __init__(self, fast_parse: Optional[bool] = None):
         super().__init__()
         self.base_url = Config.NAVER_BASE_URL
+        self.fast_parse = Config.NAVER_FAST_PARSE if fast_parse is None else fast_parse
+        self.serp_parser = NaverSerpParser()
         
     def get_source_name(self) -> str:
         return "Naver News"
     
+    def get_base_url(self) -> str:
+        return self.base_url
+    
     def build_search_url(self, query: str, page: int = 1, sort: str = '0', 
                         start_date: str = '', end_date: str = '') -> str:
         """Build Naver news search URL"""
@@ -36,8 +45,11 @@ class NaverNewsCrawler(BaseCrawler):
         param_string = '&'.join([f"{k}={quote(str(v))}" for k, v in params.items()])
         return f"{self.base_url}?{param_string}"
     
-    def parse_search_results(self, html_content: str) -> List[Dict[str, Any]]:
+    def parse_search_results(self, html_content: str) -> List[Article]:
         """Parse Naver search results page"""
+        if self.fast_parse:
+            return self.serp_parser.parse(html_content)
+        
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
             
@@ -47,119 +59,147 @@ class NaverNewsCrawler(BaseCrawler):
                 # Try alternative selectors
                 news_items = soup.select('li.bx') or soup.select('div.group_news')
             
-            results = []
+            rows = []
             for item in news_items:
                 try:
-                    result = self.extract_article_info(item)
-                    if result:
-                        results.append(result)
+                    rows.append(self.extract_article_elements(item))
                 except Exception as e:
                     print(f"Error parsing news item: {e}")
                     continue
             
-            return results
+            return build_naver_records(rows)
             
         except Exception as e:
             print(f"Error parsing search results: {e}")
             return []
     
-    def extract_article_info(self, item) -> Dict[str, Any]:
+    def extract_article_elements(self, item) -> tuple:
+        """Find the title, source, date and content elements of a news item"""
+        # Title and link
+        title_elem = (item.select_one('a.news_tit') or 
+                     item.select_one('a.tit') or 
+                     item.select_one('.tit a'))
+        
+        # Source (news agency)
+        source_elem = (item.select_one('.press') or 
+                      item.select_one('.cp') or 
+                      item.select_one('.info_group .press'))
+        
+        # Date
+        date_elem = (item.select_one('.info_group .info') or 
+                    item.select_one('.info') or 
+                    item.select_one('.date'))
+        
+        # Content summary
+        content_elem = (item.select_one('.news_dsc') or 
+                       item.select_one('.dsc') or 
+                       item.select_one('.api_txt_lines'))
+        
+        return title_elem, source_elem, date_elem, content_elem
+    
+    def extract_article_info(self, item) -> Optional[Article]:
         """Extract article information from news item element"""
         try:
-            # Title and link
-            title_elem = (item.select_one('a.news_tit') or 
-                         item.select_one('a.tit') or 
-                         item.select_one('.tit a'))
-            
-            if not title_elem:
-                return None
-            
-            title = TextUtils.extract_text_from_element(title_elem)
-            link = title_elem.get('href', '')
-            
-            if not title or not link:
-                return None
-            
-            # Source (news agency)
-            source_elem = (item.select_one('.press') or 
-                          item.select_one('.cp') or 
-                          item.select_one('.info_group .press'))
-            
-            source = TextUtils.extract_text_from_element(source_elem) if source_elem else ""
-            source = TextUtils.normalize_source_name(source)
-            
-            # Date
-            date_elem = (item.select_one('.info_group .info') or 
-                        item.select_one('.info') or 
-                        item.select_one('.date'))
-            
-            date_str = TextUtils.extract_text_from_element(date_elem) if date_elem else ""
-            date = DateUtils.parse_relative_date(date_str)
-            
-            # Content summary
-            content_elem = (item.select_one('.news_dsc') or 
-                           item.select_one('.dsc') or 
-                           item.select_one('.api_txt_lines'))
-            
-            content = TextUtils.extract_text_from_element(content_elem) if content_elem else ""
-            content = TextUtils.truncate_text(content, 200)
-            
-            return {
-                'title': title,
-                'link': link,
-                'source': source,
-                'date': date,
-                'content': content
-            }
-            
+            return build_naver_record(*self.extract_article_elements(item))
         except Exception as e:
             print(f"Error extracting article info: {e}")
             return None
     
     def crawl_page(self, query: str, page: int, sort: str = '0', 
-                   start_date: str = '', end_date: str = '') -> List[Dict[str, Any]]:
+                   start_date: str = '', end_date: str = '') -> List[Article]:
         """Crawl a single page of results"""
         url = self.build_search_url(query, page, sort, start_date, end_date)
         print(f"Crawling page {page}: {url}")
         
         response = self.make_request(url)
+        return self._parse_page_response(response, page)
+    
+    async def crawl_page_async(self, query: str, page: int, sort: str = '0',
+                               start_date: str = '', end_date: str = '') -> List[Article]:
+        """Crawl a single page of results, paced by the shared host rate controller"""
+        url = self.build_search_url(query, page, sort, start_date, end_date)
+        print(f"Crawling page {page}: {url}")
+        
+        response = await self.make_request_async(url)
+        
+        parsed = None
+        if response and self.fast_parse and self.parse_pipeline:
+            # Parse in a worker process while this loop keeps fetching other pages
+            parsed = await self.parse_pipeline.parse_async('naver_serp', response.text)
+        return self._parse_page_response(response, page, parsed)
+    
+    def _parse_page_response(self, response, page: int,
+                             parsed: Optional[List[Article]] = None) -> List[Article]:
+        """Parse a fetched results page, unless a parse pipeline already has"""
         if not response:
             print(f"Failed to fetch page {page}")
             return []
         
-        results = self.parse_search_results(response.text)
+        results = parsed if parsed is not None else self.parse_search_results(response.text)
         print(f"Page {page}: Found {len(results)} articles")
-        
-        # Add delay between requests
-        self.add_random_delay(1.0, 3.0)
-        
         return results
     
-    def crawl(self, query: str, max_pages: int = 5, **kwargs) -> List[Dict[str, Any]]:
-        """Main crawling method"""
+    def crawl_iter(self, query: str, max_pages: int = 5, **kwargs) -> Iterator[Article]:
+        """Yield validated records page by page while later pages are fetched concurrently
+        
+        All pages are dispatched up front on a private event loop that only
+        runs while the next page is awaited, so a slow consumer also pauses
+        dispatching. Closing the generator early cancels the remaining pages.
+        """
         sort = kwargs.get('sort', '0')  # 0: 관련성, 1: 최신순
         start_date = kwargs.get('start_date', '')
         end_date = kwargs.get('end_date', '')
+        since = to_timestamp(kwargs.get('since'))
         
-        self.clear_results()
+        self.retry_budget.reset()
         
         print(f"Starting Naver news crawl for query: '{query}'")
         print(f"Max pages: {max_pages}, Sort: {sort}")
         
-        for page in range(1, max_pages + 1):
-            try:
-                page_results = self.crawl_page(query, page, sort, start_date, end_date)
+        loop = asyncio.new_event_loop()
+        tasks = [
+            loop.create_task(
+                self.crawl_page_async(query, page, sort, start_date, end_date)
+            )
+            for page in range(1, max_pages + 1)
+        ]
+        
+        total = 0
+        try:
+            for page, task in enumerate(tasks, start=1):
+                try:
+                    page_results = loop.run_until_complete(task)
+                except CircuitOpenError:
+                    raise
+                except Exception as e:
+                    print(f"Error crawling page {page}: {e}")
+                    continue
                 
                 if not page_results:
                     print(f"No results found on page {page}, stopping crawl")
                     break
                 
-                self.results.extend(page_results)
-                print(f"Total articles collected: {len(self.results)}")
+                records = [
+                    record for record in (FileUtils.validate_item(item, query) for item in page_results)
+                    if record and not self.is_before(record, since)
+                ]
+                for record in self.skip_seen(records):
+                    total += 1
+                    yield record
+                print(f"Total articles collected: {total}")
                 
-            except Exception as e:
-                print(f"Error crawling page {page}: {e}")
-                continue
+                if since is not None and sort == '1' and not records:
+                    # Newest-first results: every later page is older still
+                    print(f"Page {page} is older than the since cutoff, stopping crawl")
+                    break
+        finally:
+            # Cancel higher pages that are still waiting or in flight
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
         
-        print(f"Naver crawl completed. Total articles: {len(self.results)}")
-        return self.results
\ No newline at end of file
+        print(f"Naver crawl completed. Total articles: {total}")
+        self.report_crawl_stats()
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .article import Article, ArticleBatch, to_timestamp
+
+__all__ = ['Article', 'ArticleBatch', 'to_timestamp']
\ No newline at end of file
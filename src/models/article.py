@@ -0,0 +1,267 @@
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from ..config import Config
+
+DATE_FORMAT = '%Y.%m.%d.'
+
+FIELDS = ('title', 'link', 'source', 'date', 'content')
+
+def to_timestamp(value: Union[datetime, float, int, None]) -> Optional[float]:
+    """UTC epoch seconds of a datetime (naive means UTC) or a number"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float(value)
+
+def parse_date(date_str: str) -> Optional[datetime]:
+    """Parse a ``'%Y.%m.%d.'`` day of a former dict record as a Korean calendar day"""
+    for fmt in (DATE_FORMAT, '%y.%m.%d.'):
+        try:
+            published = datetime.strptime(date_str.rstrip('.') + '.', fmt)
+        except ValueError:
+            continue
+        if published.year >= 100:
+            return published.replace(tzinfo=Config.TIMEZONE)
+    return None
+
+class Article:
+    """One crawled news article
+    
+    Slotted, with interned ``source`` and ``query`` strings, since large
+    crawls hold many records that share a handful of publishers. The
+    publication time is kept as UTC epoch seconds, so time windows and
+    ordering are plain number comparisons; ``date`` renders it as a Korean
+    calendar day for export. Supports read access by key
+    (``article['title']``) for code written against the former dict records.
+    ``cluster_id`` names the story an article belongs to once near-duplicate
+    detection has run.
+    """
+    
+    __slots__ = ('title', 'link', 'source', 'timestamp', 'content', 'query', 'cluster_id')
+    
+    def __init__(self, title: str, link: str, source: str = '',
+                 published: Union[datetime, float, None] = None, content: str = '', query: str = '',
+                 cluster_id: Optional[int] = None):
+        self.title = title
+        self.link = link
+        self.source = sys.intern(source)
+        self.timestamp = to_timestamp(published)
+        self.content = content
+        self.query = sys.intern(query)
+        self.cluster_id = cluster_id
+    
+    @classmethod
+    def from_dict(cls, item: Dict[str, Any], query: str = '') -> 'Article':
+        published = item.get('timestamp')
+        if published is None:
+            published = parse_date(str(item.get('date', '')).strip())
+        return cls(
+            str(item.get('title', '')).strip(),
+            str(item.get('link', '')).strip(),
+            str(item.get('source', '')).strip(),
+            published,
+            str(item.get('content', '')).strip(),
+            query or item.get('query', '')
+        )
+    
+    @property
+    def published(self) -> Optional[datetime]:
+        """Publication time as an aware UTC datetime"""
+        if self.timestamp is None:
+            return None
+        return datetime.fromtimestamp(self.timestamp, timezone.utc)
+    
+    @property
+    def date(self) -> str:
+        if self.timestamp is None:
+            return ''
+        return datetime.fromtimestamp(self.timestamp, Config.TIMEZONE).strftime(DATE_FORMAT)
+    
+    def __getitem__(self, key: str):
+        if key not in FIELDS and key not in self.__slots__ and key != 'published':
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        if key in ('source', 'query'):
+            value = sys.intern(value)
+        setattr(self, key, value)
+    
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def keys(self):
+        return FIELDS
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in FIELDS}
+    
+    def _key(self) -> tuple:
+        return (self.title, self.link, self.source, self.timestamp, self.content, self.query)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Article):
+            return NotImplemented
+        return self._key() == other._key()
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"Article(title={self.title!r}, source={self.source!r}, date={self.date!r})"
+
+class ArticleBatch:
+    """Columnar store of articles for bulk operations and export
+    
+    Each field is kept as its own column; timestamps are packed into a
+    float array of UTC epoch seconds (NaN when unknown). Story cluster ids
+    are exported only when near-duplicate detection assigned them.
+    """
+    
+    def __init__(self, articles: Iterable[Article] = ()):
+        self.titles: List[str] = []
+        self.links: List[str] = []
+        self.sources: List[str] = []
+        self.timestamps = array('d')
+        self.contents: List[str] = []
+        self.queries: List[str] = []
+        self.cluster_ids: List[Optional[int]] = []
+        self.extend(articles)
+    
+    def append(self, article: Article):
+        self.titles.append(article.title)
+        self.links.append(article.link)
+        self.sources.append(article.source)
+        self.timestamps.append(float('nan') if article.timestamp is None else article.timestamp)
+        self.contents.append(article.content)
+        self.queries.append(article.query)
+        self.cluster_ids.append(article.cluster_id)
+    
+    def extend(self, articles: Iterable[Article]):
+        for article in articles:
+            self.append(article)
+    
+    def __len__(self) -> int:
+        return len(self.titles)
+    
+    def _timestamp(self, i: int) -> Optional[float]:
+        timestamp = self.timestamps[i]
+        return None if timestamp != timestamp else timestamp
+    
+    def __getitem__(self, i: int) -> Article:
+        return Article(self.titles[i], self.links[i], self.sources[i],
+                       self._timestamp(i), self.contents[i], self.queries[i], self.cluster_ids[i])
+    
+    def __iter__(self) -> Iterator[Article]:
+        for i in range(len(self)):
+            yield self[i]
+    
+    def _take(self, indices: Iterable[int]) -> 'ArticleBatch':
+        batch = ArticleBatch()
+        for i in indices:
+            batch.titles.append(self.titles[i])
+            batch.links.append(self.links[i])
+            batch.sources.append(self.sources[i])
+            batch.timestamps.append(self.timestamps[i])
+            batch.contents.append(self.contents[i])
+            batch.queries.append(self.queries[i])
+            batch.cluster_ids.append(self.cluster_ids[i])
+        return batch
+    
+    def between(self, start: Union[datetime, float, None] = None,
+                end: Union[datetime, float, None] = None) -> 'ArticleBatch':
+        """Articles published in [start, end); articles without a timestamp are dropped"""
+        start = to_timestamp(start)
+        end = to_timestamp(end)
+        lower = float('-inf') if start is None else start
+        upper = float('inf') if end is None else end
+        return self._take(i for i, timestamp in enumerate(self.timestamps) if lower <= timestamp < upper)
+    
+    def sort_by_time(self, newest_first: bool = True) -> 'ArticleBatch':
+        """Articles ordered by publication time, those without a timestamp last"""
+        known = [i for i, timestamp in enumerate(self.timestamps) if timestamp == timestamp]
+        unknown = [i for i, timestamp in enumerate(self.timestamps) if timestamp != timestamp]
+        known.sort(key=self.timestamps.__getitem__, reverse=newest_first)
+        return self._take(known + unknown)
+    
+    def dates(self) -> List[str]:
+        """Render the timestamp column as Korean ``'%Y.%m.%d.'`` days"""
+        dates = []
+        for timestamp in self.timestamps:
+            if timestamp != timestamp:
+                dates.append('')
+            else:
+                dates.append(datetime.fromtimestamp(timestamp, Config.TIMEZONE).strftime(DATE_FORMAT))
+        return dates
+    
+    def columns(self) -> Dict[str, list]:
+        """Export columns in the order of the former dict records"""
+        columns = {
+            'title': self.titles,
+            'link': self.links,
+            'source': self.sources,
+            'date': self.dates(),
+            'content': self.contents,
+        }
+        if any(cluster_id is not None for cluster_id in self.cluster_ids):
+            columns['cluster_id'] = self.cluster_ids
+        return columns
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        return [article.to_dict() for article in self]
+    
+    def to_dataframe(self):
+        import pandas as pd
+        return pd.DataFrame(self.columns())
+    
+    def to_arrow(self):
+        """Typed Arrow table: UTC microsecond timestamps, dictionary-encoded source and query
+        
+        Needs the optional ``pyarrow`` package.
+        """
+        import pyarrow as pa
+        
+        columns = {
+            'title': pa.array(self.titles, pa.string()),
+            'link': pa.array(self.links, pa.string()),
+            'source': pa.array(self.sources, pa.string()).dictionary_encode(),
+            'published': pa.array(
+                [None if timestamp != timestamp else round(timestamp * 1e6) for timestamp in self.timestamps],
+                pa.timestamp('us', tz='UTC')
+            ),
+            'content': pa.array(self.contents, pa.string()),
+            'query': pa.array(self.queries, pa.string()).dictionary_encode(),
+        }
+        if any(cluster_id is not None for cluster_id in self.cluster_ids):
+            columns['cluster_id'] = pa.array(self.cluster_ids, pa.int64())
+        return pa.table(columns)
+    
+    @classmethod
+    def from_arrow(cls, table) -> 'ArticleBatch':
+        """Rebuild a batch from a table written by ``to_arrow``"""
+        import pyarrow as pa
+        
+        batch = cls()
+        columns = {name: table.column(name).to_pylist() for name in table.column_names if name != 'published'}
+        count = table.num_rows
+        batch.titles = columns['title']
+        batch.links = columns['link']
+        batch.sources = [sys.intern(source or '') for source in columns['source']]
+        batch.timestamps = array('d', (
+            float('nan') if micros is None else micros / 1e6
+            for micros in table.column('published').cast(pa.int64()).to_pylist()
+        ))
+        batch.contents = columns['content']
+        batch.queries = [sys.intern(query or '') for query in columns.get('query', [''] * count)]
+        batch.cluster_ids = columns.get('cluster_id', [None] * count)
+        return batch
\ No newline at end of file
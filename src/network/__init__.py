@@ -0,0 +1,21 @@
+from .rate_limit import TokenBucket, AdaptiveRateController, get_rate_controller, get_rate_metrics
+from .redirect_cache import RedirectCache, get_redirect_cache
+from .feed_cache import FeedCache, get_feed_cache
+from .seen_index import SeenIndex, get_seen_index
+from .seen_filter import BloomFilter, SeenFilter, get_seen_filter
+from .cassette import CassetteAdapter, CassetteMiss
+from .retry import RetryPolicy, RetryBudget
+from .pool import SessionRegistry, get_session_registry
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, get_circuit_breaker, get_circuit_states
+
+__all__ = [
+    'TokenBucket', 'AdaptiveRateController', 'get_rate_controller', 'get_rate_metrics',
+    'RedirectCache', 'get_redirect_cache',
+    'FeedCache', 'get_feed_cache',
+    'SeenIndex', 'get_seen_index',
+    'BloomFilter', 'SeenFilter', 'get_seen_filter',
+    'CassetteAdapter', 'CassetteMiss',
+    'RetryPolicy', 'RetryBudget',
+    'SessionRegistry', 'get_session_registry',
+    'CircuitBreaker', 'CircuitOpenError', 'get_circuit_breaker', 'get_circuit_states',
+]
\ No newline at end of file
@@ -0,0 +1,123 @@
+import gzip
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+class CassetteMiss(requests.exceptions.RequestException):
+    """Raised in replay mode when a request was never recorded"""
+
+class CassetteAdapter(HTTPAdapter):
+    """Transport adapter that records responses to disk or replays them offline
+    
+    Recorded exchanges live in a content-addressed store::
+    
+        <directory>/index/<key[:2]>/<key>.json   request key -> response metadata
+        <directory>/blobs/<sha[:2]>/<sha>.gz     gzip-compressed response bodies
+    
+    The request key covers the method, full URL and conditional validators, so
+    a 304 revalidation is stored separately from the original 200. A replayed
+    conditional request with no recorded revalidation falls back to the
+    unconditional recording, so validators a feed cache kept from the record
+    run do not cause misses. Identical bodies are stored once.
+    """
+    
+    MODES = ('record', 'replay')
+    
+    # Bodies are stored decoded, so transfer framing headers no longer apply
+    DROPPED_HEADERS = ('content-encoding', 'transfer-encoding', 'content-length')
+    KEY_HEADERS = ('If-None-Match', 'If-Modified-Since')
+    
+    def __init__(self, directory, mode: str = 'replay', latency: float = 0.0, **kwargs):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown cassette mode: {mode} (expected one of {self.MODES})")
+        super().__init__(**kwargs)
+        self.directory = Path(directory)
+        self.mode = mode
+        self.latency = latency
+        self.recorded = 0
+        self.replayed = 0
+        self._lock = threading.Lock()
+    
+    def request_key(self, request: requests.PreparedRequest, validators: bool = True) -> str:
+        parts = [request.method or 'GET', request.url]
+        parts.extend(request.headers.get(name, '') if validators else '' for name in self.KEY_HEADERS)
+        return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+    
+    def _index_path(self, key: str) -> Path:
+        return self.directory / 'index' / key[:2] / f"{key}.json"
+    
+    def _blob_path(self, digest: str) -> Path:
+        return self.directory / 'blobs' / digest[:2] / f"{digest}.gz"
+    
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.mode == 'replay':
+            return self._replay(request)
+        
+        response = super().send(request, stream=stream, timeout=timeout,
+                                verify=verify, cert=cert, proxies=proxies)
+        self._record(request, response)
+        return response
+    
+    def _record(self, request, response):
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        key = self.request_key(request)
+        
+        entry = {
+            'method': request.method,
+            'url': request.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {
+                name: value for name, value in response.headers.items()
+                if name.lower() not in self.DROPPED_HEADERS
+            },
+            'body': digest,
+            'recorded_at': time.time(),
+        }
+        
+        blob_path = self._blob_path(digest)
+        index_path = self._index_path(key)
+        with self._lock:
+            if not blob_path.exists():
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                blob_path.write_bytes(gzip.compress(body))
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            index_path.write_text(json.dumps(entry, ensure_ascii=False), encoding='utf-8')
+            self.recorded += 1
+    
+    def _replay(self, request):
+        index_path = self._index_path(self.request_key(request))
+        if not index_path.exists() and any(request.headers.get(name) for name in self.KEY_HEADERS):
+            index_path = self._index_path(self.request_key(request, validators=False))
+        if not index_path.exists():
+            raise CassetteMiss(
+                f"No recorded response for {request.method} {request.url}", request=request
+            )
+        
+        entry = json.loads(index_path.read_text(encoding='utf-8'))
+        body = gzip.decompress(self._blob_path(entry['body']).read_bytes())
+        
+        if self.latency:
+            time.sleep(self.latency)
+        
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = entry['reason']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response._content = body
+        
+        with self._lock:
+            self.replayed += 1
+        return response
\ No newline at end of file
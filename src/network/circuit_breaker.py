@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from ..config import Config
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the host's circuit is open"""
+    
+    def __init__(self, host: str, retry_in: float):
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__(f"Circuit open for {host}, retry in {retry_in:.0f}s")
+
+class CircuitBreaker:
+    """Per-host circuit breaker with closed, open and half-open states
+    
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail fast. Once ``recovery_timeout`` has passed a single trial
+    request is let through (half-open); its outcome closes or re-opens the
+    circuit.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, host: str, failure_threshold: Optional[int] = None,
+                 recovery_timeout: Optional[float] = None):
+        self.host = host
+        self.failure_threshold = failure_threshold or Config.CIRCUIT_FAILURE_THRESHOLD
+        self.recovery_timeout = recovery_timeout or Config.CIRCUIT_RECOVERY_TIMEOUT
+        self.failures = 0
+        self.opened_at = 0.0
+        self._state = self.CLOSED
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    def _current_state(self) -> str:
+        """Get the state, moving open to half-open once the timeout passed (lock held)"""
+        if self._state == self.OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+    
+    def retry_in(self) -> float:
+        """Seconds until the circuit lets a trial request through"""
+        with self._lock:
+            if self._current_state() != self.OPEN:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+    
+    def allows_requests(self) -> bool:
+        """Check whether a request would currently be let through"""
+        with self._lock:
+            state = self._current_state()
+            return state == self.CLOSED or (state == self.HALF_OPEN and not self._trial_in_flight)
+    
+    def before_request(self) -> bool:
+        """Admit a request or raise CircuitOpenError; True if it is the half-open trial"""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return False
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            retry_in = max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+        raise CircuitOpenError(self.host, retry_in)
+    
+    def release_trial(self):
+        """Let another trial through if the admitted one ended without an outcome"""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._trial_in_flight = False
+    
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._state = self.CLOSED
+            self._trial_in_flight = False
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            state = self._current_state()
+            if state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if state != self.OPEN:
+                    print(f"Circuit opened for {self.host} after {self.failures} failures")
+                self._state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for a host"""
+    with _circuit_breakers_lock:
+        if host not in _circuit_breakers:
+            _circuit_breakers[host] = CircuitBreaker(host)
+        return _circuit_breakers[host]
+
+def get_circuit_states() -> Dict[str, str]:
+    """Get the current state of every known host circuit"""
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    return {breaker.host: breaker.state for breaker in breakers}
\ No newline at end of file
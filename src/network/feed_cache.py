@@ -0,0 +1,103 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..config import Config
+
+class FeedCache:
+    """SQLite-backed store of RSS validators and the last parsed item list per feed URL
+    
+    The stored ``ETag``/``Last-Modified`` validators are sent back as
+    ``If-None-Match``/``If-Modified-Since`` so an unchanged feed costs a 304
+    with no body and no parsing.
+    """
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS feeds ('
+            'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, '
+            'items TEXT NOT NULL, updated_at REAL NOT NULL)'
+        )
+        self._conn.commit()
+    
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get the cached entry for a feed URL"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT etag, last_modified, items, updated_at FROM feeds WHERE url = ?', (url,)
+            ).fetchone()
+        
+        if row is None:
+            return None
+        
+        etag, last_modified, items, updated_at = row
+        return {
+            'etag': etag,
+            'last_modified': last_modified,
+            'items': json.loads(items),
+            'updated_at': updated_at,
+        }
+    
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build conditional request headers from a cached entry"""
+        headers = {}
+        if not entry:
+            return headers
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def store(self, url: str, response, items: List[Dict[str, Any]]) -> bool:
+        """Store validators and parsed items, skipping responses without validators"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return False
+        
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO feeds (url, etag, last_modified, items, updated_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (url, etag, last_modified, json.dumps(items, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+        return True
+    
+    def record(self, not_modified: bool):
+        """Count a revalidation as a hit (304) or a miss (full download)"""
+        if not_modified:
+            self.hits += 1
+        else:
+            self.misses += 1
+    
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+_feed_cache: Optional[FeedCache] = None
+_feed_cache_lock = threading.Lock()
+
+def get_feed_cache() -> FeedCache:
+    """Get the process-wide feed cache stored under Config.CACHE_DIR"""
+    global _feed_cache
+    with _feed_cache_lock:
+        if _feed_cache is None:
+            _feed_cache = FeedCache(Config.FEED_CACHE_PATH)
+        return _feed_cache
\ No newline at end of file
@@ -0,0 +1,112 @@
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config import Config
+
+class SessionRegistry:
+    """Process-wide HTTP session whose keep-alive pools are shared by all crawlers
+    
+    Hosts listed in ``Config.HOST_POOL_SETTINGS`` get their own adapter with
+    the configured ``(pool_connections, pool_maxsize)``; every other host uses
+    the default adapter. Counters of pools evicted past ``pool_connections``
+    or closed are kept, so ``stats`` covers every host contacted.
+    """
+    
+    def __init__(self, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None,
+                 host_settings: Optional[Dict[str, tuple]] = None, max_retries=0):
+        self.pool_connections = pool_connections or Config.POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or Config.POOL_MAXSIZE
+        self.host_settings = host_settings if host_settings is not None else Config.HOST_POOL_SETTINGS
+        self.max_retries = max_retries
+        self._adapters = []
+        self._session = None
+        self._lock = threading.Lock()
+        
+        # Counters of pools already evicted or closed
+        self._retired_opened = 0
+        self._retired_requests = 0
+        self._retired_lock = threading.Lock()
+    
+    def _new_adapter(self, pool_connections: int, pool_maxsize: int) -> HTTPAdapter:
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=self.max_retries
+        )
+        pools = adapter.poolmanager.pools
+        pools.dispose_func = self._retiring(pools.dispose_func)
+        self._adapters.append(adapter)
+        return adapter
+    
+    def _retiring(self, dispose_func):
+        """Wrap a pool container's dispose hook to keep the counters of the pools it drops"""
+        def dispose(pool):
+            with self._retired_lock:
+                self._retired_opened += pool.num_connections
+                self._retired_requests += pool.num_requests
+            if dispose_func:
+                dispose_func(pool)
+        return dispose
+    
+    def get_session(self) -> requests.Session:
+        """Get the shared session, creating it on first use"""
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                session.headers.update(Config.DEFAULT_HEADERS)
+                
+                default_adapter = self._new_adapter(self.pool_connections, self.pool_maxsize)
+                session.mount('http://', default_adapter)
+                session.mount('https://', default_adapter)
+                
+                # Longer prefixes win, so host adapters take precedence over the default
+                for host, (pool_connections, pool_maxsize) in self.host_settings.items():
+                    host_adapter = self._new_adapter(pool_connections, pool_maxsize)
+                    session.mount(f'http://{host}', host_adapter)
+                    session.mount(f'https://{host}', host_adapter)
+                
+                self._session = session
+            return self._session
+    
+    def stats(self) -> Dict[str, int]:
+        """Count connections opened versus requests served on reused connections"""
+        with self._retired_lock:
+            opened = self._retired_opened
+            requests_sent = self._retired_requests
+        with self._lock:
+            for adapter in self._adapters:
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    try:
+                        pool = pools[key]
+                    except KeyError:
+                        continue
+                    opened += pool.num_connections
+                    requests_sent += pool.num_requests
+        
+        return {
+            'requests': requests_sent,
+            'connections_opened': opened,
+            'connections_reused': max(0, requests_sent - opened),
+        }
+    
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            self._adapters = []
+
+_session_registry: Optional[SessionRegistry] = None
+_session_registry_lock = threading.Lock()
+
+def get_session_registry() -> SessionRegistry:
+    """Get the process-wide session registry"""
+    global _session_registry
+    with _session_registry_lock:
+        if _session_registry is None:
+            _session_registry = SessionRegistry()
+        return _session_registry
\ No newline at end of file
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+from ..config import Config
+
+class TokenBucket:
+    """Token bucket limiter usable from both threads and asyncio tasks"""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = max(1, int(burst))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Reserve one token and return how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            
+            # Tokens may go negative: each waiter queues behind earlier reservations
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+    
+    def _refund(self):
+        """Return a reserved token that was never used"""
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+    
+    def acquire(self):
+        """Block until a token is available"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Wait until a token is available without blocking the event loop"""
+        wait = self._reserve()
+        if wait <= 0:
+            return
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self._refund()
+            raise
+
+class AdaptiveRateController:
+    """AIMD request-rate controller for one host
+    
+    Healthy responses raise the rate additively; 429/5xx answers, failed
+    requests and latency spikes cut it multiplicatively. The rate paces a
+    token bucket, so callers only ``acquire`` before a request and
+    ``observe`` its outcome afterwards. The rate never exceeds the host's
+    maximum in ``Config.HOST_RATE_LIMITS`` (its configured rate otherwise).
+    """
+    
+    def __init__(self, host: str, initial_rate: Optional[float] = None, burst: Optional[int] = None,
+                 min_rate: Optional[float] = None, max_rate: Optional[float] = None):
+        default_rate, default_burst, default_max_rate = Config.HOST_RATE_LIMITS.get(
+            host, (Config.DEFAULT_REQUESTS_PER_SECOND, Config.DEFAULT_RATE_BURST,
+                   Config.DEFAULT_REQUESTS_PER_SECOND)
+        )
+        self.host = host
+        self.min_rate = min_rate or Config.AIMD_MIN_RATE
+        self.max_rate = max_rate or default_max_rate
+        self.increase = Config.AIMD_INCREASE
+        self.decrease_factor = Config.AIMD_DECREASE_FACTOR
+        self.latency_factor = Config.AIMD_LATENCY_FACTOR
+        self.latency_floor = Config.AIMD_LATENCY_FLOOR
+        
+        self.bucket = TokenBucket(min(initial_rate or default_rate, self.max_rate), burst or default_burst)
+        self.latency_ewma: Optional[float] = None
+        self.decreases = 0
+        self.last_decrease = 0.0
+        self._lock = threading.Lock()
+    
+    @property
+    def rate(self) -> float:
+        return self.bucket.rate
+    
+    def acquire(self):
+        self.bucket.acquire()
+    
+    async def acquire_async(self):
+        await self.bucket.acquire_async()
+    
+    def observe(self, status_code: Optional[int], latency: float):
+        """Adjust the rate from a finished request (``status_code`` None for a failure)"""
+        with self._lock:
+            slow = (
+                self.latency_ewma is not None
+                and latency > max(self.latency_ewma * self.latency_factor, self.latency_floor)
+            )
+            if status_code is not None:
+                # Only successful responses feed the latency baseline
+                self.latency_ewma = latency if self.latency_ewma is None else (
+                    0.8 * self.latency_ewma + 0.2 * latency
+                )
+            
+            if status_code is None or status_code == 429 or status_code >= 500 or slow:
+                self._decrease()
+            else:
+                self._set_rate(self.bucket.rate + self.increase)
+    
+    def _decrease(self):
+        """Multiplicative decrease, at most once per current request interval (lock held)"""
+        now = time.monotonic()
+        if now - self.last_decrease < 1.0 / self.bucket.rate:
+            return
+        self.last_decrease = now
+        self.decreases += 1
+        self._set_rate(self.bucket.rate * self.decrease_factor)
+    
+    def _set_rate(self, rate: float):
+        rate = min(self.max_rate, max(self.min_rate, rate))
+        with self.bucket._lock:
+            # Settle tokens earned at the old rate before switching
+            now = time.monotonic()
+            self.bucket.tokens = min(
+                self.bucket.capacity,
+                self.bucket.tokens + (now - self.bucket.updated) * self.bucket.rate
+            )
+            self.bucket.updated = now
+            self.bucket.rate = rate
+    
+    def metrics(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                'rate': self.bucket.rate,
+                'latency_ewma': self.latency_ewma or 0.0,
+                'decreases': self.decreases,
+            }
+
+_rate_controllers: Dict[str, AdaptiveRateController] = {}
+_rate_controllers_lock = threading.Lock()
+
+def get_rate_controller(host: str) -> AdaptiveRateController:
+    """Get the process-wide adaptive rate controller for a host"""
+    with _rate_controllers_lock:
+        if host not in _rate_controllers:
+            _rate_controllers[host] = AdaptiveRateController(host)
+        return _rate_controllers[host]
+
+def get_rate_metrics() -> Dict[str, Dict[str, float]]:
+    """Get the current request rate and latency of every paced host"""
+    with _rate_controllers_lock:
+        controllers = list(_rate_controllers.values())
+    return {controller.host: controller.metrics() for controller in controllers}
\ No newline at end of file
@@ -0,0 +1,160 @@
+import atexit
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..config import Config
+
+class RedirectCache:
+    """SQLite-backed map from Google News article URLs to publisher URLs
+    
+    Entries expire after ``ttl`` seconds and the least recently used entries
+    are evicted once the cache holds more than ``max_entries`` rows. Hits
+    only note their access time in memory; those times are written in one
+    batch every ``FLUSH_EVERY`` hits, before an eviction and on ``close``.
+    """
+    
+    FLUSH_EVERY = 100
+    
+    def __init__(self, path, ttl: float = None, max_entries: int = None):
+        self.path = Path(path)
+        self.ttl = ttl if ttl is not None else Config.REDIRECT_CACHE_TTL
+        self.max_entries = max_entries or Config.REDIRECT_CACHE_MAX_ENTRIES
+        self.hits = 0
+        self.misses = 0
+        self._accessed: Dict[str, float] = {}
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS redirects ('
+            'url TEXT PRIMARY KEY, resolved TEXT NOT NULL, '
+            'created_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_redirects_accessed ON redirects (accessed_at)'
+        )
+        self._conn.commit()
+        self._size = self._conn.execute('SELECT COUNT(*) FROM redirects').fetchone()[0]
+    
+    def get(self, url: str) -> Optional[str]:
+        """Get the cached publisher URL, or None on a miss or expired entry"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT resolved, created_at FROM redirects WHERE url = ?', (url,)
+            ).fetchone()
+            
+            if row is None:
+                self.misses += 1
+                return None
+            
+            resolved, created_at = row
+            if self.ttl and now - created_at > self.ttl:
+                self._conn.execute('DELETE FROM redirects WHERE url = ?', (url,))
+                self._conn.commit()
+                self._accessed.pop(url, None)
+                self._size -= 1
+                self.misses += 1
+                return None
+            
+            self._accessed[url] = now
+            if len(self._accessed) >= self.FLUSH_EVERY:
+                self._flush_accessed()
+                self._conn.commit()
+            self.hits += 1
+            return resolved
+    
+    def set(self, url: str, resolved: str):
+        """Store a resolved URL, evicting least recently used entries when full"""
+        now = time.time()
+        with self._lock:
+            self._accessed.pop(url, None)
+            cursor = self._conn.execute(
+                'UPDATE redirects SET resolved = ?, created_at = ?, accessed_at = ? WHERE url = ?',
+                (resolved, now, now, url)
+            )
+            if cursor.rowcount == 0:
+                self._conn.execute(
+                    'INSERT INTO redirects (url, resolved, created_at, accessed_at) VALUES (?, ?, ?, ?)',
+                    (url, resolved, now, now)
+                )
+                self._size += 1
+            
+            if self._size > self.max_entries:
+                self._flush_accessed()
+                self._evict(self._size - int(self.max_entries * 0.9))
+            
+            self._conn.commit()
+    
+    def _flush_accessed(self):
+        """Write the access times noted by hits since the last flush (lock must be held)"""
+        if self._accessed:
+            self._conn.executemany(
+                'UPDATE redirects SET accessed_at = ? WHERE url = ?',
+                [(accessed_at, url) for url, accessed_at in self._accessed.items()]
+            )
+            self._accessed.clear()
+    
+    def flush(self):
+        with self._lock:
+            self._flush_accessed()
+            self._conn.commit()
+    
+    def _evict(self, count: int):
+        """Delete the ``count`` least recently used entries (lock must be held)"""
+        self._conn.execute(
+            'DELETE FROM redirects WHERE url IN '
+            '(SELECT url FROM redirects ORDER BY accessed_at LIMIT ?)', (count,)
+        )
+        self._size = self._conn.execute('SELECT COUNT(*) FROM redirects').fetchone()[0]
+    
+    def purge_expired(self) -> int:
+        """Delete all expired entries and return how many were removed"""
+        if not self.ttl:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM redirects WHERE created_at < ?', (time.time() - self.ttl,)
+            )
+            self._conn.commit()
+            self._size -= cursor.rowcount
+            return cursor.rowcount
+    
+    def stats(self) -> Dict[str, float]:
+        """Get hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': self._size,
+        }
+    
+    def close(self):
+        with self._lock:
+            self._flush_accessed()
+            self._conn.commit()
+            self._conn.close()
+    
+    def __len__(self) -> int:
+        return self._size
+
+_redirect_cache: Optional[RedirectCache] = None
+_redirect_cache_lock = threading.Lock()
+
+def get_redirect_cache() -> RedirectCache:
+    """Get the process-wide redirect cache stored under Config.CACHE_DIR
+    
+    Access times of hits still held in memory are written at exit.
+    """
+    global _redirect_cache
+    with _redirect_cache_lock:
+        if _redirect_cache is None:
+            _redirect_cache = RedirectCache(Config.REDIRECT_CACHE_PATH)
+            atexit.register(_redirect_cache.flush)
+        return _redirect_cache
\ No newline at end of file
@@ -0,0 +1,97 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from ..config import Config
+
+class RetryPolicy:
+    """Single retry policy for crawler requests
+    
+    Retries connection errors, timeouts and the statuses in ``RETRY_STATUSES``
+    with jittered exponential backoff. ``Retry-After`` on 429/503 replaces the
+    computed backoff, capped at ``max_retry_after``.
+    """
+    
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    RETRY_AFTER_STATUSES = frozenset({429, 503})
+    
+    def __init__(self, max_attempts: Optional[int] = None, base_delay: Optional[float] = None,
+                 max_delay: Optional[float] = None, jitter: Optional[float] = None,
+                 max_retry_after: Optional[float] = None):
+        self.max_attempts = max_attempts or Config.MAX_RETRIES
+        self.base_delay = base_delay if base_delay is not None else Config.RETRY_DELAY
+        self.max_delay = max_delay if max_delay is not None else Config.RETRY_MAX_DELAY
+        self.jitter = jitter if jitter is not None else Config.RETRY_JITTER
+        self.max_retry_after = max_retry_after if max_retry_after is not None else Config.RETRY_AFTER_MAX
+    
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.RETRY_STATUSES
+    
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given in seconds or as an HTTP date"""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    
+    def get_delay(self, attempt: int, response=None) -> float:
+        """Get the wait before the next attempt (``attempt`` counts from 0)"""
+        if response is not None and response.status_code in self.RETRY_AFTER_STATUSES:
+            retry_after = self.parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        
+        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+class RetryBudget:
+    """Cap on retries across one crawl, with time-spent accounting"""
+    
+    def __init__(self, max_retries: Optional[int] = None):
+        self.max_retries = max_retries if max_retries is not None else Config.RETRY_BUDGET
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        with self._lock:
+            self.retries = 0
+            self.exhausted = 0
+            self.backoff_seconds = 0.0
+            self.failed_attempt_seconds = 0.0
+    
+    def try_spend(self) -> bool:
+        """Take one retry from the budget, returning False when none are left"""
+        with self._lock:
+            if self.retries >= self.max_retries:
+                self.exhausted += 1
+                return False
+            self.retries += 1
+            return True
+    
+    def record_failure(self, seconds: float):
+        """Account the duration of an attempt that will be retried or abandoned"""
+        with self._lock:
+            self.failed_attempt_seconds += seconds
+    
+    def record_backoff(self, seconds: float):
+        with self._lock:
+            self.backoff_seconds += seconds
+    
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                'retries': self.retries,
+                'budget': self.max_retries,
+                'exhausted': self.exhausted,
+                'backoff_seconds': self.backoff_seconds,
+                'failed_attempt_seconds': self.failed_attempt_seconds,
+                'time_spent': self.backoff_seconds + self.failed_attempt_seconds,
+            }
\ No newline at end of file
@@ -0,0 +1,219 @@
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ..config import Config
+
+SNAPSHOT_MAGIC = b'SEENFILTER1\n'
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 64-bit keys (e.g. ``UrlUtils.url_key`` hashes)
+    
+    Sized for ``capacity`` keys at ``error_rate`` false positives; bit
+    positions come from double hashing the two halves of the key, so no
+    further hashing is done per lookup.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float, started_at: Optional[float] = None,
+                 count: int = 0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = count
+        self.started_at = started_at if started_at is not None else time.time()
+    
+    def add(self, key: int):
+        key &= 0xFFFFFFFFFFFFFFFF
+        position, step = key & 0xFFFFFFFF, (key >> 32) | 1
+        size, bits = self.size, self.bits
+        for _ in range(self.hashes):
+            position %= size
+            bits[position >> 3] |= 1 << (position & 7)
+            position += step
+        self.count += 1
+    
+    def __contains__(self, key: int) -> bool:
+        # Stops at the first clear bit, so a miss usually costs one or two probes
+        key &= 0xFFFFFFFFFFFFFFFF
+        position, step = key & 0xFFFFFFFF, (key >> 32) | 1
+        size, bits = self.size, self.bits
+        for _ in range(self.hashes):
+            position %= size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position += step
+        return True
+    
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+class SeenFilter:
+    """Time-partitioned Bloom filter answering "definitely not seen" for URL keys
+    
+    Keys go into the newest generation, which is replaced once it is
+    ``generation_seconds`` old or holds ``capacity`` keys. A generation is
+    dropped once it started more than ``max_generations + 1`` generation
+    lengths ago: its last key then is ``max_generations`` generations old,
+    so a key stays in the filter for as long as an index with that TTL
+    holds it, and memory stays bounded. A miss is exact; a hit must be
+    confirmed by the ``SeenIndex``.
+    """
+    
+    def __init__(self, capacity: int = None, error_rate: float = None,
+                 generation_seconds: float = None, max_generations: int = None):
+        self.capacity = capacity or Config.SEEN_FILTER_CAPACITY
+        self.error_rate = error_rate or Config.SEEN_FILTER_ERROR_RATE
+        self.generation_seconds = generation_seconds or Config.SEEN_FILTER_GENERATION_SECONDS
+        self.max_generations = max_generations or Config.SEEN_FILTER_GENERATIONS
+        self.generations: List[BloomFilter] = []
+        self.saved_at: Optional[float] = None
+        # Newest first_seen taken in by warm; the next warm resumes from it
+        self.loaded_until: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def _current(self, now: float) -> BloomFilter:
+        """Get the generation new keys go into, rotating and expiring as needed (lock must be held)"""
+        horizon = now - self.generation_seconds * (self.max_generations + 1)
+        while self.generations and self.generations[0].started_at < horizon:
+            self.generations.pop(0)
+        
+        if (not self.generations or self.generations[-1].full
+                or now - self.generations[-1].started_at >= self.generation_seconds):
+            self.generations.append(BloomFilter(self.capacity, self.error_rate, now))
+        return self.generations[-1]
+    
+    def add(self, key: int, now: Optional[float] = None):
+        with self._lock:
+            self._current(now if now is not None else time.time()).add(key)
+    
+    def add_many(self, keys: Iterable[int], now: Optional[float] = None):
+        now = now if now is not None else time.time()
+        with self._lock:
+            generation = self._current(now)
+            for key in keys:
+                if generation.full:
+                    generation = self._current(now)
+                generation.add(key)
+    
+    def might_contain(self, key: int) -> bool:
+        """False if the key was certainly not added within the retention window"""
+        for generation in reversed(self.generations):
+            if key in generation:
+                return True
+        return False
+    
+    def might_contain_many(self, keys: Iterable[int]) -> List[bool]:
+        generations = self.generations[::-1]
+        if len(generations) == 1:
+            generation = generations[0]
+            return [key in generation for key in keys]
+        return [any(key in generation for generation in generations) for key in keys]
+    
+    def warm(self, entries: Iterable[tuple]):
+        """Load ``(key, first_seen)`` pairs in first-seen order, e.g. from ``SeenIndex.entries``
+        
+        Keys the target generation already holds are not counted again, so
+        entries overlapping an earlier warm or ``add_many`` are harmless.
+        """
+        with self._lock:
+            for key, first_seen in entries:
+                generation = self._current(first_seen)
+                if key not in generation:
+                    generation.add(key)
+                if self.loaded_until is None or first_seen > self.loaded_until:
+                    self.loaded_until = first_seen
+            # Expire against the present, not the last loaded key
+            self._current(time.time())
+    
+    def snapshot(self, path) -> Path:
+        """Write all generations to ``path`` atomically"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            saved_at = time.time()
+            header = {
+                'saved_at': saved_at,
+                'loaded_until': self.loaded_until,
+                'capacity': self.capacity,
+                'error_rate': self.error_rate,
+                'generation_seconds': self.generation_seconds,
+                'max_generations': self.max_generations,
+                'generations': [
+                    {'started_at': generation.started_at, 'count': generation.count}
+                    for generation in self.generations
+                ],
+            }
+            temp_path = path.with_name(path.name + '.tmp')
+            with open(temp_path, 'wb') as f:
+                f.write(SNAPSHOT_MAGIC)
+                f.write(json.dumps(header).encode('utf-8') + b'\n')
+                for generation in self.generations:
+                    f.write(generation.bits)
+            os.replace(temp_path, path)
+            self.saved_at = saved_at
+        return path
+    
+    @classmethod
+    def restore(cls, path) -> 'SeenFilter':
+        """Load a filter written by ``snapshot``"""
+        with open(path, 'rb') as f:
+            if f.readline() != SNAPSHOT_MAGIC:
+                raise ValueError(f"Not a seen filter snapshot: {path}")
+            header = json.loads(f.readline())
+            seen_filter = cls(header['capacity'], header['error_rate'],
+                              header['generation_seconds'], header['max_generations'])
+            seen_filter.saved_at = header['saved_at']
+            seen_filter.loaded_until = header.get('loaded_until')
+            for entry in header['generations']:
+                generation = BloomFilter(seen_filter.capacity, seen_filter.error_rate,
+                                         entry['started_at'], count=entry['count'])
+                generation.bits = bytearray(f.read(len(generation.bits)))
+                if len(generation.bits) != (generation.size + 7) // 8:
+                    raise ValueError(f"Truncated seen filter snapshot: {path}")
+                seen_filter.generations.append(generation)
+        return seen_filter
+    
+    def stats(self) -> Dict[str, float]:
+        """Get key count, generation count and memory held by the bit arrays"""
+        return {
+            'keys': sum(generation.count for generation in self.generations),
+            'generations': len(self.generations),
+            'bytes': sum(len(generation.bits) for generation in self.generations),
+        }
+    
+    def __len__(self) -> int:
+        return sum(generation.count for generation in self.generations)
+
+_seen_filter: Optional[SeenFilter] = None
+_seen_filter_lock = threading.Lock()
+
+def get_seen_filter() -> SeenFilter:
+    """Get the process-wide seen filter, restored from Config.SEEN_FILTER_PATH
+    
+    Keys the seen index recorded since the newest entry the snapshot took in
+    (or all of them, without one) are loaded on top, so entries other
+    processes wrote meanwhile are not missed; the filter is snapshotted
+    again at exit.
+    """
+    global _seen_filter
+    with _seen_filter_lock:
+        if _seen_filter is None:
+            from .seen_index import get_seen_index
+            path = Config.SEEN_FILTER_PATH
+            try:
+                _seen_filter = SeenFilter.restore(path)
+            except (OSError, ValueError) as e:
+                if path.exists():
+                    print(f"Rebuilding seen filter: {e}")
+                _seen_filter = SeenFilter()
+            _seen_filter.warm(get_seen_index().entries(_seen_filter.loaded_until))
+            atexit.register(_seen_filter.snapshot, path)
+        return _seen_filter
\ No newline at end of file
@@ -0,0 +1,140 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..config import Config
+from ..utils.url_utils import UrlUtils
+
+class SeenIndex:
+    """SQLite-backed set of articles seen in earlier runs, keyed by canonical URL hash
+    
+    Keys are 64-bit hashes of ``UrlUtils.canonicalize`` output, so tracking
+    parameters, mobile hosts and Naver URL variants of one article share a
+    key. Entries older than ``ttl`` seconds are dropped by ``purge_expired``.
+    """
+    
+    # SQLite limits the number of bound parameters per statement
+    BATCH_SIZE = 500
+    
+    def __init__(self, path, ttl: float = None):
+        self.path = Path(path)
+        self.ttl = ttl if ttl is not None else Config.SEEN_INDEX_TTL
+        self.hits = 0
+        self.misses = 0
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS seen (key INTEGER PRIMARY KEY, first_seen REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_seen_first_seen ON seen (first_seen)')
+        self._conn.commit()
+        self._size = self._conn.execute('SELECT COUNT(*) FROM seen').fetchone()[0]
+    
+    @staticmethod
+    def key(url: str) -> int:
+        return UrlUtils.url_key(url)
+    
+    def contains_keys(self, keys: Iterable[int]) -> Set[int]:
+        """Get the subset of ``keys`` already in the index"""
+        keys = list(keys)
+        found = set()
+        with self._lock:
+            for start in range(0, len(keys), self.BATCH_SIZE):
+                batch = keys[start:start + self.BATCH_SIZE]
+                rows = self._conn.execute(
+                    f"SELECT key FROM seen WHERE key IN ({','.join('?' * len(batch))})", batch
+                ).fetchall()
+                found.update(row[0] for row in rows)
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+    
+    def add_keys(self, keys: Iterable[int]) -> int:
+        """Record keys as seen and return how many were new"""
+        now = time.time()
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO seen (key, first_seen) VALUES (?, ?)',
+                ((key, now) for key in keys)
+            )
+            self._conn.commit()
+            added = self._conn.total_changes - before
+            self._size += added
+            return added
+    
+    def contains(self, url: str) -> bool:
+        """Check whether an article URL was seen before"""
+        return bool(self.contains_keys([self.key(url)]))
+    
+    def seen_many(self, urls: Iterable[str]) -> List[bool]:
+        """Check a column of URLs, in input order"""
+        keys = UrlUtils.url_keys(urls)
+        found = self.contains_keys(keys)
+        return [key in found for key in keys]
+    
+    def add(self, url: str) -> bool:
+        """Record an article URL and return whether it was new"""
+        return self.add_keys([self.key(url)]) == 1
+    
+    def add_many(self, urls: Iterable[str]) -> int:
+        return self.add_keys(UrlUtils.url_keys(urls))
+    
+    def entries(self, since: Optional[float] = None) -> Iterator[Tuple[int, float]]:
+        """Iterate ``(key, first_seen)`` pairs in first-seen order, optionally only newer than ``since``"""
+        cursor = self._conn.execute(
+            'SELECT key, first_seen FROM seen WHERE first_seen >= ? ORDER BY first_seen', (since or 0,)
+        )
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(10000)
+            if not rows:
+                break
+            yield from rows
+    
+    def purge_expired(self) -> int:
+        """Delete entries first seen more than ``ttl`` seconds ago"""
+        if not self.ttl:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM seen WHERE first_seen < ?', (time.time() - self.ttl,)
+            )
+            self._conn.commit()
+            self._size -= cursor.rowcount
+            return cursor.rowcount
+    
+    def stats(self) -> Dict[str, float]:
+        """Get hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': self._size,
+        }
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+    
+    def __len__(self) -> int:
+        return self._size
+
+_seen_index: Optional[SeenIndex] = None
+_seen_index_lock = threading.Lock()
+
+def get_seen_index() -> SeenIndex:
+    """Get the process-wide seen-article index stored under Config.CACHE_DIR"""
+    global _seen_index
+    with _seen_index_lock:
+        if _seen_index is None:
+            _seen_index = SeenIndex(Config.SEEN_INDEX_PATH)
+            _seen_index.purge_expired()
+        return _seen_index
\ No newline at end of file
@@ -0,0 +1,9 @@
+from .rss_stream import iter_feed_items
+from .naver_serp import NaverSerpParser, build_naver_record, build_naver_records
+from .google_html import parse_google_search_html
+from .pipeline import ParsePipeline, get_parse_pipeline
+
+__all__ = [
+    'iter_feed_items', 'NaverSerpParser', 'build_naver_record', 'build_naver_records',
+    'parse_google_search_html', 'ParsePipeline', 'get_parse_pipeline'
+]
\ No newline at end of file
@@ -0,0 +1,96 @@
+import re
+from datetime import datetime
+from typing import Callable, List, Optional
+from urllib.parse import unquote, urlparse
+
+from bs4 import BeautifulSoup
+
+from ..models import Article
+from ..utils import DateUtils, TextUtils
+
+# Selector variants ported from google_news_crawling.py, in the order it checks them
+ARTICLE_SELECTORS = ['div.SoaBEf', 'div.xuvV6b', 'div.v7W49e']
+TITLE_SELECTORS = ['div.MBeuO', 'h3', '.DY5T1d']
+SOURCE_SELECTORS = ['div.CEMjEf span', '.vN4Yjc', '.BNeawe.UPmit.AP7Wnd']
+DATE_SELECTOR = 'div.OSrXXb span'
+CONTENT_SELECTOR = 'div.GI74Re'
+
+# Sources are often followed by the age of the article, e.g. "CHOSUNBIZ · 2 hours ago"
+SOURCE_SEPARATORS = [' · ', ' - ', ' | ']
+
+REDIRECT_URL = re.compile(r'url=([^&]+)')
+
+def _select_first(element, selectors: List[str]):
+    for selector in selectors:
+        match = element.select_one(selector)
+        if match is not None:
+            return match
+    return None
+
+def _unwrap_link(link: str) -> str:
+    """Extract the target of a Google ``/url?`` redirect link"""
+    if link.startswith('/url?'):
+        if match := REDIRECT_URL.search(link):
+            return unquote(match.group(1))
+    return link
+
+def build_google_html_record(article, date_parser: Optional[Callable[[str], datetime]] = None) -> Optional[Article]:
+    """Build an article record from one Google search result element"""
+    link_elem = article if article.name == 'a' else article.select_one('a')
+    if link_elem is None or not link_elem.get('href'):
+        return None
+    link = _unwrap_link(link_elem['href'])
+    
+    title_elem = _select_first(article, TITLE_SELECTORS)
+    title = TextUtils.extract_text_from_element(title_elem) if title_elem else ""
+    if not title:
+        return None
+    
+    source_elem = _select_first(article, SOURCE_SELECTORS)
+    if source_elem:
+        source = TextUtils.extract_text_from_element(source_elem)
+        for separator in SOURCE_SEPARATORS:
+            if separator in source:
+                source = source.split(separator)[0].strip()
+                break
+    else:
+        source = urlparse(link).netloc
+        if source.startswith('www.'):
+            source = source[4:]
+    
+    date_elem = article.select_one(DATE_SELECTOR)
+    published = (date_parser or DateUtils.parse_relative_datetime)(
+        TextUtils.extract_text_from_element(date_elem) if date_elem else ""
+    )
+    
+    content_elem = article.select_one(CONTENT_SELECTOR)
+    content = TextUtils.extract_text_from_element(content_elem) if content_elem else ""
+    
+    return Article(title, link, source, published, TextUtils.truncate_text(content, 300))
+
+def parse_google_search_html(html_content) -> List[Article]:
+    """Parse a Google News search results page"""
+    try:
+        soup = BeautifulSoup(html_content, 'lxml')
+        articles = []
+        for selector in ARTICLE_SELECTORS:
+            articles = soup.select(selector)
+            if articles:
+                break
+        
+        date_parser = DateUtils.make_parser()
+        results = []
+        for article in articles:
+            try:
+                result = build_google_html_record(article, date_parser)
+                if result:
+                    results.append(result)
+            except Exception as e:
+                print(f"Error parsing search result: {e}")
+                continue
+        
+        return results
+    
+    except Exception as e:
+        print(f"Error parsing search results: {e}")
+        return []
\ No newline at end of file
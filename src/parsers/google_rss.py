@@ -0,0 +1,125 @@
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from .rss_stream import iter_feed_items
+from ..models import Article
+from ..utils import DateUtils, TextUtils
+
+def extract_source_from_title(title: str) -> tuple:
+    """Extract source and clean title from title string"""
+    if not title:
+        return "", ""
+
+    # Pattern: "Title - Source"
+    if ' - ' in title:
+        parts = title.rsplit(' - ', 1)
+        if len(parts) == 2:
+            return parts[0].strip(), parts[1].strip()
+
+    # Pattern: "Title | Source"
+    if ' | ' in title:
+        parts = title.rsplit(' | ', 1)
+        if len(parts) == 2:
+            return parts[0].strip(), parts[1].strip()
+
+    return title.strip(), ""
+
+def build_rss_record(fields: Dict[str, str],
+                     date_parser: Optional[Callable[[str], datetime]] = None) -> Optional[Article]:
+    """Build an article record from the raw fields of one feed item"""
+    records = build_rss_records([fields], date_parser)
+    return records[0] if records else None
+
+def build_rss_records(items: List[Dict[str, str]],
+                      date_parser: Optional[Callable[[str], datetime]] = None) -> List[Article]:
+    """Build records from the raw fields of several feed items, cleaning each field as one column
+
+    An item that fails to build is reported and skipped; the others are kept.
+    """
+    rows = []
+    for fields in items:
+        try:
+            if 'title' in fields and 'link' in fields:
+                rows.append((fields['title'], fields['link'], fields.get('pubDate', ''),
+                             fields.get('description', '')))
+        except Exception as e:
+            print(f"Error parsing RSS item: {e}")
+
+    # Redirect links are resolved later in a separate batched stage
+    titles = TextUtils.clean_many(row[0] for row in rows)
+    links = TextUtils.clean_many(row[1] for row in rows)
+    date_strs = TextUtils.clean_many(row[2] for row in rows)
+    contents = TextUtils.truncate_many(TextUtils.clean_many(row[3] for row in rows), 300)
+
+    date_parser = date_parser or DateUtils.make_parser(rss=True)
+    results = []
+    for title, link, date_str, content in zip(titles, links, date_strs, contents):
+        try:
+            clean_title, source = extract_source_from_title(title)
+            results.append(Article(clean_title, link, source, date_parser(date_str), content))
+        except Exception as e:
+            print(f"Error parsing RSS item: {e}")
+    return results
+
+def iter_rss_records(rss_content, max_results: Optional[int] = None,
+                     chunk_size: int = 100) -> Iterator[Article]:
+    """Stream article records from a feed, stopping after ``max_results`` are accepted
+
+    Items are built ``chunk_size`` at a time with ``build_rss_records``, and
+    no more items are read than the remaining ``max_results`` needs.
+    """
+    date_parser = DateUtils.make_parser(rss=True)
+    accepted = 0
+    chunk = []
+    for fields in iter_feed_items(rss_content):
+        if 'title' not in fields or 'link' not in fields:
+            continue
+        chunk.append(fields)
+        if len(chunk) < chunk_size and not (max_results and accepted + len(chunk) >= max_results):
+            continue
+
+        records = build_rss_records(chunk, date_parser)
+        chunk = []
+        yield from records
+        accepted += len(records)
+        if max_results and accepted >= max_results:
+            return
+
+    yield from build_rss_records(chunk, date_parser)
+
+def parse_rss_feed(rss_content, max_results: Optional[int] = None) -> List[Article]:
+    """Parse RSS feed content"""
+    try:
+        return list(iter_rss_records(rss_content, max_results))
+    except etree.XMLSyntaxError as e:
+        # Malformed feeds fall back to the lenient BeautifulSoup parser
+        print(f"Streaming RSS parse failed ({e}), falling back to BeautifulSoup")
+        results = parse_rss_feed_soup(rss_content)
+        return results[:max_results] if max_results else results
+
+def parse_rss_feed_soup(rss_content: str) -> List[Article]:
+    """Parse RSS feed content with BeautifulSoup (lenient, builds the whole tree)"""
+    try:
+        soup = BeautifulSoup(rss_content, 'xml')
+
+        items = []
+        for item in soup.find_all('item'):
+            try:
+                fields = {}
+                for name in ('title', 'link', 'pubDate', 'description'):
+                    element = item.find(name)
+                    if element is not None:
+                        fields[name] = element.get_text()
+                items.append(fields)
+            except Exception as e:
+                print(f"Error parsing RSS item: {e}")
+                continue
+
+        return build_rss_records(items)
+
+    except Exception as e:
+        print(f"Error parsing RSS feed: {e}")
+        return []
\ No newline at end of file
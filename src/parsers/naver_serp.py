@@ -0,0 +1,140 @@
+from datetime import datetime
+from typing import Callable, List, Optional
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+
+from ..models import Article
+from ..utils import DateUtils, TextUtils
+
+# Selector variants per field, in the order the original layout checks them
+ITEM_SELECTORS = ['div.news_area', 'li.bx', 'div.group_news']
+TITLE_SELECTORS = ['a.news_tit', 'a.tit', '.tit a']
+SOURCE_SELECTORS = ['.press', '.cp', '.info_group .press']
+DATE_SELECTORS = ['.info_group .info', '.info', '.date']
+CONTENT_SELECTORS = ['.news_dsc', '.dsc', '.api_txt_lines']
+
+# Only the news result container is built into a tree in fast mode
+RESULT_CONTAINER = SoupStrainer(['div', 'ul'], class_=['group_news', 'list_news'])
+
+def _element_text(element) -> str:
+    if element is None:
+        return ""
+    return element.get_text() if hasattr(element, 'get_text') else str(element)
+
+def build_naver_record(title_elem, source_elem, date_elem, content_elem,
+                       date_parser: Optional[Callable[[str], datetime]] = None) -> Optional[Article]:
+    """Build an article record from the elements of one Naver search result"""
+    records = build_naver_records([(title_elem, source_elem, date_elem, content_elem)], date_parser)
+    return records[0] if records else None
+
+def build_naver_records(rows: List[tuple],
+                        date_parser: Optional[Callable[[str], datetime]] = None) -> List[Article]:
+    """Build the records of a page from (title, source, date, content) element rows
+    
+    Each row's text is read on its own, so a malformed result is reported
+    and skipped; each field is then cleaned as one column.
+    """
+    texts = []
+    for title_elem, source_elem, date_elem, content_elem in rows:
+        if not title_elem:
+            continue
+        try:
+            texts.append((
+                _element_text(title_elem), title_elem.get('href', ''), _element_text(source_elem),
+                _element_text(date_elem), _element_text(content_elem)
+            ))
+        except Exception as e:
+            print(f"Error extracting article info: {e}")
+    
+    titles = TextUtils.clean_many(text[0] for text in texts)
+    links = [text[1] for text in texts]
+    sources = TextUtils.normalize_sources(TextUtils.clean_many(text[2] for text in texts))
+    date_strs = TextUtils.clean_many(text[3] for text in texts)
+    contents = TextUtils.truncate_many(TextUtils.clean_many(text[4] for text in texts), 200)
+    
+    date_parser = date_parser or DateUtils.make_parser()
+    results = []
+    for title, link, source, date_str, content in zip(titles, links, sources, date_strs, contents):
+        if not title or not link:
+            continue
+        try:
+            results.append(Article(title, link, source, date_parser(date_str), content))
+        except Exception as e:
+            print(f"Error extracting article info: {e}")
+    return results
+
+class SelectorVariants:
+    """Precompiled selector variants for one field, tried in priority order
+    
+    ``prepare`` drops the variants that match nowhere in a page, so its
+    items only try variants that can match; the first match is the same
+    as trying every variant.
+    """
+    
+    def __init__(self, selectors: List[str]):
+        self.variants = [soupsieve.compile(selector) for selector in selectors]
+        self.active = self.variants
+    
+    def prepare(self, page):
+        self.active = [variant for variant in self.variants if variant.select_one(page) is not None]
+    
+    def select_one(self, element):
+        for variant in self.active:
+            match = variant.select_one(element)
+            if match is not None:
+                return match
+        return None
+
+class NaverSerpParser:
+    """Fast Naver search results parser
+    
+    Builds a tree only for the news result container using the lxml backend,
+    and matches fields with precompiled selectors, skipping the variants
+    that match nowhere on the page. Produces the same records as
+    ``NaverNewsCrawler.parse_search_results``.
+    """
+    
+    def __init__(self, features: str = 'lxml'):
+        self.features = features
+        self.items = [soupsieve.compile(selector) for selector in ITEM_SELECTORS]
+        self.title = SelectorVariants(TITLE_SELECTORS)
+        self.source = SelectorVariants(SOURCE_SELECTORS)
+        self.date = SelectorVariants(DATE_SELECTORS)
+        self.content = SelectorVariants(CONTENT_SELECTORS)
+        self.fields = (self.title, self.source, self.date, self.content)
+    
+    def _select_items(self, soup) -> list:
+        news_items = self.items[0].select(soup)
+        if not news_items:
+            news_items = self.items[1].select(soup) or self.items[2].select(soup)
+        return news_items
+    
+    def parse(self, html_content) -> List[Article]:
+        try:
+            soup = BeautifulSoup(html_content, self.features, parse_only=RESULT_CONTAINER)
+            news_items = self._select_items(soup)
+            if not news_items:
+                # Unknown page layout: fall back to the whole document
+                soup = BeautifulSoup(html_content, self.features)
+                news_items = self._select_items(soup)
+            
+            # One reference time per page; repeated strings like "1시간 전" parse once
+            date_parser = DateUtils.make_parser()
+            
+            for field in self.fields:
+                field.prepare(soup)
+            
+            rows = []
+            for item in news_items:
+                try:
+                    rows.append(tuple(field.select_one(item) for field in self.fields))
+                except Exception as e:
+                    print(f"Error parsing news item: {e}")
+                    continue
+            
+            return build_naver_records(rows, date_parser)
+        
+        except Exception as e:
+            print(f"Error parsing search results: {e}")
+            return []
\ No newline at end of file
@@ -0,0 +1,127 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..config import Config
+from ..models import Article
+from .google_html import parse_google_search_html
+from .google_rss import parse_rss_feed
+from .naver_serp import NaverSerpParser
+
+# One parser per worker process, so its selectors are compiled once
+_naver_parser: Optional[NaverSerpParser] = None
+
+def parse_naver_serp(raw) -> List[Article]:
+    global _naver_parser
+    if _naver_parser is None:
+        _naver_parser = NaverSerpParser()
+    return _naver_parser.parse(raw)
+
+def parse_google_rss(raw, max_results: Optional[int] = None) -> List[Article]:
+    return parse_rss_feed(raw, max_results)
+
+def parse_google_html(raw) -> List[Article]:
+    return parse_google_search_html(raw)
+
+PARSERS = {
+    'naver_serp': parse_naver_serp,
+    'google_rss': parse_google_rss,
+    'google_html': parse_google_html,
+}
+
+def _run_parser(kind: str, raw, options: Dict[str, Any]) -> List[Article]:
+    return PARSERS[kind](raw, **options)
+
+class ParsePipeline:
+    """Parse raw response bodies in a pool of worker processes
+    
+    Fetcher threads and tasks hand over response bytes and get article
+    records back, so parsing no longer competes with fetching for the GIL.
+    At most ``max_pending`` bodies are queued or being parsed at a time;
+    further submissions block until a worker finishes, which keeps a burst
+    of fetched pages from piling up in memory.
+    """
+    
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.workers = workers or Config.PARSE_WORKERS or 1
+        self.max_pending = max_pending or Config.PARSE_MAX_PENDING
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor = None
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Fetcher threads hold locks (sessions, SQLite caches), so workers
+                # are spawned rather than forked from this process
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+    
+    @property
+    def pending(self) -> int:
+        return self._pending
+    
+    def _release(self, _future: Future):
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+    
+    def submit(self, kind: str, raw, **options) -> Future:
+        """Queue a body for parsing, blocking while the pipeline is full"""
+        if kind not in PARSERS:
+            raise ValueError(f"Unknown parser: {kind}")
+        
+        self._slots.acquire()
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._get_executor().submit(_run_parser, kind, raw, options)
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+    
+    def parse(self, kind: str, raw, **options) -> List[Article]:
+        return self.submit(kind, raw, **options).result()
+    
+    async def parse_async(self, kind: str, raw, **options) -> List[Article]:
+        """Parse from an event loop; waiting for a free slot does not block the loop"""
+        future = await asyncio.to_thread(self.submit, kind, raw, **options)
+        return await asyncio.wrap_future(future)
+    
+    def map(self, kind: str, raws: Iterable, **options) -> List[List[Article]]:
+        """Parse several bodies, returning their records in input order"""
+        futures = [self.submit(kind, raw, **options) for raw in raws]
+        return [future.result() for future in futures]
+    
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+_parse_pipeline: Optional[ParsePipeline] = None
+_parse_pipeline_lock = threading.Lock()
+
+def get_parse_pipeline() -> Optional[ParsePipeline]:
+    """Get the process-wide parse pipeline, or None when PARSE_WORKERS is 0"""
+    global _parse_pipeline
+    if not Config.PARSE_WORKERS:
+        return None
+    with _parse_pipeline_lock:
+        if _parse_pipeline is None:
+            _parse_pipeline = ParsePipeline()
+        return _parse_pipeline
\ No newline at end of file
@@ -0,0 +1,79 @@
+from io import BytesIO
+from typing import Dict, Iterator, Union
+
+from lxml import etree
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+# Map RSS 2.0 and Atom child elements onto RSS field names
+FIELD_TAGS = {
+    'title': 'title',
+    'link': 'link',
+    'pubDate': 'pubDate',
+    'description': 'description',
+    'source': 'source',
+    f'{ATOM_NS}title': 'title',
+    f'{ATOM_NS}link': 'link',
+    f'{ATOM_NS}published': 'pubDate',
+    f'{ATOM_NS}updated': 'updated',
+    f'{ATOM_NS}summary': 'description',
+    f'{ATOM_NS}content': 'content',
+    f'{ATOM_NS}source': 'source',
+}
+
+ITEM_TAGS = ('item', f'{ATOM_NS}entry')
+
+def _element_text(element) -> str:
+    return ''.join(element.itertext())
+
+def _item_fields(item) -> Dict[str, str]:
+    """Collect the text of an item's known child elements"""
+    fields = {}
+    for child in item:
+        field = FIELD_TAGS.get(child.tag)
+        if field is None or field in fields:
+            continue
+        if field == 'link' and child.tag.startswith(ATOM_NS):
+            # Atom links carry the URL in href; prefer rel="alternate"
+            if child.get('rel', 'alternate') != 'alternate':
+                continue
+            fields[field] = child.get('href', '')
+        else:
+            fields[field] = _element_text(child)
+    
+    # Atom fallbacks for the RSS field names
+    if 'pubDate' not in fields and 'updated' in fields:
+        fields['pubDate'] = fields['updated']
+    if 'description' not in fields and 'content' in fields:
+        fields['description'] = fields['content']
+    return fields
+
+def iter_feed_items(content: Union[bytes, str]) -> Iterator[Dict[str, str]]:
+    """Incrementally parse an RSS/Atom document, yielding the raw fields of each item
+    
+    Items are freed as soon as they have been read, so memory stays flat and
+    a consumer that stops early never parses the rest of the feed. Raises
+    ``lxml.etree.XMLSyntaxError`` on malformed input.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    
+    parser = etree.iterparse(
+        BytesIO(content),
+        events=('end',),
+        tag=ITEM_TAGS,
+        resolve_entities=False,
+        no_network=True,
+    )
+    
+    for _, item in parser:
+        fields = _item_fields(item)
+        
+        # Drop the item and any already processed siblings
+        item.clear()
+        parent = item.getparent()
+        if parent is not None:
+            while item.getprevious() is not None:
+                del parent[0]
+        
+        yield fields
\ No newline at end of file
@@ -1,5 +1,9 @@
 from .date_utils import DateUtils
 from .text_utils import TextUtils
 from .file_utils import FileUtils
+from .google_decoder import GoogleNewsDecoder
+from .url_utils import UrlUtils
+from .near_duplicates import NearDuplicateIndex
+from .publisher_registry import PublisherRegistry, get_publisher_registry
 
-__all__ = ['DateUtils', 'TextUtils', 'FileUtils']
\ No newline at end of file
+__all__ = ['DateUtils', 'TextUtils', 'FileUtils', 'GoogleNewsDecoder', 'UrlUtils', 'NearDuplicateIndex', 'PublisherRegistry', 'get_publisher_registry']
\ No newline at end of file
@@ -1,60 +1,112 @@
 import re
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, List, Optional
+
+from ..config import Config
+
+DATE_FORMAT = '%Y.%m.%d.'
+
+# Absolute dates as shown on result pages ("2025.05.30.", "25.5.30")
+ABSOLUTE_DATE = re.compile(r'(\d{4})\.(\d{1,2})\.(\d{1,2})\.?')
+SHORT_ABSOLUTE_DATE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{1,2})\.?')
+
+# Korean and English relative dates in one pass ("3시간 전", "2 days ago")
+RELATIVE_DATE = re.compile(
+    r'(\d+)\s*(일|시간|분)\s*전|(\d+)\s*(day|hour|minute)s?\s*ago',
+    re.IGNORECASE
+)
+RELATIVE_UNITS = {
+    '일': 'days', '시간': 'hours', '분': 'minutes',
+    'day': 'days', 'hour': 'hours', 'minute': 'minutes',
+}
+
+# RFC 822 ("Fri, 30 May 2025 10:30:00 GMT") and ISO 8601 ("2025-05-30T10:30:00Z")
+RFC822_DATE = re.compile(
+    r'(?:[A-Za-z]{3},\s*)?(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})'
+    r'(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?)?'
+    r'\s*(?:([+-]\d{2})(\d{2})|([A-Za-z]{1,5}))?\s*$'
+)
+ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}')
+MONTHS = {
+    month: i for i, month in enumerate(
+        ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], start=1
+    )
+}
+ZONE_OFFSETS = {
+    'GMT': 0, 'UT': 0, 'UTC': 0, 'Z': 0, 'KST': 9,
+    'EST': -5, 'EDT': -4, 'CST': -6, 'CDT': -5, 'MST': -7, 'MDT': -6, 'PST': -8, 'PDT': -7,
+}
 
 class DateUtils:
     @staticmethod
-    def parse_relative_date(date_str: str) -> str:
-        """Parse relative date strings and convert to standard format"""
+    def now() -> datetime:
+        """Current time as an aware UTC datetime"""
+        return datetime.now(timezone.utc)
+    
+    @staticmethod
+    def parse_relative_datetime(date_str: str, now: Optional[datetime] = None) -> datetime:
+        """Parse a result page date ("3시간 전", "2025.05.30.") to an aware UTC datetime
+        
+        Absolute dates are Korean calendar days. ``now`` fixes the reference
+        time, e.g. once for a whole page; unparseable input returns it.
+        """
+        now = now or datetime.now(timezone.utc)
         if not date_str:
-            return datetime.now().strftime('%Y.%m.%d.')
-            
-        now = datetime.now()
-        date_str = date_str.strip()
+            return now
         
-        try:
-            # Absolute date patterns
-            if match := re.search(r'\d{4}\.\d{1,2}\.\d{1,2}\.?', date_str):
-                return match.group(0).rstrip('.') + '.'
-            if match := re.search(r'\d{1,2}\.\d{1,2}\.\d{1,2}\.?', date_str):
-                return match.group(0).rstrip('.') + '.'
-            
-            # Korean relative dates
-            if '일 전' in date_str or '일전' in date_str:
-                days = int(re.search(r'(\d+)일\s*전', date_str).group(1))
-                return (now - timedelta(days=days)).strftime('%Y.%m.%d.')
-            
-            if '시간 전' in date_str or '시간전' in date_str:
-                hours = int(re.search(r'(\d+)시간\s*전', date_str).group(1))
-                return (now - timedelta(hours=hours)).strftime('%Y.%m.%d.')
-            
-            if '분 전' in date_str or '분전' in date_str:
-                minutes = int(re.search(r'(\d+)분\s*전', date_str).group(1))
-                return (now - timedelta(minutes=minutes)).strftime('%Y.%m.%d.')
-            
-            # English relative dates
-            if match := re.search(r'(\d+)\s*hours?\s*ago', date_str, re.IGNORECASE):
-                hours = int(match.group(1))
-                return (now - timedelta(hours=hours)).strftime('%Y.%m.%d.')
-            
-            if match := re.search(r'(\d+)\s*days?\s*ago', date_str, re.IGNORECASE):
-                days = int(match.group(1))
-                return (now - timedelta(days=days)).strftime('%Y.%m.%d.')
-            
-            if match := re.search(r'(\d+)\s*minutes?\s*ago', date_str, re.IGNORECASE):
-                minutes = int(match.group(1))
-                return (now - timedelta(minutes=minutes)).strftime('%Y.%m.%d.')
-                
-        except (ValueError, AttributeError):
-            pass
+        # Absolute date patterns
+        match = ABSOLUTE_DATE.search(date_str)
+        century = 0
+        if not match:
+            match = SHORT_ABSOLUTE_DATE.search(date_str)
+            century = 2000
+        if match:
+            try:
+                year, month, day = (int(part) for part in match.groups())
+                return datetime(century + year, month, day, tzinfo=Config.TIMEZONE).astimezone(timezone.utc)
+            except ValueError:
+                pass
         
-        return now.strftime('%Y.%m.%d.')
+        # Korean and English relative dates
+        if match := RELATIVE_DATE.search(date_str):
+            amount = int(match.group(1) or match.group(3))
+            unit = RELATIVE_UNITS[(match.group(2) or match.group(4)).lower()]
+            return now - timedelta(**{unit: amount})
+        
+        return now
     
     @staticmethod
-    def parse_rss_date(date_str: str) -> str:
-        """Parse RSS date formats to standard format"""
+    def parse_rss_datetime(date_str: str, now: Optional[datetime] = None) -> datetime:
+        """Parse a feed timestamp to an aware UTC datetime, honouring its zone"""
         if not date_str:
-            return datetime.now().strftime('%Y.%m.%d.')
+            return now or datetime.now(timezone.utc)
+        
+        date_str = date_str.strip()
+        
+        # Fast path: read the fields of RFC 822 and ISO 8601 timestamps directly
+        if match := RFC822_DATE.match(date_str):
+            day, month_name, year, hour, minute, second, offset_hours, offset_minutes, zone = match.groups()
+            month = MONTHS.get(month_name.lower())
+            if offset_hours:
+                sign = -1 if offset_hours[0] == '-' else 1
+                offset = timedelta(hours=int(offset_hours), minutes=sign * int(offset_minutes))
+            else:
+                offset = timedelta(hours=ZONE_OFFSETS.get((zone or 'GMT').upper(), 0))
+            try:
+                if month:
+                    published = datetime(int(year), month, int(day), int(hour or 0),
+                                         int(minute or 0), int(second or 0), tzinfo=timezone(offset))
+                    return published.astimezone(timezone.utc)
+            except ValueError:
+                pass
+        elif ISO_DATE.match(date_str):
+            try:
+                published = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                if published.tzinfo is None:
+                    published = published.replace(tzinfo=timezone.utc)
+                return published.astimezone(timezone.utc)
+            except ValueError:
+                pass
         
         formats = [
             '%a, %d %b %Y %H:%M:%S %Z',
@@ -67,12 +119,53 @@ class DateUtils:
         
         for fmt in formats:
             try:
-                dt = datetime.strptime(date_str.strip(), fmt)
-                return dt.strftime('%Y.%m.%d.')
+                return datetime.strptime(date_str, fmt).replace(tzinfo=timezone.utc)
             except ValueError:
                 continue
         
-        return DateUtils.parse_relative_date(date_str)
+        return DateUtils.parse_relative_datetime(date_str, now)
+    
+    @staticmethod
+    def format_date(published: Optional[datetime]) -> str:
+        """Render a timestamp as a Korean calendar day (the export format)"""
+        if published is None:
+            return ''
+        return published.astimezone(Config.TIMEZONE).strftime(DATE_FORMAT)
+    
+    @staticmethod
+    def parse_relative_date(date_str: str, now: Optional[datetime] = None) -> str:
+        """Parse relative date strings and convert to standard format"""
+        return DateUtils.format_date(DateUtils.parse_relative_datetime(date_str, now))
+    
+    @staticmethod
+    def parse_rss_date(date_str: str, now: Optional[datetime] = None) -> str:
+        """Parse RSS date formats to standard format"""
+        return DateUtils.format_date(DateUtils.parse_rss_datetime(date_str, now))
+    
+    @staticmethod
+    def make_parser(now: Optional[datetime] = None, rss: bool = False) -> Callable[[str], datetime]:
+        """Build a date parser for one batch: a fixed reference time and memoized results"""
+        now = now or datetime.now(timezone.utc)
+        if rss:
+            # Feed timestamps are nearly all distinct, so memoizing them does not pay
+            return lambda date_str: DateUtils.parse_rss_datetime(date_str, now)
+        
+        parse = DateUtils.parse_relative_datetime
+        cache = {}
+        
+        def parse_cached(date_str: str) -> datetime:
+            result = cache.get(date_str)
+            if result is None:
+                result = cache[date_str] = parse(date_str, now)
+            return result
+        
+        return parse_cached
+    
+    @staticmethod
+    def parse_many(date_strs: Iterable[str], now: Optional[datetime] = None,
+                   rss: bool = False) -> List[datetime]:
+        """Parse a batch of date strings against one reference time"""
+        return list(map(DateUtils.make_parser(now, rss), date_strs))
     
     @staticmethod
     def get_current_timestamp() -> str:
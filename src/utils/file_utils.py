@@ -1,17 +1,22 @@
 import pandas as pd
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any, Optional, Union
+
+from ..config import Config
+from ..models import Article, ArticleBatch
 from .date_utils import DateUtils
+from .url_utils import UrlUtils
 
 class FileUtils:
     @staticmethod
-    def save_to_excel(data: List[Dict[str, Any]], query: str, result_dir: Path) -> str:
+    def save_to_excel(data: Union[ArticleBatch, List[Dict[str, Any]]], query: str, result_dir: Path) -> str:
         """Save crawled data to Excel file"""
-        if not data:
+        if not len(data):
             raise ValueError("No data to save")
         
-        # Create DataFrame
-        df = pd.DataFrame(data)
+        # Create DataFrame (straight from the columns for an ArticleBatch)
+        df = data.to_dataframe() if isinstance(data, ArticleBatch) else pd.DataFrame(data)
         
         # Ensure result directory exists
         result_dir.mkdir(exist_ok=True)
@@ -26,6 +31,117 @@ class FileUtils:
         
         return str(filepath)
     
+    @staticmethod
+    def save_to_excel_stream(records: Iterable[Union[Article, Dict[str, Any]]], query: str, result_dir: Path,
+                             max_rows: Optional[int] = None, sheets_per_file: Optional[int] = None) -> List[str]:
+        """Write records to Excel one row at a time, in Config.EXCEL_COLUMNS order
+        
+        Uses openpyxl's write-only workbook, so memory stays constant however
+        many records the iterable (e.g. ``crawl_iter``) yields. A sheet that
+        reaches ``max_rows`` rows (header included; Excel's limit by default)
+        continues in a new sheet, and after ``sheets_per_file`` sheets in a
+        new file. Returns the written file paths; if ``records`` raises, the
+        rows written so far are saved before the error propagates.
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+        
+        max_rows = max_rows or Config.EXCEL_MAX_ROWS
+        sheets_per_file = sheets_per_file or Config.EXCEL_SHEETS_PER_FILE
+        columns = Config.EXCEL_COLUMNS
+        
+        records = iter(records)
+        first = next(records, None)
+        if first is None:
+            raise ValueError("No data to save")
+        
+        result_dir.mkdir(exist_ok=True)
+        timestamp = DateUtils.get_current_timestamp()
+        
+        paths = []
+        workbook = worksheet = None
+        rows = 0
+        
+        def cell(value):
+            if value is None:
+                return ''
+            return ILLEGAL_CHARACTERS_RE.sub('', value) if isinstance(value, str) else value
+        
+        try:
+            for record in chain([first], records):
+                if worksheet is None or rows >= max_rows:
+                    if workbook is not None and len(workbook.worksheets) >= sheets_per_file:
+                        finished, workbook = workbook, None
+                        finished.save(paths[-1])
+                    if workbook is None:
+                        workbook = Workbook(write_only=True)
+                        suffix = f" ({len(paths) + 1})" if paths else ""
+                        paths.append(str(result_dir / f"{timestamp} {query}{suffix}.xlsx"))
+                    worksheet = workbook.create_sheet(f"Sheet{len(workbook.worksheets) + 1}")
+                    worksheet.append(columns)
+                    rows = 1
+                
+                worksheet.append([cell(record.get(column)) for column in columns])
+                rows += 1
+        finally:
+            # Keep the rows written so far if the records iterable raises
+            if workbook is not None:
+                workbook.save(paths[-1])
+        return paths
+    
+    @staticmethod
+    def save_to_parquet(data: Union[ArticleBatch, List[Dict[str, Any]]], query: str, result_dir: Path,
+                        compression: Optional[str] = None) -> str:
+        """Save crawled data to a compressed Parquet file with typed columns (needs pyarrow)"""
+        if not len(data):
+            raise ValueError("No data to save")
+        
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet export needs the optional pyarrow package (pip install pyarrow)") from e
+        
+        batch = data if isinstance(data, ArticleBatch) else ArticleBatch(
+            item if isinstance(item, Article) else Article.from_dict(item) for item in data
+        )
+        
+        result_dir.mkdir(exist_ok=True)
+        
+        timestamp = DateUtils.get_current_timestamp()
+        filepath = result_dir / f"{timestamp} {query}.parquet"
+        
+        pq.write_table(batch.to_arrow(), filepath, compression=compression or Config.PARQUET_COMPRESSION)
+        
+        return str(filepath)
+    
+    @staticmethod
+    def save(data: Union[ArticleBatch, List[Dict[str, Any]]], query: str, result_dir: Path,
+             formats: Union[str, Iterable[str]] = 'xlsx') -> List[str]:
+        """Save crawled data in each of ``formats`` ('parquet', 'xlsx', 'xlsx-stream') and return the file paths"""
+        if isinstance(formats, str):
+            formats = [name.strip() for name in formats.split(',') if name.strip()]
+        
+        exporters = {
+            'parquet': FileUtils.save_to_parquet,
+            'xlsx': FileUtils.save_to_excel,
+            'xlsx-stream': FileUtils.save_to_excel_stream,
+        }
+        unknown = [name for name in formats if name not in exporters]
+        if unknown or not formats:
+            raise ValueError(f"Unknown export format: {', '.join(unknown) or '(none)'} "
+                             f"(available: {', '.join(exporters)})")
+        
+        paths = []
+        for name in formats:
+            saved = exporters[name](data, query, result_dir)
+            paths.extend(saved if isinstance(saved, list) else [saved])
+        return paths
+    
+    @staticmethod
+    def load_from_parquet(filepath: str) -> pd.DataFrame:
+        """Load data from a Parquet file written by save_to_parquet (needs pyarrow)"""
+        return pd.read_parquet(filepath)
+    
     @staticmethod
     def load_from_excel(filepath: str) -> pd.DataFrame:
         """Load data from Excel file"""
@@ -49,8 +165,9 @@ class FileUtils:
         # Merge all DataFrames
         merged_df = pd.concat(all_data, ignore_index=True)
         
-        # Remove duplicates based on link
-        merged_df = merged_df.drop_duplicates(subset=['link'], keep='first')
+        # Remove duplicates based on the canonical link
+        canonical_links = merged_df['link'].astype(str).map(UrlUtils.canonicalize)
+        merged_df = merged_df[~canonical_links.duplicated(keep='first')]
         
         # Save merged file
         merged_df.to_excel(output_path, index=False, engine='openpyxl')
@@ -58,28 +175,30 @@ class FileUtils:
         return output_path
     
     @staticmethod
-    def validate_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def validate_item(item: Union[Article, Dict[str, Any]], query: str = '') -> Optional[Article]:
+        """Validate one crawled record, or None if it is unusable
+        
+        Articles are checked in place rather than copied; dict records are
+        converted (and cleaned) once.
+        """
+        article = item if isinstance(item, Article) else Article.from_dict(item)
+        
+        # Skip items without required fields
+        if not article.title or not article.link:
+            return None
+        
+        if query:
+            article['query'] = query
+        return article
+    
+    @staticmethod
+    def validate_data(data: List[Union[Article, Dict[str, Any]]]) -> List[Article]:
         """Validate and clean crawled data"""
         validated_data = []
         
         for item in data:
-            # Skip items without required fields
-            if not item.get('title') or not item.get('link'):
-                continue
-            
-            # Clean and validate fields
-            cleaned_item = {
-                'title': str(item.get('title', '')).strip(),
-                'link': str(item.get('link', '')).strip(),
-                'source': str(item.get('source', '')).strip(),
-                'date': str(item.get('date', '')).strip(),
-                'content': str(item.get('content', '')).strip()
-            }
-            
-            # Skip if title or link is empty after cleaning
-            if not cleaned_item['title'] or not cleaned_item['link']:
-                continue
-            
-            validated_data.append(cleaned_item)
+            article = FileUtils.validate_item(item)
+            if article:
+                validated_data.append(article)
         
         return validated_data
\ No newline at end of file
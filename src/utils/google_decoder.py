@@ -0,0 +1,94 @@
+import base64
+import re
+from typing import Optional
+
+class GoogleNewsDecoder:
+    """Decode publisher URLs embedded in Google News article ids
+    
+    Article ids are URL-safe base64 encoded protobuf messages. Older ids
+    (``CBMi...``, ``CAIi...``) carry the publisher URL in field 4 and an
+    optional AMP URL in field 26. Newer ids whose payload starts with
+    ``AU_yqL`` are opaque and can only be resolved over the network.
+    """
+    
+    ARTICLE_ID_PATTERN = re.compile(r'news\.google\.com/(?:rss/)?(?:articles|read)/([A-Za-z0-9_\-]+)')
+    OPAQUE_PREFIX = b'AU_yqL'
+    URL_FIELD = 4
+    AMP_URL_FIELD = 26
+    
+    @staticmethod
+    def extract_article_id(url: str) -> Optional[str]:
+        """Extract the encoded article id from a Google News URL"""
+        if not url:
+            return None
+        match = GoogleNewsDecoder.ARTICLE_ID_PATTERN.search(url)
+        return match.group(1) if match else None
+    
+    @staticmethod
+    def _read_varint(data: bytes, pos: int):
+        result = 0
+        shift = 0
+        while True:
+            if pos >= len(data) or shift > 63:
+                raise ValueError("truncated varint")
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7f) << shift
+            if not byte & 0x80:
+                return result, pos
+            shift += 7
+    
+    @staticmethod
+    def _iter_fields(data: bytes):
+        """Yield (field number, value) pairs of length-delimited protobuf fields"""
+        pos = 0
+        while pos < len(data):
+            key, pos = GoogleNewsDecoder._read_varint(data, pos)
+            field, wire_type = key >> 3, key & 0x07
+            
+            if wire_type == 0:
+                _, pos = GoogleNewsDecoder._read_varint(data, pos)
+            elif wire_type == 2:
+                length, pos = GoogleNewsDecoder._read_varint(data, pos)
+                if pos + length > len(data):
+                    raise ValueError("truncated field")
+                yield field, data[pos:pos + length]
+                pos += length
+            elif wire_type == 1:
+                pos += 8
+            elif wire_type == 5:
+                pos += 4
+            else:
+                raise ValueError(f"unsupported wire type {wire_type}")
+    
+    @staticmethod
+    def decode_article_id(article_id: str) -> Optional[str]:
+        """Decode an article id, returning None when it does not embed a URL"""
+        try:
+            data = base64.urlsafe_b64decode(article_id + '=' * (-len(article_id) % 4))
+        except (ValueError, TypeError):
+            return None
+        
+        amp_url = None
+        try:
+            for field, value in GoogleNewsDecoder._iter_fields(data):
+                if value.startswith(GoogleNewsDecoder.OPAQUE_PREFIX):
+                    return None
+                if not value.startswith((b'http://', b'https://')):
+                    continue
+                if field == GoogleNewsDecoder.URL_FIELD:
+                    return value.decode('utf-8')
+                if field == GoogleNewsDecoder.AMP_URL_FIELD and amp_url is None:
+                    amp_url = value.decode('utf-8')
+        except (ValueError, UnicodeDecodeError):
+            return None
+        
+        return amp_url
+    
+    @staticmethod
+    def decode(url: str) -> Optional[str]:
+        """Decode the publisher URL of a Google News article link without a request"""
+        article_id = GoogleNewsDecoder.extract_article_id(url)
+        if not article_id:
+            return None
+        return GoogleNewsDecoder.decode_article_id(article_id)
\ No newline at end of file
@@ -0,0 +1,129 @@
+import hashlib
+import random
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+from ..config import Config
+from ..models import Article
+
+# Newsroom tags such as "[속보]" or "(종합2보)" that vary between copies of one story
+STORY_TAG = re.compile(r'[\[【(<][^\]】)>]{1,12}[\]】)>]')
+WORD = re.compile(r'\w+')
+
+class NearDuplicateIndex:
+    """Incremental near-duplicate detector for articles (MinHash with LSH banding)
+    
+    An article's title and snippet become a set of character shingles,
+    which works for Korean and English alike. Its MinHash signature is
+    split into ``bands`` bands of ``rows`` values; articles sharing any band
+    are candidates, and a candidate whose estimated Jaccard similarity
+    reaches ``threshold`` puts the new article in its cluster. Each lookup
+    only touches the candidate buckets, not every indexed article.
+    """
+    
+    def __init__(self, threshold: float = None, bands: int = None, rows: int = None,
+                 shingle_size: int = 3, seed: int = 1):
+        self.threshold = threshold or Config.NEAR_DUPLICATE_THRESHOLD
+        self.bands = bands or Config.NEAR_DUPLICATE_BANDS
+        self.rows = rows or Config.NEAR_DUPLICATE_ROWS
+        self.shingle_size = shingle_size
+        
+        # Each MinHash function XORs the 64-bit shingle hashes with its own random mask
+        rng = random.Random(seed)
+        self._masks = [rng.getrandbits(64) for _ in range(self.bands * self.rows)]
+        self._buckets: List[Dict[tuple, List[int]]] = [defaultdict(list) for _ in range(self.bands)]
+        self._signatures: List[Tuple[int, ...]] = []
+        self._clusters: List[int] = []
+        self.cluster_count = 0
+        self.comparisons = 0
+    
+    def shingles(self, title: str, content: str = '') -> set:
+        """Character shingles of the normalized title and snippet"""
+        size = self.shingle_size
+        shingles = set()
+        for text in (title, content):
+            text = ' '.join(WORD.findall(STORY_TAG.sub(' ', text or '').lower()))
+            if len(text) <= size:
+                if text:
+                    shingles.add(text)
+                continue
+            shingles.update(text[i:i + size] for i in range(len(text) - size + 1))
+        return shingles
+    
+    def signature(self, title: str, content: str = '') -> Tuple[int, ...]:
+        """MinHash signature of an article's text"""
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+            for shingle in self.shingles(title, content)
+        ]
+        if not hashes:
+            return ()
+        return tuple(min(map(mask.__xor__, hashes)) for mask in self._masks)
+    
+    @staticmethod
+    def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        if not first or not second:
+            return 0.0
+        return sum(x == y for x, y in zip(first, second)) / len(first)
+    
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[tuple]:
+        rows = self.rows
+        return [signature[i * rows:(i + 1) * rows] for i in range(self.bands)]
+    
+    def add(self, title: str, content: str = '') -> int:
+        """Index an article's text and return its story cluster id"""
+        signature = self.signature(title, content)
+        band_keys = self._band_keys(signature) if signature else []
+        
+        best, best_similarity = None, self.threshold
+        checked = set()
+        for buckets, band_key in zip(self._buckets, band_keys):
+            for doc in buckets.get(band_key, ()):
+                if doc in checked:
+                    continue
+                checked.add(doc)
+                self.comparisons += 1
+                similarity = self.similarity(signature, self._signatures[doc])
+                if similarity >= best_similarity:
+                    best, best_similarity = doc, similarity
+        
+        if best is None:
+            self.cluster_count += 1
+            cluster_id = self.cluster_count
+        else:
+            cluster_id = self._clusters[best]
+        
+        doc = len(self._signatures)
+        self._signatures.append(signature)
+        self._clusters.append(cluster_id)
+        for buckets, band_key in zip(self._buckets, band_keys):
+            buckets[band_key].append(doc)
+        return cluster_id
+    
+    def assign(self, articles: Iterable[Article]) -> List[Article]:
+        """Set ``cluster_id`` on each article, in order"""
+        articles = list(articles)
+        for article in articles:
+            article.cluster_id = self.add(article.title, article.content)
+        return articles
+    
+    def representatives(self, articles: Iterable[Article]) -> List[Article]:
+        """Cluster the articles and keep only the first one seen of each story
+        
+        Stories already indexed by earlier calls (e.g. another source's
+        crawl) count as seen, so their later copies are dropped too.
+        """
+        seen_clusters = self.cluster_count
+        kept = []
+        kept_clusters = set()
+        for article in self.assign(articles):
+            cluster_id = article.cluster_id
+            if cluster_id > seen_clusters and cluster_id not in kept_clusters:
+                kept_clusters.add(cluster_id)
+                kept.append(article)
+        return kept
+    
+    def __len__(self) -> int:
+        return len(self._signatures)
\ No newline at end of file
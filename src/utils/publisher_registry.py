@@ -0,0 +1,207 @@
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Public suffixes of the outlets we crawl; set Config.PUBLIC_SUFFIX_FILE to load the full list
+PUBLIC_SUFFIXES = [
+    'com', 'net', 'org', 'edu', 'gov', 'int', 'info', 'biz', 'news', 'media', 'io', 'ai', 'co', 'tv', 'me',
+    'kr', 'co.kr', 'or.kr', 'go.kr', 'ne.kr', 're.kr', 'pe.kr', 'ac.kr', 'hs.kr', 'ms.kr', 'es.kr',
+    'sc.kr', 'kg.kr', 'mil.kr', 'seoul.kr', 'busan.kr',
+    'jp', 'co.jp', 'ne.jp', 'or.jp', 'ac.jp', 'go.jp',
+    'cn', 'com.cn', 'net.cn', 'org.cn', 'tw', 'com.tw', 'hk', 'com.hk', 'sg', 'com.sg',
+    'uk', 'co.uk', 'org.uk', 'ac.uk', 'gov.uk', 'au', 'com.au', 'net.au', 'org.au',
+    'nz', 'co.nz', 'in', 'co.in', 'br', 'com.br', 'us', 'ca', 'eu', 'de', 'fr', 'it', 'es', 'nl',
+    'ch', 'se', 'no', 'fi', 'dk', 'at', 'be', 'ru', 'vn', 'com.vn', 'id', 'co.id', 'ph', 'com.ph',
+]
+
+# Canonical publisher -> (hosts or registrable domains, alternative names)
+PUBLISHERS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    '연합뉴스': (('yna.co.kr', 'yonhapnews.co.kr'), ('Yonhap', 'Yonhap News', 'Yonhap News Agency')),
+    '연합뉴스TV': (('yonhapnewstv.co.kr',), ('Yonhap News TV', 'Yonhapnews TV')),
+    '조선일보': (('chosun.com',), ('Chosun', 'Chosun Ilbo', 'The Chosun Ilbo', 'CHOSUN', '조선닷컴')),
+    '조선비즈': (('biz.chosun.com',), ('ChosunBiz', 'CHOSUNBIZ', 'Chosun Biz')),
+    '중앙일보': (('joongang.co.kr', 'joins.com'), ('JoongAng', 'JoongAng Ilbo', 'Korea JoongAng Daily')),
+    '동아일보': (('donga.com',), ('Dong-A Ilbo', 'The Dong-A Ilbo', 'DongA')),
+    '한겨레': (('hani.co.kr',), ('Hankyoreh', 'The Hankyoreh', '한겨레신문')),
+    '경향신문': (('khan.co.kr',), ('Kyunghyang', 'Kyunghyang Shinmun')),
+    '한국일보': (('hankookilbo.com',), ('Hankook Ilbo',)),
+    '국민일보': (('kmib.co.kr',), ('Kukmin Ilbo',)),
+    '세계일보': (('segye.com',), ('Segye Ilbo',)),
+    '한국경제': (('hankyung.com',), ('Korea Economic Daily', 'Hankyung', '한경')),
+    '매일경제': (('mk.co.kr',), ('Maeil Business Newspaper', 'Maeil Business', '매경')),
+    '머니투데이': (('mt.co.kr',), ('Money Today',)),
+    '서울경제': (('sedaily.com',), ('Seoul Economic Daily',)),
+    '아시아경제': (('asiae.co.kr',), ('Asia Economy',)),
+    '헤럴드경제': (('heraldcorp.com',), ('Herald Business',)),
+    '이데일리': (('edaily.co.kr',), ('Edaily',)),
+    '파이낸셜뉴스': (('fnnews.com',), ('Financial News',)),
+    '전자신문': (('etnews.com',), ('Electronic Times', 'etnews')),
+    'ZDNet Korea': (('zdnet.co.kr',), ('지디넷코리아', 'ZDNet코리아')),
+    '블로터': (('bloter.net',), ('Bloter',)),
+    '뉴시스': (('newsis.com',), ('Newsis',)),
+    '뉴스1': (('news1.kr',), ('News1',)),
+    '노컷뉴스': (('nocutnews.co.kr',), ('CBS노컷뉴스', 'Nocut News')),
+    '오마이뉴스': (('ohmynews.com',), ('OhmyNews',)),
+    'KBS': (('kbs.co.kr',), ('KBS 뉴스', 'KBS News')),
+    'MBC': (('mbc.co.kr', 'imbc.com'), ('MBC 뉴스', 'MBC News')),
+    'SBS': (('sbs.co.kr',), ('SBS 뉴스', 'SBS News')),
+    'YTN': (('ytn.co.kr',), ('YTN 뉴스',)),
+    'JTBC': (('jtbc.co.kr', 'news.jtbc.joins.com'), ('JTBC 뉴스', 'JTBC News')),
+    'The Korea Herald': (('koreaherald.com',), ('Korea Herald',)),
+    'The Korea Times': (('koreatimes.co.kr',), ('Korea Times',)),
+    'Reuters': (('reuters.com',), ('Reuters.com', '로이터')),
+    'Bloomberg': (('bloomberg.com',), ('Bloomberg.com', 'Bloomberg News', '블룸버그')),
+    'CNN': (('cnn.com',), ('CNN International',)),
+    'BBC': (('bbc.com', 'bbc.co.uk'), ('BBC News',)),
+    'The New York Times': (('nytimes.com',), ('New York Times', 'NYT')),
+    'The Wall Street Journal': (('wsj.com',), ('Wall Street Journal', 'WSJ')),
+    'The Washington Post': (('washingtonpost.com',), ('Washington Post',)),
+    'The Guardian': (('theguardian.com', 'guardian.co.uk'), ('Guardian',)),
+    'Financial Times': (('ft.com',), ('FT',)),
+    'AP News': (('apnews.com',), ('Associated Press', 'AP')),
+    'CNBC': (('cnbc.com',), ()),
+    'TechCrunch': (('techcrunch.com',), ()),
+    'The Verge': (('theverge.com',), ('Verge',)),
+    'Nikkei Asia': (('asia.nikkei.com',), ('Nikkei Asian Review',)),
+    'ABC News (Australia)': (('abc.net.au',), ()),
+    'The Japan Times': (('japantimes.co.jp',), ('Japan Times',)),
+}
+
+def load_public_suffixes(path: Path) -> List[str]:
+    """Read rules in the publicsuffix.org list format (comments and blank lines skipped)"""
+    rules = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            rule = line.split(None, 1)[0] if line.strip() else ''
+            if rule and not rule.startswith('//'):
+                rules.append(rule)
+    return rules
+
+class PublisherRegistry:
+    """Map link hosts and source names to canonical publisher names
+    
+    Registrable domains come from a public-suffix trie (so ``yna.co.kr`` is
+    "yna", not "co"); hosts are looked up from the most specific name up to
+    the registrable domain, so a section site such as ``biz.chosun.com`` can
+    name its own publisher. Host results are cached, making repeated lookups
+    a single dict hit. Unknown sites fall back to their domain label.
+    """
+    
+    CACHE_SIZE = 100000
+    
+    def __init__(self, suffixes: Optional[Iterable[str]] = None,
+                 publishers: Optional[Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]] = None):
+        self._trie: Dict[str, dict] = {}
+        for rule in PUBLIC_SUFFIXES if suffixes is None else suffixes:
+            self._add_suffix(rule)
+        
+        self._hosts: Dict[str, str] = {}
+        self._aliases: Dict[str, str] = {}
+        for name, (hosts, aliases) in (PUBLISHERS if publishers is None else publishers).items():
+            for host in hosts:
+                self._hosts[host] = name
+            self._aliases[name.casefold()] = name
+            for alias in aliases:
+                self._aliases[alias.casefold()] = name
+        
+        self._host_cache: Dict[str, str] = {}
+        self._lock = threading.Lock()
+    
+    def _add_suffix(self, rule: str):
+        exception = rule.startswith('!')
+        node = self._trie
+        for label in reversed(rule.lstrip('!').lower().split('.')):
+            node = node.setdefault(label, {})
+        node['!' if exception else ''] = True  # end of a rule
+    
+    def registrable_domain(self, host: str) -> str:
+        """The public suffix plus one label, e.g. ``news.kbs.co.kr`` -> ``kbs.co.kr``"""
+        host = host.lower().rstrip('.')
+        if host.replace('.', '').isdigit():
+            return host  # IPv4 address
+        labels = host.split('.')
+        suffix_length = 1  # an unlisted TLD is still a suffix
+        node = self._trie
+        for depth, label in enumerate(reversed(labels), start=1):
+            wildcard = node.get('*')
+            child = node.get(label)
+            exception = child is not None and child.get('!')
+            node = child if child is not None else wildcard
+            if node is None:
+                break
+            if exception:
+                suffix_length = depth - 1
+                break
+            if '' in node:
+                suffix_length = depth
+        
+        if suffix_length >= len(labels):
+            return host
+        return '.'.join(labels[-suffix_length - 1:])
+    
+    def _resolve_host(self, host: str) -> str:
+        if not host:
+            return host
+        
+        domain = self.registrable_domain(host)
+        name = host
+        while True:
+            publisher = self._hosts.get(name)
+            if publisher is not None:
+                return publisher
+            if name == domain or '.' not in name:
+                break
+            name = name.split('.', 1)[1]
+        
+        # Unknown site: its name within the registrable domain
+        return domain if domain[-1:].isdigit() else domain.split('.', 1)[0]
+    
+    def publisher_for_host(self, host: str) -> str:
+        """Canonical publisher of a host (cached)"""
+        publisher = self._host_cache.get(host)
+        if publisher is None:
+            key = host
+            host = host.lower().rstrip('.')
+            if host.startswith('www.'):
+                host = host[4:]
+            publisher = self._resolve_host(host)
+            with self._lock:
+                if len(self._host_cache) >= self.CACHE_SIZE:
+                    self._host_cache.clear()
+                self._host_cache[key] = publisher
+        return publisher
+    
+    def publisher_for_url(self, url: str) -> str:
+        """Canonical publisher of a link, or "" if it has no host"""
+        if not url:
+            return ""
+        host = url.split('//', 1)[1] if '//' in url else url
+        host = host.split('/', 1)[0].split('?', 1)[0].split('#', 1)[0]
+        host = host.rsplit('@', 1)[-1].split(':', 1)[0]
+        return self.publisher_for_host(host) if host else ""
+    
+    def publishers_for_urls(self, urls: Iterable[str]) -> List[str]:
+        publisher_for_url = self.publisher_for_url
+        return [publisher_for_url(url) for url in urls]
+    
+    def canonical_name(self, source: str) -> str:
+        """Canonical publisher for a source name, or the name itself if unknown"""
+        if not source:
+            return ""
+        source = source.strip()
+        return self._aliases.get(source.casefold(), source)
+
+_publisher_registry: Optional[PublisherRegistry] = None
+_publisher_registry_lock = threading.Lock()
+
+def get_publisher_registry() -> PublisherRegistry:
+    """Get the process-wide publisher registry"""
+    global _publisher_registry
+    with _publisher_registry_lock:
+        if _publisher_registry is None:
+            from ..config import Config
+            suffixes = None
+            if Config.PUBLIC_SUFFIX_FILE:
+                suffixes = load_public_suffixes(Path(Config.PUBLIC_SUFFIX_FILE))
+            _publisher_registry = PublisherRegistry(suffixes)
+        return _publisher_registry
\ No newline at end of file
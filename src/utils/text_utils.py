@@ -1,5 +1,20 @@
 import re
-from typing import Optional
+from typing import Iterable, List, Optional
+
+from .publisher_registry import get_publisher_registry
+
+HTML_TAG = re.compile(r'<[^>]+>')
+WHITESPACE = re.compile(r'\s+')
+
+# Non-breaking and zero-width spaces, applied after whitespace is collapsed
+INVISIBLE_CHARS = str.maketrans({'\xa0': ' ', '\u200b': None})
+
+# Replaced in this order, so "&amp;lt;" becomes "<" as before
+ENTITIES = (('&quot;', '"'), ('&amp;', '&'), ('&lt;', '<'), ('&gt;', '>'))
+
+# Batch cleaning joins a column with a separator that tags and whitespace runs cannot cross
+FIELD_SEPARATOR = '\x00'
+BATCH_HTML_TAG = re.compile(r'<[^>\x00]+>')
 
 class TextUtils:
     @staticmethod
@@ -9,22 +24,42 @@ class TextUtils:
             return ""
         
         # Remove HTML tags
-        content = re.sub(r'<[^>]+>', '', str(content))
+        content = HTML_TAG.sub('', str(content))
         
-        # Clean up whitespace
-        content = re.sub(r'\s+', ' ', content)
-        content = re.sub(r'\n+', ' ', content)
+        # Clean up whitespace (newlines and non-breaking spaces included)
+        content = WHITESPACE.sub(' ', content)
         
         # Remove special characters and normalize
-        content = content.replace('\xa0', ' ')  # Non-breaking space
-        content = content.replace('\u200b', '')  # Zero-width space
-        content = content.replace('&quot;', '"')
-        content = content.replace('&amp;', '&')
-        content = content.replace('&lt;', '<')
-        content = content.replace('&gt;', '>')
+        content = content.translate(INVISIBLE_CHARS)
+        for entity, char in ENTITIES:
+            content = content.replace(entity, char)
         
         return content.strip()
     
+    @staticmethod
+    def clean_many(contents: Iterable[str]) -> List[str]:
+        """Clean a whole column of text at once; same output as ``clean_html`` per item
+        
+        The column is joined into one string so every substitution runs once
+        per batch instead of once per field.
+        """
+        texts = [str(content) if content else "" for content in contents]
+        if not texts:
+            return []
+        
+        joined = FIELD_SEPARATOR.join(texts)
+        if joined.count(FIELD_SEPARATOR) != len(texts) - 1:
+            # A field contains the separator itself
+            return [TextUtils.clean_html(text) for text in texts]
+        
+        joined = BATCH_HTML_TAG.sub('', joined)
+        joined = WHITESPACE.sub(' ', joined)
+        joined = joined.translate(INVISIBLE_CHARS)
+        for entity, char in ENTITIES:
+            joined = joined.replace(entity, char)
+        
+        return [text.strip() for text in joined.split(FIELD_SEPARATOR)]
+    
     @staticmethod
     def extract_text_from_element(element) -> str:
         """Extract clean text from BeautifulSoup element"""
@@ -38,25 +73,14 @@ class TextUtils:
     
     @staticmethod
     def normalize_source_name(source: str) -> str:
-        """Normalize news source names"""
-        if not source:
-            return ""
-        
-        # Common source mappings
-        source_map = {
-            '연합뉴스': '연합뉴스',
-            'Yonhap News': '연합뉴스',
-            '조선일보': '조선일보',
-            'Chosun': '조선일보',
-            '중앙일보': '중앙일보',
-            'JoongAng': '중앙일보',
-            'KBS': 'KBS',
-            'MBC': 'MBC',
-            'SBS': 'SBS'
-        }
-        
-        source = source.strip()
-        return source_map.get(source, source)
+        """Normalize news source names to their canonical publisher"""
+        return get_publisher_registry().canonical_name(source)
+    
+    @staticmethod
+    def normalize_sources(sources: Iterable[str]) -> List[str]:
+        """Normalize a column of source names"""
+        canonical_name = get_publisher_registry().canonical_name
+        return [canonical_name(source) for source in sources]
     
     @staticmethod
     def truncate_text(text: str, max_length: int = 200) -> str:
@@ -66,26 +90,22 @@ class TextUtils:
         
         return text[:max_length-3] + "..."
     
+    @staticmethod
+    def truncate_many(texts: Iterable[str], max_length: int = 200) -> List[str]:
+        """Truncate a column of text"""
+        cut = max_length - 3
+        return [text if not text or len(text) <= max_length else text[:cut] + "..." for text in texts]
+    
     @staticmethod
     def extract_domain_from_url(url: str) -> str:
-        """Extract domain name from URL for source identification"""
+        """Extract the site name of a URL's registrable domain (``news.yna.co.kr`` -> "yna")"""
         if not url:
             return ""
         
-        # Remove protocol
-        url = re.sub(r'^https?://', '', url)
-        
-        # Extract domain
-        domain_match = re.match(r'^([^/]+)', url)
-        if domain_match:
-            domain = domain_match.group(1)
-            
-            # Remove www
-            domain = re.sub(r'^www\.', '', domain)
-            
-            # Extract main domain name
-            parts = domain.split('.')
-            if len(parts) >= 2:
-                return parts[-2]
+        host = url.split('//', 1)[1] if '//' in url else url
+        host = host.split('/', 1)[0].split('?', 1)[0].rsplit('@', 1)[-1].split(':', 1)[0]
+        if not host:
+            return ""
         
-        return ""
\ No newline at end of file
+        domain = get_publisher_registry().registrable_domain(host)
+        return domain if domain[-1:].isdigit() else domain.split('.', 1)[0]
\ No newline at end of file
@@ -0,0 +1,116 @@
+import hashlib
+import re
+from typing import Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the visit on any site (ad click ids, analytics)
+TRACKING_PARAMS = frozenset([
+    'fbclid', 'gclid', 'dclid', 'gbraid', 'wbraid', 'msclkid', 'igshid', 'yclid', 'twclid',
+    'ttclid', 'mc_cid', 'mc_eid', '_ga', '_gl',
+])
+TRACKING_PREFIXES = ('utm_', 'pk_', 'mtm_')
+
+# Parameters that only track the visit on one site; elsewhere they may select content
+SITE_TRACKING_PARAMS = {
+    'yna.co.kr': frozenset(['input']),
+    'kbs.co.kr': frozenset(['ref']),
+    'hani.co.kr': frozenset(['_fr', '_ns']),
+    'chosun.com': frozenset(['outputtype']),
+    'reuters.com': frozenset(['taid']),
+    'cnn.com': frozenset(['cid']),
+    'msn.com': frozenset(['ocid', 'cvid']),
+    'yahoo.com': frozenset(['ncid', 'guccounter']),
+}
+
+# Mobile and AMP mirrors of a desktop host
+MIRROR_HOST_PREFIXES = ('www.', 'm.', 'mobile.', 'amp.')
+
+# Naver articles are identified by press id (oid) and article id (aid) on every host
+NAVER_ARTICLE_PATH = re.compile(r'/(?:mnews/)?article/(\d+)/(\d+)')
+NAVER_ARTICLE_URL = 'https://n.news.naver.com/article/{}/{}'
+
+class UrlUtils:
+    @staticmethod
+    def _naver_article_id(path: str, query: str) -> Optional[tuple]:
+        """(oid, aid) of a Naver news article link, or None"""
+        match = NAVER_ARTICLE_PATH.match(path)
+        if match:
+            return match.groups()
+        params = dict(parse_qsl(query))
+        if params.get('oid', '').isdigit() and params.get('aid', '').isdigit():
+            return params['oid'], params['aid']
+        return None
+    
+    @staticmethod
+    def _site_tracking_params(host: str) -> frozenset:
+        """Tracking parameters specific to ``host`` or one of its parent domains"""
+        labels = host.split('.')
+        for i in range(len(labels) - 1):
+            params = SITE_TRACKING_PARAMS.get('.'.join(labels[i:]))
+            if params:
+                return params
+        return frozenset()
+    
+    @staticmethod
+    def _is_tracking_param(name: str, site_params: frozenset) -> bool:
+        """Whether a lowercased query parameter only tracks the visit"""
+        return name in TRACKING_PARAMS or name in site_params or name.startswith(TRACKING_PREFIXES)
+    
+    @staticmethod
+    def canonicalize(url: str) -> str:
+        """Canonical form of an article URL, so one article gets one key across runs
+        
+        Lowercases scheme and host, treats http as https, drops ``www.``/``m.``
+        mirror prefixes, ports, fragments and tracking parameters (generic click
+        ids and analytics, plus known per-site ones), sorts the remaining query
+        and trims a trailing slash. Every Naver article URL form (``n.news.naver.com/article``, ``/mnews/article``, legacy
+        ``read.nhn?oid=&aid=``) maps to ``n.news.naver.com/article/{oid}/{aid}``.
+        """
+        if not url:
+            return ""
+        
+        url = url.strip()
+        try:
+            parts = urlsplit(url if '//' in url else '//' + url)
+        except ValueError:
+            return url
+        
+        host = (parts.hostname or '').rstrip('.')
+        if not host:
+            return url
+        
+        if host == 'naver.com' or host.endswith('.naver.com'):
+            article_id = UrlUtils._naver_article_id(parts.path, parts.query)
+            if article_id:
+                return NAVER_ARTICLE_URL.format(*article_id)
+        
+        for prefix in MIRROR_HOST_PREFIXES:
+            if host.startswith(prefix) and host.count('.') > 1:
+                host = host[len(prefix):]
+                break
+        
+        path = parts.path or '/'
+        if len(path) > 1 and path.endswith('/'):
+            path = path.rstrip('/') or '/'
+        
+        query = ''
+        if parts.query:
+            site_params = UrlUtils._site_tracking_params(host)
+            params = [
+                (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                if not UrlUtils._is_tracking_param(name.lower(), site_params)
+            ]
+            query = urlencode(sorted(params))
+        
+        return urlunsplit(('https', host, path, query, ''))
+    
+    @staticmethod
+    def url_key(url: str) -> int:
+        """Signed 64-bit hash of the canonical URL (fits an SQLite INTEGER key)"""
+        digest = hashlib.blake2b(UrlUtils.canonicalize(url).encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'big', signed=True)
+    
+    @staticmethod
+    def url_keys(urls: Iterable[str]) -> List[int]:
+        """Hash a column of URLs"""
+        return [UrlUtils.url_key(url) for url in urls]
\ No newline at end of file
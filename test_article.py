@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+import pickle
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from src.models import Article, ArticleBatch
+from src.utils import FileUtils
+
+RECORD = {
+    'title': ' 양자컴퓨터 상용화 ',
+    'link': 'https://www.yna.co.kr/view/AKR1',
+    'source': '연합뉴스',
+    'date': '2025.05.30.',
+    'content': '요약',
+}
+
+def test_article_reads_like_the_former_dict_record():
+    article = FileUtils.validate_item(dict(RECORD), query='양자컴퓨터')
+    
+    assert article['title'] == '양자컴퓨터 상용화'
+    assert article['date'] == '2025.05.30.'
+    # Days of former dict records are Korean calendar days
+    assert article.published == datetime(2025, 5, 29, 15, tzinfo=timezone.utc)
+    assert article.to_dict() == dict(RECORD, title='양자컴퓨터 상용화')
+    assert article.get('missing', '') == ''
+    
+    # Sources and queries are shared across records
+    other = Article.from_dict(dict(RECORD, source=''.join(['연합', '뉴스'])), query='양자컴퓨터')
+    assert other.source is article.source and other.query is article.query
+    
+    assert pickle.loads(pickle.dumps(article)) == article
+    assert FileUtils.validate_item(dict(RECORD, link=' ')) is None
+
+def test_batch_round_trips_articles_and_exports_columns():
+    articles = [Article.from_dict(dict(RECORD, link=f"{RECORD['link']}{i}")) for i in range(3)]
+    articles.append(Article('No date', 'https://news.kbs.co.kr/2'))
+    batch = ArticleBatch(articles)
+    
+    assert len(batch) == 4
+    assert list(batch) == articles
+    
+    assert len(batch.between(start=datetime(2025, 5, 29, 15, tzinfo=timezone.utc))) == 3
+    assert len(batch.between(end=datetime(2025, 5, 29, 15, tzinfo=timezone.utc))) == 0
+    
+    df = batch.to_dataframe()
+    assert list(df.columns) == ['title', 'link', 'source', 'date', 'content']
+    assert list(df['date']) == ['2025.05.30.'] * 3 + ['']
+
+def test_batch_sorts_by_full_timestamp():
+    base = datetime(2025, 5, 30, 1, tzinfo=timezone.utc)
+    batch = ArticleBatch([
+        Article('Older', 'https://a/1', published=base),
+        Article('Undated', 'https://a/2'),
+        Article('Newer', 'https://a/3', published=base + timedelta(minutes=5)),
+    ])
+    
+    assert [article.title for article in batch.sort_by_time()] == ['Newer', 'Older', 'Undated']
+    assert batch[2].published == base + timedelta(minutes=5)
+    assert batch[2].date == '2025.05.30.'
+
+if __name__ == "__main__":
+    test_article_reads_like_the_former_dict_record()
+    test_batch_round_trips_articles_and_exports_columns()
+    test_batch_sorts_by_full_timestamp()
+    print("✅ All article tests passed")
\ No newline at end of file
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from fixtures import FeedHandler, make_crawler, start_server
+
+def test_record_then_replay_without_network():
+    server = start_server()
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        cassette_dir = Path(work_dir) / 'cassette'
+        try:
+            crawler = make_crawler(server, Path(work_dir) / 'record')
+            recorder = crawler.use_cassette(cassette_dir, mode='record')
+            recorded = crawler.crawl("test", time_range=None)
+            crawler.feed_cache.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        assert recorder.recorded == 1
+        assert len(list((cassette_dir / 'blobs').rglob('*.gz'))) == 1
+        
+        # The server is gone: every response must come from the cassette
+        crawler = make_crawler(server, Path(work_dir) / 'replay')
+        player = crawler.use_cassette(cassette_dir, mode='replay', latency=0.05)
+        start = time.perf_counter()
+        replayed = crawler.crawl("test", time_range=None)
+        elapsed = time.perf_counter() - start
+        crawler.feed_cache.close()
+    
+    assert replayed == recorded
+    assert player.replayed == 1
+    assert elapsed >= 0.05
+    assert len(FeedHandler.requests_seen) == 1
+
+def test_replay_shares_the_feed_cache_of_the_record_run():
+    server = start_server()
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        cassette_dir = Path(work_dir) / 'cassette'
+        try:
+            crawler = make_crawler(server, work_dir)
+            crawler.use_cassette(cassette_dir, mode='record')
+            recorded = crawler.crawl("test", time_range=None)
+            crawler.feed_cache.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        # The feed cache now holds validators, so replay sends a conditional request
+        crawler = make_crawler(server, work_dir)
+        player = crawler.use_cassette(cassette_dir, mode='replay')
+        replayed = crawler.crawl("test", time_range=None)
+        crawler.feed_cache.close()
+    
+    assert len(recorded) == 2
+    assert replayed == recorded
+    assert player.replayed == 1
+
+def test_replay_miss_fails_fast():
+    server = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            crawler = make_crawler(server, work_dir)
+            crawler.use_cassette(Path(work_dir) / 'empty', mode='replay')
+            start = time.perf_counter()
+            assert crawler.make_request("http://127.0.0.1:9/missing") is None
+            assert time.perf_counter() - start < 1
+            crawler.feed_cache.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+if __name__ == "__main__":
+    test_record_then_replay_without_network()
+    test_replay_shares_the_feed_cache_of_the_record_run()
+    test_replay_miss_fails_fast()
+    print("✅ All cassette tests passed")
\ No newline at end of file
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+import socket
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from src.crawlers import GoogleNewsCrawler
+from src.network import CircuitBreaker, CircuitOpenError, get_circuit_breaker
+
+def refused(breaker):
+    try:
+        breaker.before_request()
+    except CircuitOpenError:
+        return True
+    return False
+
+def test_closed_open_half_open_closed():
+    breaker = CircuitBreaker('example.com', failure_threshold=2, recovery_timeout=0.05)
+    assert breaker.state == CircuitBreaker.CLOSED
+    
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED and not refused(breaker)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert refused(breaker) and not breaker.allows_requests()
+    assert 0 < breaker.retry_in() <= 0.05
+    
+    time.sleep(0.06)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not refused(breaker)
+    # Only one trial request at a time
+    assert refused(breaker) and not breaker.allows_requests()
+    
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0 and not refused(breaker)
+
+def test_failed_trial_reopens_and_allows_a_new_trial_later():
+    breaker = CircuitBreaker('example.com', failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert not refused(breaker)
+    
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and refused(breaker)
+    
+    time.sleep(0.06)
+    assert breaker.allows_requests()
+    assert not refused(breaker)
+    assert refused(breaker)
+
+def test_redirect_lookups_do_not_count_against_the_feed_host():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        host = f"127.0.0.1:{sock.getsockname()[1]}"
+    
+    crawler = GoogleNewsCrawler()
+    url = f"http://{host}/rss/articles/CBMiPEFV"
+    assert crawler.make_request(url, max_retries=1, circuit=crawler.redirect_circuit(url)) is None
+    assert get_circuit_breaker(host).failures == 0
+    assert get_circuit_breaker(f"{host} (redirects)").failures == 1
+    
+    calls = []
+    crawler.make_request = lambda *args, **kwargs: calls.append(kwargs)
+    crawler.extract_real_url("https://news.google.com/rss/articles/CBMiPEFVX3lxTFB4eHh4?oc=5", timeout=1)
+    assert calls[0]['circuit'] == 'news.google.com (redirects)'
+
+def test_unexpected_error_releases_the_trial():
+    crawler = GoogleNewsCrawler()
+    breaker = get_circuit_breaker('trial.example.com')
+    breaker.failure_threshold, breaker.recovery_timeout = 1, 0.05
+    breaker.record_failure()
+    time.sleep(0.06)
+    
+    def fail(*args, **kwargs):
+        raise RuntimeError("not a RequestException")
+    crawler.session.get = fail
+    try:
+        crawler.make_request('http://trial.example.com/rss', max_retries=1)
+        assert False, "the unexpected error must propagate"
+    except RuntimeError:
+        pass
+    finally:
+        del crawler.session.get
+    
+    assert breaker.state == CircuitBreaker.HALF_OPEN and breaker.allows_requests()
+
+def test_open_circuit_fails_only_its_own_urls_in_fetch_many():
+    crawler = GoogleNewsCrawler()
+    
+    def make_request(url, *args, **kwargs):
+        if 'down.example.com' in url:
+            raise CircuitOpenError('down.example.com', 30)
+        return url
+    crawler.make_request = make_request
+    
+    urls = ['http://up.example.com/a', 'http://down.example.com/b', 'http://up.example.com/c']
+    assert crawler.fetch_many(urls) == [urls[0], None, urls[2]]
+    crawler.close()
+
+if __name__ == "__main__":
+    test_closed_open_half_open_closed()
+    test_failed_trial_reopens_and_allows_a_new_trial_later()
+    test_redirect_lookups_do_not_count_against_the_feed_host()
+    test_unexpected_error_releases_the_trial()
+    test_open_circuit_fails_only_its_own_urls_in_fetch_many()
+    print("✅ All circuit breaker tests passed")
\ No newline at end of file
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from fixtures import make_naver_page
+from src.crawlers import NaverNewsCrawler
+
+class SerpHandler(BaseHTTPRequestHandler):
+    """Stand-in for Naver news search that serves generated result pages"""
+    pages_served = []
+    
+    def do_GET(self):
+        start = int(parse_qs(urlparse(self.path).query)['start'][0])
+        page = (start - 1) // 10 + 1
+        self.pages_served.append(page)
+        body = make_naver_page(page).encode('utf-8')
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+def start_server():
+    SerpHandler.pages_served = []
+    server = HTTPServer(('127.0.0.1', 0), SerpHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def make_crawler(server):
+    crawler = NaverNewsCrawler()
+    crawler.base_url = f"http://127.0.0.1:{server.server_port}/search.naver"
+    crawler.use_parse_pipeline(None)
+    return crawler
+
+def test_crawl_iter_yields_validated_records_in_page_order():
+    server = start_server()
+    try:
+        crawler = make_crawler(server)
+        records = list(crawler.crawl_iter("양자컴퓨터", max_pages=3))
+        collected = crawler.crawl("양자컴퓨터", max_pages=3)
+    finally:
+        server.shutdown()
+    
+    assert len(records) == 30
+    assert set(records[0].keys()) == {'title', 'link', 'source', 'date', 'content'}
+    assert records[0].query == '양자컴퓨터'
+    assert records[0]['title'].endswith(' 0') and records[-1]['title'].endswith(' 29')
+    assert [r.link for r in collected] == [r.link for r in records]
+    assert crawler.get_results_count() == 30
+
+def test_closing_crawl_iter_early_stops_the_crawl():
+    server = start_server()
+    try:
+        crawler = make_crawler(server)
+        records = crawler.crawl_iter("양자컴퓨터", max_pages=5)
+        first = next(records)
+        records.close()
+        
+        # At the default 2 req/s with a burst of 2, pages 3-5 would be sent by now
+        time.sleep(1.6)
+    finally:
+        server.shutdown()
+    
+    assert first['title'].endswith(' 0')
+    assert sorted(SerpHandler.pages_served) in ([1], [1, 2])
+
+if __name__ == "__main__":
+    test_crawl_iter_yields_validated_records_in_page_order()
+    test_closing_crawl_iter_early_stops_the_crawl()
+    print("✅ All crawl_iter tests passed")
\ No newline at end of file
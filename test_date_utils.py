@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from src.utils import DateUtils
+
+NOW = datetime(2025, 5, 30, 0, 30, tzinfo=timezone.utc)
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+def test_relative_and_absolute_dates():
+    assert DateUtils.parse_many(
+        ['1시간 전', '3일 전', '5분 전', '2 hours ago', '2025.05.01.', '25.5.1', '', '어제'], NOW
+    ) == [utc(2025, 5, 29, 23, 30), utc(2025, 5, 27, 0, 30), utc(2025, 5, 30, 0, 25),
+          utc(2025, 5, 29, 22, 30), utc(2025, 4, 30, 15), utc(2025, 4, 30, 15), NOW, NOW]
+    
+    # Exported days are Korean calendar days
+    assert DateUtils.parse_relative_date('1시간 전', NOW) == '2025.05.30.'
+    assert DateUtils.parse_relative_date('2025.05.01.', NOW) == '2025.05.01.'
+
+def test_rss_dates():
+    assert DateUtils.parse_many([
+        'Fri, 30 May 2025 10:30:00 GMT',
+        'Fri, 30 May 2025 10:30:00 +0900',
+        '2025-05-30T10:30:00.123Z',
+        '30 Feb 2025 10:30:00 GMT',
+    ], NOW, rss=True) == [utc(2025, 5, 30, 10, 30), utc(2025, 5, 30, 1, 30),
+                          utc(2025, 5, 30, 10, 30, 0, 123000), NOW]
+    
+    assert DateUtils.parse_rss_date('Fri, 30 May 2025 20:30:00 GMT') == '2025.05.31.'
+
+if __name__ == "__main__":
+    test_relative_and_absolute_dates()
+    test_rss_dates()
+    print("✅ All date utils tests passed")
\ No newline at end of file
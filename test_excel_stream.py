@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from openpyxl import load_workbook
+
+from src.config import Config
+from src.models import Article
+from src.utils import FileUtils
+
+def articles(count):
+    for i in range(count):
+        yield Article(f'기사 {i}', f'https://www.yna.co.kr/view/{i}', '연합뉴스', 1748601000.0 + i, f'내용 {i}\x0b', '양자')
+
+def test_stream_rolls_over_sheets_and_files():
+    with tempfile.TemporaryDirectory() as result_dir:
+        paths = FileUtils.save_to_excel_stream(articles(9), '양자', Path(result_dir), max_rows=3, sheets_per_file=2)
+        workbooks = [load_workbook(path, read_only=True) for path in paths]
+        sheets = [[list(row) for row in sheet.iter_rows(values_only=True)]
+                  for workbook in workbooks for sheet in workbook.worksheets]
+        sheet_counts = [len(workbook.worksheets) for workbook in workbooks]
+        for workbook in workbooks:
+            workbook.close()
+    
+    # 2 records per sheet below the header, 2 sheets per file
+    assert [path.endswith(suffix) for path, suffix in zip(paths, [' 양자.xlsx', ' 양자 (2).xlsx', ' 양자 (3).xlsx'])] == [True] * 3
+    assert sheet_counts == [2, 2, 1]
+    assert all(sheet[0] == Config.EXCEL_COLUMNS for sheet in sheets)
+    titles = [row[0] for sheet in sheets for row in sheet[1:]]
+    assert titles == [f'기사 {i}' for i in range(9)]
+
+def test_stream_matches_excel_columns():
+    records = [article.to_dict() for article in articles(2)]
+    with tempfile.TemporaryDirectory() as result_dir:
+        [path] = FileUtils.save(records, '양자', Path(result_dir), 'xlsx-stream')
+        workbook = load_workbook(path, read_only=True)
+        rows = [list(row) for row in workbook.active.iter_rows(values_only=True)]
+        workbook.close()
+    
+    assert rows[0] == Config.EXCEL_COLUMNS
+    row = dict(zip(rows[0], rows[1]))
+    assert row['title'] == '기사 0' and row['source'] == '연합뉴스' and row['date'] == records[0]['date']
+    # Control characters openpyxl cannot store are stripped instead of failing the export
+    assert row['content'] == '내용 0'
+
+def test_stream_rejects_empty_input():
+    with tempfile.TemporaryDirectory() as result_dir:
+        try:
+            FileUtils.save_to_excel_stream(iter(()), '양자', Path(result_dir))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError for no records")
+
+def test_stream_keeps_written_rows_when_records_raise():
+    def failing_records():
+        yield from articles(3)
+        raise ConnectionError("crawl interrupted")
+    
+    with tempfile.TemporaryDirectory() as result_dir:
+        try:
+            FileUtils.save_to_excel_stream(failing_records(), '양자', Path(result_dir))
+        except ConnectionError:
+            pass
+        else:
+            raise AssertionError("expected the records error to propagate")
+        
+        [path] = Path(result_dir).glob('*.xlsx')
+        workbook = load_workbook(path, read_only=True)
+        rows = [list(row) for row in workbook.active.iter_rows(values_only=True)]
+        workbook.close()
+    
+    assert rows[0] == Config.EXCEL_COLUMNS
+    assert [row[0] for row in rows[1:]] == ['기사 0', '기사 1', '기사 2']
+
+if __name__ == "__main__":
+    test_stream_rolls_over_sheets_and_files()
+    test_stream_matches_excel_columns()
+    test_stream_rejects_empty_input()
+    test_stream_keeps_written_rows_when_records_raise()
+    print("✅ All streaming Excel tests passed")
\ No newline at end of file
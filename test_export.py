@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+import pytest
+
+from src.models import Article, ArticleBatch
+from src.utils import FileUtils
+
+
+ARTICLES = [
+    Article('첫 번째 기사', 'https://www.yna.co.kr/view/1', '연합뉴스', 1748601000.0, '내용 1', '양자컴퓨터'),
+    Article('Second story', 'https://www.reuters.com/2', 'Reuters', None, 'content 2', '양자컴퓨터', 7),
+]
+
+def test_parquet_round_trip_keeps_types():
+    pq = pytest.importorskip('pyarrow.parquet')
+    
+    with tempfile.TemporaryDirectory() as result_dir:
+        path = FileUtils.save_to_parquet(ArticleBatch(ARTICLES), '양자컴퓨터', Path(result_dir))
+        table = pq.read_table(path)
+        df = FileUtils.load_from_parquet(path)
+    
+    assert path.endswith(' 양자컴퓨터.parquet')
+    assert str(table.schema.field('published').type) == 'timestamp[us, tz=UTC]'
+    assert str(table.schema.field('source').type) == 'dictionary<values=string, indices=int32, ordered=0>'
+    assert str(df['source'].dtype) == 'category'
+    
+    batch = ArticleBatch.from_arrow(table)
+    assert list(batch) == ARTICLES
+    assert batch.cluster_ids == [None, 7]
+
+def test_save_selects_formats():
+    with tempfile.TemporaryDirectory() as result_dir:
+        paths = FileUtils.save(ArticleBatch(ARTICLES), 'q', Path(result_dir), 'xlsx')
+        assert [Path(path).suffix for path in paths] == ['.xlsx']
+        assert list(FileUtils.load_from_excel(paths[0])['title']) == ['첫 번째 기사', 'Second story']
+        
+        try:
+            FileUtils.save(ArticleBatch(ARTICLES), 'q', Path(result_dir), 'csv')
+        except ValueError as e:
+            assert 'csv' in str(e)
+        else:
+            raise AssertionError("unknown format accepted")
+
+if __name__ == "__main__":
+    test_parquet_round_trip_keeps_types()
+    test_save_selects_formats()
+    print("✅ All export tests passed")
\ No newline at end of file
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from fixtures import ETAG, LAST_MODIFIED, FeedHandler, make_crawler, start_server
+
+def test_second_fetch_is_conditional_and_skips_parsing():
+    server = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            crawler = make_crawler(server, cache_dir)
+            parse_calls = []
+            parse_rss_feed = crawler.parse_rss_feed
+            crawler.parse_rss_feed = lambda *args: parse_calls.append(1) or parse_rss_feed(*args)
+            
+            first = crawler.crawl_rss("test")
+            second = crawler.crawl_rss("test")
+            crawler.feed_cache.close()
+        
+        assert len(first) == 2
+        assert second == first
+        assert len(parse_calls) == 1
+        assert 'If-None-Match' not in FeedHandler.requests_seen[0]
+        assert FeedHandler.requests_seen[1]['If-None-Match'] == ETAG
+        assert FeedHandler.requests_seen[1]['If-Modified-Since'] == LAST_MODIFIED
+        assert crawler.feed_cache.stats() == {'hits': 1, 'misses': 1}
+    finally:
+        server.shutdown()
+
+def test_cache_persists_across_crawlers():
+    server = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            make_crawler(server, cache_dir).crawl_rss("test")
+            crawler = make_crawler(server, cache_dir)
+            results = crawler.crawl_rss("test")
+            crawler.feed_cache.close()
+        
+        assert [r['title'] for r in results] == ['First story', 'Second story']
+        assert crawler.feed_cache.stats()['hits'] == 1
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    test_second_fetch_is_conditional_and_skips_parsing()
+    test_cache_persists_across_crawlers()
+    print("✅ All feed cache tests passed")
\ No newline at end of file
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+import asyncio
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from src.config import Config
+from src.crawlers import NaverNewsCrawler
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Answers after a short delay and records how many requests overlapped"""
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(0.1)
+        with cls.lock:
+            cls.in_flight -= 1
+        
+        body = self.path.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+def start_server():
+    SlowHandler.in_flight = SlowHandler.max_in_flight = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    # Keep pacing out of the way so only the concurrency limits bound the requests
+    Config.HOST_RATE_LIMITS[f'127.0.0.1:{server.server_port}'] = (1000.0, 1000, 1000.0)
+    return server
+
+def stop_server(server):
+    Config.HOST_RATE_LIMITS.pop(f'127.0.0.1:{server.server_port}', None)
+    server.shutdown()
+    server.server_close()
+
+def test_per_host_limit_bounds_concurrency():
+    server = start_server()
+    urls = [f"http://127.0.0.1:{server.server_port}/{i}" for i in range(8)]
+    try:
+        with NaverNewsCrawler() as crawler:
+            responses = crawler.fetch_many(urls, per_host_limit=2)
+    finally:
+        stop_server(server)
+    
+    assert [response.text for response in responses] == [f"/{i}" for i in range(8)]
+    assert SlowHandler.max_in_flight == 2
+
+def test_call_limits_apply_after_loop_limits_exist():
+    server = start_server()
+    urls = [f"http://127.0.0.1:{server.server_port}/{i}" for i in range(8)]
+    
+    async def fetch_twice(crawler):
+        await crawler.fetch_many_async(urls)
+        shared_peak = SlowHandler.max_in_flight
+        SlowHandler.max_in_flight = 0
+        await crawler.fetch_many_async(urls, per_host_limit=1)
+        return shared_peak, SlowHandler.max_in_flight
+    
+    try:
+        with NaverNewsCrawler() as crawler:
+            shared_peak, call_peak = asyncio.run(fetch_twice(crawler))
+    finally:
+        stop_server(server)
+    
+    assert shared_peak == Config.ASYNC_PER_HOST_LIMIT
+    assert call_peak == 1
+
+def test_close_shuts_down_fetch_threads():
+    server = start_server()
+    try:
+        crawler = NaverNewsCrawler()
+        crawler.fetch_many([f"http://127.0.0.1:{server.server_port}/0"], max_concurrency=32)
+        executor = crawler._executor
+        assert crawler._executor_workers == 32
+        crawler.close()
+    finally:
+        stop_server(server)
+    
+    assert crawler._executor is None
+    assert executor._shutdown
+
+if __name__ == "__main__":
+    test_per_host_limit_bounds_concurrency()
+    test_call_limits_apply_after_loop_limits_exist()
+    test_close_shuts_down_fetch_threads()
+    print("✅ All async fetch tests passed")
\ No newline at end of file
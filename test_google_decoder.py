@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from fixtures import RECORDED_IDS
+from src.utils import GoogleNewsDecoder
+
+OPAQUE_ID = 'CBMiPEFVX3lxTFB4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eA'
+
+def test_decode_recorded_ids():
+    for article_id, expected in RECORDED_IDS.items():
+        assert GoogleNewsDecoder.decode_article_id(article_id) == expected
+
+def test_decode_rss_and_read_links():
+    article_id, expected = next(iter(RECORDED_IDS.items()))
+    for url in (
+        f"https://news.google.com/rss/articles/{article_id}?oc=5",
+        f"https://news.google.com/articles/{article_id}",
+        f"https://news.google.com/read/{article_id}?hl=ko&gl=KR",
+    ):
+        assert GoogleNewsDecoder.decode(url) == expected
+
+def test_opaque_id_needs_network():
+    assert GoogleNewsDecoder.decode(f"https://news.google.com/rss/articles/{OPAQUE_ID}") is None
+
+def test_invalid_input():
+    assert GoogleNewsDecoder.decode("") is None
+    assert GoogleNewsDecoder.decode("https://www.example.com/articles/abc") is None
+    assert GoogleNewsDecoder.decode_article_id("!!not-base64!!") is None
+    assert GoogleNewsDecoder.decode_article_id("CBMi") is None
+
+if __name__ == "__main__":
+    test_decode_recorded_ids()
+    test_decode_rss_and_read_links()
+    test_opaque_id_needs_network()
+    test_invalid_input()
+    print("✅ All decoder tests passed")
\ No newline at end of file
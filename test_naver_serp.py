@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from bs4 import BeautifulSoup
+
+from src.crawlers import NaverNewsCrawler
+from src.parsers import NaverSerpParser, build_naver_records
+
+# Items in three layouts; the second has a stray ".info" outside its info_group
+MIXED_ITEMS = [
+    '<div class="news_area"><a class="tit" href="https://www.kbs.co.kr/1">구형 레이아웃 기사</a>'
+    '<span class="cp">KBS</span><span class="info">2025.05.28.</span>'
+    '<div class="dsc">구형 요약</div></div>',
+    '<div class="news_area"><span class="info">광고</span>'
+    '<a class="press">연합뉴스</a><div class="info_group"><span class="info">2025.05.29.</span></div>'
+    '<a class="news_tit" href="https://www.yna.co.kr/2">현재 레이아웃 기사</a>'
+    '<div class="news_dsc">현재 요약</div></div>',
+    '<div class="news_area"><div class="tit"><a href="https://www.mk.co.kr/3">링크만 있는 기사</a></div>'
+    '<span class="date">2025.05.30.</span><div class="api_txt_lines">요약 3</div></div>',
+]
+
+def make_page(items):
+    return (
+        '<html><body><div id="header"><span class="info">헤더</span></div>'
+        f'<div class="group_news"><ul class="list_news">{"".join(items)}</ul></div></body></html>'
+    )
+
+def records(articles):
+    return [article.to_dict() for article in articles]
+
+def test_fast_parser_matches_default_on_mixed_layouts():
+    page = make_page(MIXED_ITEMS)
+    default = records(NaverNewsCrawler(fast_parse=False).parse_search_results(page))
+    fast = records(NaverNewsCrawler(fast_parse=True).parse_search_results(page))
+    
+    assert fast == default
+    assert [record['source'] for record in fast] == ['KBS', '연합뉴스', '']
+    assert [record['date'][:10] for record in fast] == ['2025.05.28', '2025.05.29', '2025.05.30']
+    assert [record['link'] for record in fast][2] == 'https://www.mk.co.kr/3'
+
+def test_output_does_not_depend_on_earlier_pages():
+    current_layout = make_page([MIXED_ITEMS[1]])
+    fresh = records(NaverSerpParser().parse(current_layout))
+    
+    parser = NaverSerpParser()
+    parser.parse(make_page([MIXED_ITEMS[0]] * 3))
+    assert records(parser.parse(current_layout)) == fresh
+    assert fresh[0]['date'].startswith('2025.05.29')
+    assert records(NaverNewsCrawler(fast_parse=False).parse_search_results(current_layout)) == fresh
+
+def test_one_bad_row_does_not_drop_the_page():
+    class BrokenElement:
+        def get(self, key, default=None):
+            return 'https://www.kbs.co.kr/broken'
+        
+        def get_text(self):
+            raise ValueError("unreadable element")
+    
+    soup = BeautifulSoup(make_page(MIXED_ITEMS), 'lxml')
+    parser = NaverNewsCrawler(fast_parse=False)
+    rows = [parser.extract_article_elements(item) for item in soup.select('div.news_area')]
+    rows.insert(1, (BrokenElement(), None, None, None))
+    
+    assert [record.link for record in build_naver_records(rows)] == \
+        ['https://www.kbs.co.kr/1', 'https://www.yna.co.kr/2', 'https://www.mk.co.kr/3']
+
+if __name__ == "__main__":
+    test_fast_parser_matches_default_on_mixed_layouts()
+    test_output_does_not_depend_on_earlier_pages()
+    test_one_bad_row_does_not_drop_the_page()
+    print("✅ All Naver SERP parser tests passed")
\ No newline at end of file
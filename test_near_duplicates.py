@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+import pickle
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from src.models import Article, ArticleBatch
+from src.utils import NearDuplicateIndex
+
+WIRE = '삼성전자가 양자컴퓨터 상용화를 위한 연구에 본격 착수했다고 15일 밝혔다.'
+
+GOOGLE = [
+    Article('삼성전자, 양자컴퓨터 상용화 본격 착수', 'https://www.yna.co.kr/view/1', '연합뉴스', 1.0, WIRE),
+    Article('Google unveils new quantum chip Willow', 'https://www.reuters.com/1', 'Reuters', 2.0,
+            'Google on Monday unveiled Willow, a quantum computing chip it says'),
+]
+NAVER = [
+    Article('[속보] 삼성전자, 양자컴퓨터 상용화 착수', 'https://news.kbs.co.kr/1', 'KBS', 3.0, WIRE),
+    Article("Google unveils new quantum chip 'Willow'", 'https://www.cnbc.com/1', 'CNBC', 4.0,
+            'Google on Monday unveiled Willow, a new quantum computing chip that it says'),
+    Article('IBM, 양자컴퓨터 신형 칩 공개', 'https://www.mk.co.kr/1', '매일경제', 5.0,
+            'IBM이 새로운 양자컴퓨터 칩을 공개하며 경쟁에 나섰다고 밝혔다.'),
+    Article('삼성전자 양자컴퓨터 상용화 본격 착수…2030년 목표', 'https://www.hankyung.com/1', '한국경제', 6.0,
+            WIRE + ' 회사는 2030년 상용화를 목표로 한다.'),
+]
+
+def test_same_story_gets_one_cluster_across_sources():
+    index = NearDuplicateIndex()
+    index.assign(GOOGLE)
+    index.assign(NAVER)
+    
+    ids = [article.cluster_id for article in GOOGLE + NAVER]
+    assert ids[0] == ids[2] == ids[5]
+    assert ids[1] == ids[3]
+    assert len({ids[0], ids[1], ids[4]}) == 3
+    assert index.cluster_count == 3
+
+def test_representatives_keep_first_copy_of_each_story():
+    index = NearDuplicateIndex()
+    google = index.representatives(GOOGLE)
+    naver = index.representatives(NAVER)
+    
+    assert google == GOOGLE
+    assert [article.source for article in naver] == ['매일경제']
+
+def test_cluster_ids_survive_batches_and_pickling():
+    articles = NearDuplicateIndex().assign(GOOGLE + NAVER)
+    batch = ArticleBatch(articles)
+    
+    assert batch.columns()['cluster_id'] == [article.cluster_id for article in articles]
+    assert pickle.loads(pickle.dumps(batch[2])).cluster_id == articles[2].cluster_id
+    assert 'cluster_id' not in ArticleBatch([Article('t', 'l')]).columns()
+
+if __name__ == "__main__":
+    test_same_story_gets_one_cluster_across_sources()
+    test_representatives_keep_first_copy_of_each_story()
+    test_cluster_ids_survive_batches_and_pickling()
+    print("✅ All near-duplicate tests passed")
\ No newline at end of file
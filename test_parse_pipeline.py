@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from fixtures import make_google_feed, make_naver_page
+from src.parsers import NaverSerpParser, ParsePipeline, parse_google_search_html
+from src.parsers.google_rss import parse_rss_feed
+
+GOOGLE_HTML = """<html><body>
+<div class="SoaBEf"><a href="/url?q=x&url=https%3A%2F%2Fwww.yna.co.kr%2Fview%2FAKR1&sa=U">
+<div class="MBeuO">양자컴퓨터 상용화</div></a>
+<div class="CEMjEf"><span>연합뉴스 · 2 hours ago</span></div>
+<div class="OSrXXb"><span>2 hours ago</span></div><div class="GI74Re">요약</div></div>
+<div class="SoaBEf"><a href="https://news.kbs.co.kr/news/view.do?ncd=2"><h3>Second</h3></a></div>
+</body></html>"""
+
+def test_google_html_parser():
+    results = parse_google_search_html(GOOGLE_HTML)
+    
+    assert [r['link'] for r in results] == [
+        'https://www.yna.co.kr/view/AKR1', 'https://news.kbs.co.kr/news/view.do?ncd=2'
+    ]
+    assert [r['source'] for r in results] == ['연합뉴스', 'news.kbs.co.kr']
+    assert results[0]['title'] == '양자컴퓨터 상용화'
+    assert results[0]['content'] == '요약'
+
+def test_pipeline_matches_inline_parsing():
+    pages = [make_naver_page(page) for page in range(1, 5)]
+    feed = make_google_feed(30)
+    
+    with ParsePipeline(workers=2, max_pending=2) as pipeline:
+        # Relative dates ("3시간 전") are anchored at parse time, so compare the exported fields
+        assert [[r.to_dict() for r in page] for page in pipeline.map('naver_serp', pages)] == \
+            [[r.to_dict() for r in NaverSerpParser().parse(page)] for page in pages]
+        assert pipeline.parse('google_rss', feed, max_results=10) == parse_rss_feed(feed, 10)
+        assert [r.to_dict() for r in pipeline.parse('google_html', GOOGLE_HTML)] == \
+            [r.to_dict() for r in parse_google_search_html(GOOGLE_HTML)]
+
+def test_submissions_block_when_pipeline_is_full():
+    pages = [make_naver_page(page) for page in range(1, 9)]
+    
+    with ParsePipeline(workers=1, max_pending=2) as pipeline:
+        seen = []
+        futures = []
+        for page in pages:
+            futures.append(pipeline.submit('naver_serp', page))
+            seen.append(pipeline.pending)
+        results = [future.result() for future in futures]
+    
+    assert max(seen) <= 2
+    assert all(len(page_results) == 10 for page_results in results)
+
+if __name__ == "__main__":
+    test_google_html_parser()
+    test_pipeline_matches_inline_parsing()
+    test_submissions_block_when_pipeline_is_full()
+    print("✅ All parse pipeline tests passed")
\ No newline at end of file
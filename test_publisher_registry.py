@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from src.crawlers import GoogleNewsCrawler
+from src.models import Article
+from src.utils import PublisherRegistry, TextUtils
+
+LINKS = {
+    'https://www.yna.co.kr/view/AKR20250101000100017': '연합뉴스',
+    'https://biz.chosun.com/it-science/2025/01/01/X/': '조선비즈',
+    'https://www.chosun.com/economy/2025/01/01/X/': '조선일보',
+    'https://news.kbs.co.kr/news/view.do?ncd=1': 'KBS',
+    'https://imnews.imbc.com/news/2025/econo/article/1.html': 'MBC',
+    'http://www.hani.co.kr/arti/economy/1.html': '한겨레',
+    'https://www.reuters.com/technology/x/': 'Reuters',
+    'https://www.bbc.co.uk/news/technology-1': 'BBC',
+    'https://edition.cnn.com/2025/01/01/tech/x': 'CNN',
+    'https://user@www.mk.co.kr:443/news/1?utm=x': '매일경제',
+    'https://blog.example.co.uk/post': 'example',
+    'https://unknown-outlet.com/a': 'unknown-outlet',
+    '': '',
+}
+
+def test_publisher_for_url():
+    registry = PublisherRegistry()
+    for link, publisher in LINKS.items():
+        assert registry.publisher_for_url(link) == publisher, link
+    assert registry.publishers_for_urls(LINKS) == list(LINKS.values())
+
+def test_registrable_domain_uses_public_suffixes():
+    registry = PublisherRegistry(['kr', 'co.kr', 'jp', '*.kobe.jp', '!city.kobe.jp'])
+    assert registry.registrable_domain('news.yna.co.kr') == 'yna.co.kr'
+    assert registry.registrable_domain('news1.kr') == 'news1.kr'
+    assert registry.registrable_domain('a.b.shop.kobe.jp') == 'b.shop.kobe.jp'
+    assert registry.registrable_domain('www.city.kobe.jp') == 'city.kobe.jp'
+    assert registry.registrable_domain('co.kr') == 'co.kr'
+
+def test_source_names_are_canonical():
+    assert TextUtils.extract_domain_from_url('https://www.yna.co.kr/view/1') == 'yna'
+    assert TextUtils.extract_domain_from_url('https://www.bbc.co.uk/news') == 'bbc'
+    assert TextUtils.normalize_source_name(' Yonhap News ') == '연합뉴스'
+    assert TextUtils.normalize_source_name('CHOSUN') == '조선일보'
+    assert TextUtils.normalize_source_name('the new york times') == 'The New York Times'
+    assert TextUtils.normalize_source_name('동네신문') == '동네신문'
+
+def test_google_sources_are_canonical():
+    crawler = GoogleNewsCrawler()
+    crawler.resolve_links = lambda links: links
+    results = crawler.resolve_results([
+        Article('기사 1', 'https://www.yna.co.kr/view/1', source='Yonhap News'),
+        Article('기사 2', 'https://www.chosun.com/economy/1', source=''),
+        Article('기사 3', 'https://unknown-outlet.com/a', source='동네신문'),
+    ])
+    crawler.close()
+    assert [result.source for result in results] == ['연합뉴스', '조선일보', '동네신문']
+
+if __name__ == "__main__":
+    test_publisher_for_url()
+    test_registrable_domain_uses_public_suffixes()
+    test_source_names_are_canonical()
+    test_google_sources_are_canonical()
+    print("✅ All publisher registry tests passed")
\ No newline at end of file
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from src.config import Config
+from src.network import AdaptiveRateController
+
+def test_healthy_responses_increase_rate_additively():
+    controller = AdaptiveRateController('example.com', initial_rate=1.0, max_rate=5.0)
+    for _ in range(10):
+        controller.observe(200, 0.1)
+    assert abs(controller.rate - (1.0 + 10 * Config.AIMD_INCREASE)) < 1e-9
+
+def test_throttling_and_failures_decrease_rate_multiplicatively():
+    for status_code in (429, 503, None):
+        controller = AdaptiveRateController('example.com', initial_rate=4.0, max_rate=5.0)
+        controller.observe(status_code, 0.1)
+        assert controller.rate == 4.0 * Config.AIMD_DECREASE_FACTOR, status_code
+        assert controller.metrics()['decreases'] == 1
+        
+        # A burst of failures from requests already in flight counts once per interval
+        controller.observe(status_code, 0.1)
+        assert controller.rate == 4.0 * Config.AIMD_DECREASE_FACTOR
+    
+    controller = AdaptiveRateController('example.com', initial_rate=1.0, min_rate=0.5)
+    controller.last_decrease = -1e9
+    for _ in range(5):
+        controller._decrease()
+        controller.last_decrease = -1e9
+    assert controller.rate == 0.5
+
+def test_rate_is_capped_at_the_host_maximum():
+    controller = AdaptiveRateController('search.naver.com')
+    assert controller.max_rate == Config.NAVER_REQUESTS_PER_SECOND
+    for _ in range(50):
+        controller.observe(200, 0.1)
+    assert controller.rate == Config.NAVER_REQUESTS_PER_SECOND
+    
+    rate, _, max_rate = Config.HOST_RATE_LIMITS['news.google.com']
+    controller = AdaptiveRateController('news.google.com')
+    assert controller.rate == rate
+    for _ in range(200):
+        controller.observe(200, 0.1)
+    assert controller.rate == max_rate
+    
+    assert AdaptiveRateController('unlisted.example.com').max_rate == Config.DEFAULT_REQUESTS_PER_SECOND
+
+if __name__ == "__main__":
+    test_healthy_responses_increase_rate_additively()
+    test_throttling_and_failures_decrease_rate_multiplicatively()
+    test_rate_is_capped_at_the_host_maximum()
+    print("✅ All rate limit tests passed")
\ No newline at end of file
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from src.network import RedirectCache
+
+def article(i):
+    return f"https://news.google.com/rss/articles/CBMi{i:04d}"
+
+def publisher(i):
+    return f"https://www.yna.co.kr/view/AKR{i:04d}"
+
+def test_hits_misses_and_persistence():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = Path(cache_dir) / 'redirects.sqlite3'
+        cache = RedirectCache(path)
+        cache.set(article(1), publisher(1))
+        assert cache.get(article(1)) == publisher(1)
+        assert cache.get(article(2)) is None
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'size': 1}
+        cache.close()
+        
+        cache = RedirectCache(path)
+        assert len(cache) == 1
+        assert cache.get(article(1)) == publisher(1)
+        cache.close()
+
+def test_entries_expire_after_ttl():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = RedirectCache(Path(cache_dir) / 'redirects.sqlite3', ttl=0.05)
+        cache.set(article(1), publisher(1))
+        cache.set(article(2), publisher(2))
+        time.sleep(0.1)
+        
+        assert cache.get(article(1)) is None
+        assert len(cache) == 1
+        assert cache.purge_expired() == 1
+        assert len(cache) == 0
+        cache.close()
+
+def test_least_recently_used_entries_are_evicted():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = RedirectCache(Path(cache_dir) / 'redirects.sqlite3', max_entries=10)
+        for i in range(10):
+            cache.set(article(i), publisher(i))
+            time.sleep(0.001)
+        
+        # Touch the two oldest entries, so 2 and 3 are now least recently used
+        cache.get(article(0))
+        cache.get(article(1))
+        cache.set(article(10), publisher(10))
+        
+        assert len(cache) == 9
+        assert [i for i in range(11) if cache.get(article(i)) is None] == [2, 3]
+        cache.close()
+
+def test_hits_write_access_times_in_batches():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = RedirectCache(Path(cache_dir) / 'redirects.sqlite3')
+        cache.set(article(1), publisher(1))
+        
+        changes = cache._conn.total_changes
+        for _ in range(cache.FLUSH_EVERY - 1):
+            assert cache.get(article(1)) == publisher(1)
+        assert cache._conn.total_changes == changes
+        
+        cache.flush()
+        assert cache._conn.total_changes == changes + 1
+        cache.close()
+
+if __name__ == "__main__":
+    test_hits_misses_and_persistence()
+    test_entries_expire_after_ttl()
+    test_least_recently_used_entries_are_evicted()
+    test_hits_write_access_times_in_batches()
+    print("✅ All redirect cache tests passed")
\ No newline at end of file
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+import sys
+import threading
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from fixtures import RECORDED_IDS
+from src.crawlers import GoogleNewsCrawler
+
+# Ids that do not embed the publisher URL, so each one needs a request
+OPAQUE = 'https://news.google.com/rss/articles/CBMiPEFVX3lxTFB{:03d}?oc=5'
+
+def make_crawler(delays):
+    """Crawler whose redirect lookups take ``delays[link]`` seconds instead of a request"""
+    crawler = GoogleNewsCrawler()
+    lock = threading.Lock()
+    crawler.active = crawler.peak = 0
+    
+    def extract_real_url(link, timeout=None):
+        with lock:
+            crawler.active += 1
+            crawler.peak = max(crawler.peak, crawler.active)
+        time.sleep(delays.get(link, 0.1))
+        with lock:
+            crawler.active -= 1
+        return link.replace('news.google.com/rss/articles', 'www.yna.co.kr/view')
+    
+    crawler.extract_real_url = extract_real_url
+    return crawler
+
+def test_links_resolve_concurrently_in_input_order():
+    links = [OPAQUE.format(i) for i in range(8)]
+    crawler = make_crawler({})
+    
+    start = time.perf_counter()
+    resolved = crawler.resolve_links(links, timeout=1, max_workers=8)
+    elapsed = time.perf_counter() - start
+    crawler.close()
+    
+    assert resolved == [link.replace('news.google.com/rss/articles', 'www.yna.co.kr/view') for link in links]
+    assert crawler.peak == 8
+    assert elapsed < 0.5
+
+def test_slow_links_keep_their_original_url():
+    links = [OPAQUE.format(i) for i in range(3)]
+    crawler = make_crawler({links[1]: 2.0})
+    
+    start = time.perf_counter()
+    resolved = crawler.resolve_links(links, timeout=0.2, max_workers=4)
+    elapsed = time.perf_counter() - start
+    crawler.close()
+    
+    # One wave of lookups plus one timeout of grace
+    assert elapsed < 1.0
+    assert resolved[1] == links[1]
+    assert resolved[0] != links[0] and resolved[2] != links[2]
+
+def test_links_that_decode_offline_skip_the_pool():
+    article_id, publisher_url = next(iter(RECORDED_IDS.items()))
+    links = [f'https://news.google.com/rss/articles/{article_id}?oc=5', 'https://www.kbs.co.kr/1']
+    crawler = make_crawler({})
+    assert crawler.resolve_links(links) == [publisher_url, 'https://www.kbs.co.kr/1']
+    assert crawler.peak == 0
+    crawler.close()
+
+if __name__ == "__main__":
+    test_links_resolve_concurrently_in_input_order()
+    test_slow_links_keep_their_original_url()
+    test_links_that_decode_offline_skip_the_pool()
+    print("✅ All link resolution tests passed")
\ No newline at end of file
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+import sys
+import time
+from email.utils import formatdate
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+import requests
+
+from src.crawlers import GoogleNewsCrawler
+from src.network import RetryBudget, RetryPolicy
+
+def make_response(status_code, retry_after=None):
+    response = requests.Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return response
+
+def test_parse_retry_after():
+    assert RetryPolicy.parse_retry_after('120') == 120.0
+    assert RetryPolicy.parse_retry_after(' 7 ') == 7.0
+    assert 25 < RetryPolicy.parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+    assert RetryPolicy.parse_retry_after(formatdate(time.time() - 600, usegmt=True)) == 0.0
+    for value in (None, '', 'soon', '-5', '1.5'):
+        assert RetryPolicy.parse_retry_after(value) is None, value
+
+def test_backoff_stays_within_jitter_bounds():
+    policy = RetryPolicy(base_delay=2, max_delay=30, jitter=0.5)
+    for _ in range(200):
+        assert 1.0 <= policy.get_delay(0) <= 3.0
+        assert 4.0 <= policy.get_delay(2) <= 12.0
+        assert 15.0 <= policy.get_delay(10) <= 45.0
+    
+    assert RetryPolicy(base_delay=2, jitter=0).get_delay(1) == 4.0
+
+def test_retry_after_replaces_backoff_on_429_and_503():
+    policy = RetryPolicy(base_delay=2, jitter=0, max_retry_after=60)
+    assert policy.get_delay(0, make_response(429, '10')) == 10.0
+    assert policy.get_delay(0, make_response(503, '3600')) == 60.0
+    assert policy.get_delay(0, make_response(500, '10')) == 2.0
+    assert policy.get_delay(0, make_response(429, 'garbage')) == 2.0
+
+def test_budget_caps_retries_and_accounts_time():
+    budget = RetryBudget(max_retries=2)
+    assert [budget.try_spend() for _ in range(4)] == [True, True, False, False]
+    budget.record_failure(1.5)
+    budget.record_backoff(2.0)
+    
+    stats = budget.stats()
+    assert (stats['retries'], stats['exhausted']) == (2, 2)
+    assert stats['time_spent'] == 3.5
+    
+    budget.reset()
+    assert budget.stats()['retries'] == 0 and budget.try_spend()
+
+def test_each_crawl_starts_with_a_full_budget():
+    crawler = GoogleNewsCrawler()
+    while crawler.retry_budget.try_spend():
+        pass
+    
+    crawler.fetch_many = lambda urls, **kwargs: [None] * len(urls)
+    assert crawler.crawl_rss_many(['a', 'b']) == {'a': [], 'b': []}
+    assert crawler.get_retry_stats()['retries'] == 0
+
+if __name__ == "__main__":
+    test_parse_retry_after()
+    test_backoff_stays_within_jitter_bounds()
+    test_retry_after_replaces_backoff_on_429_and_503()
+    test_budget_caps_retries_and_accounts_time()
+    test_each_crawl_starts_with_a_full_budget()
+    print("✅ All retry tests passed")
\ No newline at end of file
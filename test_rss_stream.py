@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from lxml import etree
+
+from src.parsers import iter_feed_items
+from src.parsers.google_rss import build_rss_records, iter_rss_records, parse_rss_feed, parse_rss_feed_soup
+
+RSS_ITEMS = ''.join(
+    f'<item><title>양자컴퓨터 상용화 {i} - 연합뉴스</title>'
+    f'<link>https://news.google.com/rss/articles/CBMi{i}?oc=5</link>'
+    f'<pubDate>Fri, 30 May 2025 {i:02d}:30:00 GMT</pubDate>'
+    f'<description>&lt;a href="https://www.yna.co.kr/{i}"&gt;양자컴퓨터 상용화 {i}&lt;/a&gt;&amp;nbsp;'
+    f'&lt;font color="#6f6f6f"&gt;연합뉴스&lt;/font&gt;</description>'
+    f'<source url="https://www.yna.co.kr">연합뉴스</source></item>'
+    for i in range(5)
+)
+RSS = f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>feed</title>{RSS_ITEMS}</channel></rss>'
+
+ATOM = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>feed</title>
+<entry><title>Atom story - Reuters</title>
+<link rel="enclosure" href="https://www.reuters.com/image.jpg"/>
+<link href="https://www.reuters.com/world/1"/>
+<published>2025-05-30T10:30:00Z</published><summary>summary text</summary></entry>
+<entry><title type="html">Updated only</title><link rel="alternate" href="https://www.reuters.com/world/2"/>
+<updated>2025-05-30T11:00:00Z</updated><content type="html">content text</content></entry>
+</feed>"""
+
+def test_rss_items():
+    items = list(iter_feed_items(RSS))
+    assert len(items) == 5
+    assert items[0]['title'] == '양자컴퓨터 상용화 0 - 연합뉴스'
+    assert items[0]['link'] == 'https://news.google.com/rss/articles/CBMi0?oc=5'
+    assert items[0]['pubDate'] == 'Fri, 30 May 2025 00:30:00 GMT'
+    assert items[0]['description'].startswith('<a href="https://www.yna.co.kr/0">')
+    assert items[0]['source'] == '연합뉴스'
+
+def test_atom_entries_map_onto_rss_fields():
+    first, second = iter_feed_items(ATOM.encode('utf-8'))
+    assert first['link'] == 'https://www.reuters.com/world/1'
+    assert first['pubDate'] == '2025-05-30T10:30:00Z'
+    assert first['description'] == 'summary text'
+    assert second['link'] == 'https://www.reuters.com/world/2'
+    assert second['pubDate'] == '2025-05-30T11:00:00Z'
+    assert second['description'] == 'content text'
+
+def test_parsing_stops_at_max_results():
+    # Everything after the third item is cut off, so reading on would fail
+    truncated = RSS[:RSS.index('<item>', RSS.index('상용화 2'))] + '<item><title>cut'
+    
+    items = iter_feed_items(truncated)
+    assert [next(items)['title'] for _ in range(3)][-1] == '양자컴퓨터 상용화 2 - 연합뉴스'
+    items.close()
+    
+    records = parse_rss_feed(truncated, max_results=2)
+    assert [record.title for record in records] == ['양자컴퓨터 상용화 0', '양자컴퓨터 상용화 1']
+
+def test_malformed_feed_falls_back_to_soup():
+    malformed = RSS.replace('양자컴퓨터 상용화 1 - 연합뉴스', 'R&D 상용화 1 - 연합뉴스')
+    try:
+        list(iter_feed_items(malformed))
+    except etree.XMLSyntaxError:
+        pass
+    else:
+        raise AssertionError("expected XMLSyntaxError for a bare ampersand")
+    
+    records = parse_rss_feed(malformed)
+    assert len(records) == 5
+    assert records[1].link == 'https://news.google.com/rss/articles/CBMi1?oc=5'
+    assert records[2].title == '양자컴퓨터 상용화 2'
+    assert parse_rss_feed(malformed, max_results=3) == records[:3]
+
+def test_streaming_matches_soup_parser():
+    streamed = parse_rss_feed(RSS.encode('utf-8'))
+    assert streamed == parse_rss_feed_soup(RSS)
+    assert streamed[0].source == '연합뉴스'
+    assert streamed[0].link == 'https://news.google.com/rss/articles/CBMi0?oc=5'
+
+def test_every_entry_point_builds_the_same_records():
+    streamed = list(iter_rss_records(RSS, chunk_size=2))
+    assert streamed == parse_rss_feed(RSS) == build_rss_records(list(iter_feed_items(RSS)))
+    assert list(iter_rss_records(RSS, max_results=3, chunk_size=2)) == streamed[:3]
+
+def test_one_bad_item_does_not_drop_the_feed():
+    def date_parser(date_str):
+        if date_str.startswith('Fri, 30 May 2025 01'):
+            raise ValueError("bad date")
+        return None
+    
+    records = build_rss_records(list(iter_feed_items(RSS)), date_parser)
+    assert [record.title[-1] for record in records] == ['0', '2', '3', '4']
+
+if __name__ == "__main__":
+    test_rss_items()
+    test_atom_entries_map_onto_rss_fields()
+    test_parsing_stops_at_max_results()
+    test_malformed_feed_falls_back_to_soup()
+    test_streaming_matches_soup_parser()
+    test_every_entry_point_builds_the_same_records()
+    test_one_bad_item_does_not_drop_the_feed()
+    print("✅ All RSS stream tests passed")
\ No newline at end of file
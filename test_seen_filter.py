@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from src.network import SeenFilter, SeenIndex
+from src.utils import UrlUtils
+
+DAY = 24 * 3600
+
+def make_keys(prefix, count):
+    return UrlUtils.url_keys(f'https://www.yna.co.kr/view/{prefix}{i}' for i in range(count))
+
+def test_no_false_negatives_and_bounded_false_positives():
+    seen_filter = SeenFilter(capacity=20000, error_rate=0.01, generation_seconds=DAY, max_generations=3)
+    added = make_keys('A', 20000)
+    seen_filter.add_many(added)
+    
+    assert all(seen_filter.might_contain_many(added))
+    false_positives = sum(seen_filter.might_contain_many(make_keys('B', 20000)))
+    assert false_positives < 20000 * 0.02
+    assert seen_filter.stats()['bytes'] < 20000 * 1.3
+
+def test_generations_rotate_and_age_out():
+    seen_filter = SeenFilter(capacity=1000, error_rate=0.01, generation_seconds=DAY, max_generations=3)
+    old, recent = make_keys('old', 10), make_keys('new', 10)
+    seen_filter.add_many(old, now=0)
+    seen_filter.add_many(recent, now=2 * DAY)
+    assert len(seen_filter.generations) == 2
+    
+    seen_filter.add_many(make_keys('later', 10), now=3.5 * DAY)
+    assert len(seen_filter.generations) == 3
+    assert all(seen_filter.might_contain_many(old))
+    
+    seen_filter.add_many(make_keys('latest', 10), now=4.5 * DAY)
+    assert len(seen_filter.generations) == 3
+    assert not any(seen_filter.might_contain_many(old))
+    assert all(seen_filter.might_contain_many(recent))
+
+def test_keys_stay_while_the_index_holds_them():
+    # An index with a TTL of max_generations generation lengths
+    index_ttl = 3 * DAY
+    seen_filter = SeenFilter(capacity=1000, error_rate=0.01, generation_seconds=DAY, max_generations=3)
+    seen_filter.add_many(make_keys('first', 10), now=0)
+    late = make_keys('late', 10)
+    seen_filter.add_many(late, now=0.9 * DAY)
+    
+    # Still in the index just before its TTL runs out, so the filter must still report it
+    seen_filter.add_many(make_keys('other', 10), now=0.9 * DAY + index_ttl - 1)
+    assert all(seen_filter.might_contain_many(late))
+    
+    seen_filter.add_many(make_keys('other', 10), now=4 * DAY + 1)
+    assert not any(seen_filter.might_contain_many(late))
+
+def test_snapshot_restore_and_warm_from_index():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        keys = make_keys('A', 500)
+        seen_filter = SeenFilter(capacity=1000, error_rate=0.001)
+        seen_filter.add_many(keys)
+        path = seen_filter.snapshot(Path(cache_dir) / 'seen.bloom')
+        
+        restored = SeenFilter.restore(path)
+        assert restored.stats() == seen_filter.stats()
+        assert all(restored.might_contain_many(keys))
+        
+        index = SeenIndex(Path(cache_dir) / 'seen.sqlite3')
+        index.add_keys(make_keys('B', 50))
+        restored.warm(index.entries(restored.loaded_until))
+        assert all(restored.might_contain_many(make_keys('B', 50)))
+        index.close()
+
+def test_warm_resumes_from_the_newest_loaded_entry():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        index_path = Path(cache_dir) / 'seen.sqlite3'
+        index = SeenIndex(index_path)
+        index.add_keys(make_keys('A', 50))
+        seen_filter = SeenFilter(capacity=1000, error_rate=0.001)
+        seen_filter.warm(index.entries(seen_filter.loaded_until))
+        path = seen_filter.snapshot(Path(cache_dir) / 'seen.bloom')
+        
+        # Another process records keys stamped before the snapshot was written
+        first_seen = (seen_filter.loaded_until + seen_filter.saved_at) / 2
+        other = sqlite3.connect(index_path)
+        other.executemany('INSERT INTO seen (key, first_seen) VALUES (?, ?)',
+                          ((key, first_seen) for key in make_keys('B', 50)))
+        other.commit()
+        other.close()
+        
+        restored = SeenFilter.restore(path)
+        assert restored.loaded_until == seen_filter.loaded_until
+        restored.warm(index.entries(restored.loaded_until))
+        assert all(restored.might_contain_many(make_keys('B', 50)))
+        assert all(restored.might_contain_many(make_keys('A', 50)))
+        assert len(restored) == 100
+        index.close()
+
+if __name__ == "__main__":
+    test_no_false_negatives_and_bounded_false_positives()
+    test_generations_rotate_and_age_out()
+    test_keys_stay_while_the_index_holds_them()
+    test_snapshot_restore_and_warm_from_index()
+    test_warm_resumes_from_the_newest_loaded_entry()
+    print("✅ All seen filter tests passed")
\ No newline at end of file
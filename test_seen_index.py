@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from fixtures import make_crawler, start_server
+from src.config import Config
+from src.crawlers import GoogleNewsCrawler
+from src.models import Article
+from src.network import RedirectCache, SeenFilter, SeenIndex
+from src.utils import UrlUtils
+
+SAME_ARTICLE = [
+    ['https://www.yna.co.kr/view/AKR1?utm_source=google&utm_medium=rss',
+     'http://m.yna.co.kr/view/AKR1/',
+     'https://yna.co.kr/view/AKR1#comments'],
+    ['https://n.news.naver.com/article/001/0014890000',
+     'https://n.news.naver.com/mnews/article/001/0014890000?sid=105',
+     'https://news.naver.com/main/read.naver?mode=LSD&mid=sec&sid1=105&oid=001&aid=0014890000',
+     'https://m.news.naver.com/read.nhn?oid=001&aid=0014890000'],
+    ['https://news.kbs.co.kr/news/view.do?ncd=2&ref=A',
+     'https://news.kbs.co.kr/news/view.do?ref=B&ncd=2'],
+]
+
+def test_canonicalize_merges_url_variants():
+    for variants in SAME_ARTICLE:
+        canonical = {UrlUtils.canonicalize(url) for url in variants}
+        assert len(canonical) == 1, canonical
+        assert len(set(UrlUtils.url_keys(variants))) == 1
+    
+    assert UrlUtils.canonicalize(SAME_ARTICLE[1][2]) == 'https://n.news.naver.com/article/001/0014890000'
+    assert UrlUtils.canonicalize('https://news.kbs.co.kr/news/view.do?ncd=2') != \
+        UrlUtils.canonicalize('https://news.kbs.co.kr/news/view.do?ncd=3')
+    assert UrlUtils.canonicalize('') == ''
+
+def test_canonicalize_keeps_params_that_select_content():
+    assert UrlUtils.canonicalize('https://example.com/list?from=2024-01-01&feed=tech&sc=3&fbclid=x') == \
+        'https://example.com/list?feed=tech&from=2024-01-01&sc=3'
+    assert UrlUtils.canonicalize('https://www.example.com/view?ref=A&share=1&mobile=1&rss=1') == \
+        'https://example.com/view?mobile=1&ref=A&rss=1&share=1'
+    assert UrlUtils.canonicalize('https://www.hani.co.kr/arti/1.html?_fr=mt2&_ns=t1') == \
+        'https://hani.co.kr/arti/1.html'
+    assert UrlUtils.canonicalize('https://www.yna.co.kr/view/AKR1?input=1195m&section=it') == \
+        'https://yna.co.kr/view/AKR1?section=it'
+
+def test_index_persists_across_runs():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = Path(cache_dir) / 'seen.sqlite3'
+        index = SeenIndex(path)
+        assert index.add(SAME_ARTICLE[0][0])
+        assert not index.add(SAME_ARTICLE[0][1])
+        assert index.add_many(SAME_ARTICLE[1]) == 1
+        index.close()
+        
+        index = SeenIndex(path)
+        assert len(index) == 2
+        assert index.seen_many([SAME_ARTICLE[0][2], SAME_ARTICLE[1][3], SAME_ARTICLE[2][0]]) == [True, True, False]
+        index.close()
+
+def test_crawl_skips_seen_articles_before_resolving():
+    server = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            index = SeenIndex(Path(cache_dir) / 'seen.sqlite3')
+            seen_filter = SeenFilter(capacity=1000)
+            
+            first = make_crawler(server, cache_dir)
+            first.use_seen_index(index, seen_filter)
+            assert len(first.crawl("test")) == 2
+            first.commit_seen()
+            
+            second = make_crawler(server, cache_dir)
+            second.use_seen_index(index, seen_filter)
+            resolved = []
+            resolve_results = second.resolve_results
+            second.resolve_results = lambda results: resolved.extend(results) or resolve_results(results)
+            assert second.crawl("test") == []
+            assert resolved == []
+            assert len(seen_filter) == 2
+            
+            first.feed_cache.close()
+            second.feed_cache.close()
+            index.close()
+    finally:
+        server.shutdown()
+
+def test_articles_are_recorded_only_after_a_successful_save():
+    server = start_server()
+    result_dir = Config.RESULT_DIR
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            Config.RESULT_DIR = Path(cache_dir) / 'results'
+            index = SeenIndex(Path(cache_dir) / 'seen.sqlite3')
+            crawler = make_crawler(server, cache_dir)
+            crawler.use_seen_index(index, SeenFilter(capacity=1000))
+            
+            assert len(crawler.crawl("test")) == 2
+            assert len(index) == 0
+            try:
+                crawler.save_results("test", formats='bogus')
+                assert False, "an unknown format must fail the save"
+            except ValueError:
+                pass
+            assert len(index) == 0
+            
+            paths = crawler.save_results("test", formats='xlsx')
+            assert [Path(path).suffix for path in paths] == ['.xlsx']
+            assert len(index) == 2
+            
+            crawler.feed_cache.close()
+            index.close()
+    finally:
+        Config.RESULT_DIR = result_dir
+        server.shutdown()
+
+def test_opaque_google_links_are_checked_through_the_redirect_cache():
+    # An id that does not embed the publisher URL, resolved and saved in an earlier run
+    opaque = 'https://news.google.com/rss/articles/CBMiPEFVX3lxTFB4eHh4?oc=5'
+    publisher_url = 'https://www.yna.co.kr/view/AKR9'
+    
+    class Response:
+        status_code = 200
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        index = SeenIndex(Path(cache_dir) / 'seen.sqlite3')
+        index.add_keys(UrlUtils.url_keys([publisher_url]))
+        crawler = GoogleNewsCrawler()
+        crawler.redirect_cache = RedirectCache(Path(cache_dir) / 'redirects.sqlite3')
+        crawler.redirect_cache.set(opaque, publisher_url)
+        crawler.use_seen_index(index)
+        resolved = []
+        crawler.resolve_links = lambda links: resolved.extend(links) or links
+        
+        results = crawler.process_rss_response(Response(), parsed=[Article('기사 - 연합뉴스', opaque)])
+        assert results == [] and resolved == []
+        
+        crawler.redirect_cache.close()
+        index.close()
+
+if __name__ == "__main__":
+    test_canonicalize_merges_url_variants()
+    test_canonicalize_keeps_params_that_select_content()
+    test_index_persists_across_runs()
+    test_crawl_skips_seen_articles_before_resolving()
+    test_articles_are_recorded_only_after_a_successful_save()
+    test_opaque_google_links_are_checked_through_the_redirect_cache()
+    print("✅ All seen index tests passed")
\ No newline at end of file
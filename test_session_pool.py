@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from src.crawlers import GoogleNewsCrawler, NaverNewsCrawler
+from src.network import SessionRegistry, get_session_registry
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+    
+    def log_message(self, format, *args):
+        pass
+
+def test_host_settings_mount_their_own_adapter():
+    registry = SessionRegistry(pool_connections=3, pool_maxsize=5,
+                               host_settings={'news.example.com': (1, 12)})
+    session = registry.get_session()
+    
+    host_adapter = session.get_adapter('https://news.example.com/rss')
+    default_adapter = session.get_adapter('https://www.example.com/')
+    assert host_adapter is not default_adapter
+    assert host_adapter is session.get_adapter('http://news.example.com/')
+    assert (host_adapter._pool_connections, host_adapter._pool_maxsize) == (1, 12)
+    assert (default_adapter._pool_connections, default_adapter._pool_maxsize) == (3, 5)
+    
+    assert registry.get_session() is session
+    registry.close()
+
+def test_crawlers_share_one_session():
+    assert GoogleNewsCrawler().session is NaverNewsCrawler().session is get_session_registry().get_session()
+
+def test_connections_are_reused_per_host():
+    servers = [ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler) for _ in range(2)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    registry = SessionRegistry(host_settings={})
+    try:
+        session = registry.get_session()
+        for _ in range(3):
+            for server in servers:
+                assert session.get(f"http://127.0.0.1:{server.server_port}/").text == 'ok'
+        stats = registry.stats()
+    finally:
+        registry.close()
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+    
+    assert stats == {'requests': 6, 'connections_opened': 2, 'connections_reused': 4}
+
+def test_evicted_pools_keep_their_counts():
+    servers = [ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler) for _ in range(3)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    # One live pool per adapter: every new host evicts the previous one
+    registry = SessionRegistry(pool_connections=1, host_settings={})
+    try:
+        session = registry.get_session()
+        for server in servers:
+            for _ in range(2):
+                assert session.get(f"http://127.0.0.1:{server.server_port}/").text == 'ok'
+        stats = registry.stats()
+        registry.close()
+        closed_stats = registry.stats()
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+    
+    assert stats == {'requests': 6, 'connections_opened': 3, 'connections_reused': 3}
+    assert closed_stats == stats
+
+if __name__ == "__main__":
+    test_host_settings_mount_their_own_adapter()
+    test_crawlers_share_one_session()
+    test_connections_are_reused_per_host()
+    test_evicted_pools_keep_their_counts()
+    print("✅ All session pool tests passed")
\ No newline at end of file
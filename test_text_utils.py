@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from src.utils import TextUtils
+
+COLUMN = [
+    '<b>양자컴퓨터</b>\n 상용화',
+    'a \xa0 b\u200b c',
+    '&amp;lt;b&amp;gt; &quot;인용&quot;',
+    'x < y and y > z',
+    '',
+    None,
+    'null\x00byte',
+]
+
+def test_clean_many_matches_clean_html():
+    expected = [TextUtils.clean_html(text) for text in COLUMN]
+    
+    assert expected[:4] == ['양자컴퓨터 상용화', 'a b c', '<b> "인용"', 'x z']
+    assert TextUtils.clean_many(COLUMN) == expected
+    assert TextUtils.clean_many(COLUMN[:-1]) == expected[:-1]
+    assert TextUtils.clean_many([]) == []
+
+def test_column_helpers_match_per_item_functions():
+    sources = [' Yonhap News', 'KBS', '', '한겨레 ']
+    assert TextUtils.normalize_sources(sources) == [TextUtils.normalize_source_name(s) for s in sources]
+    
+    texts = ['short', 'x' * 10, '']
+    assert TextUtils.truncate_many(texts, 8) == [TextUtils.truncate_text(t, 8) for t in texts]
+
+if __name__ == "__main__":
+    test_clean_many_matches_clean_html()
+    test_column_helpers_match_per_item_functions()
+    print("✅ All text utils tests passed")
\ No newline at end of file